@@ -23,11 +23,36 @@ export default function AdminLayout({
       return
     }
 
+    // Canjear el refresh token por tokens nuevos (sin volver a pedir password)
+    const refreshTokens = async (): Promise<string | null> => {
+      const refreshToken = localStorage.getItem("refresh_token")
+      if (!refreshToken) {
+        return null
+      }
+
+      const response = await fetch(`${API_URL}/auth/refresh`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ refresh_token: refreshToken }),
+        cache: 'no-store'
+      })
+
+      if (!response.ok) {
+        localStorage.removeItem("refresh_token")
+        return null
+      }
+
+      const data = await response.json()
+      localStorage.setItem("token", data.access_token)
+      localStorage.setItem("refresh_token", data.refresh_token)
+      return data.access_token
+    }
+
     const checkAuth = async () => {
       // Esperar un momento para asegurar que localStorage está disponible
       await new Promise(resolve => setTimeout(resolve, 50))
       
-      const token = localStorage.getItem("token")
+      let token = localStorage.getItem("token") || await refreshTokens()
 
       if (!token) {
         setIsLoading(false)
@@ -37,13 +62,23 @@ export default function AdminLayout({
 
       // Validar token con el backend
       try {
-        const response = await fetch(`${API_URL}/auth/me`, {
+        const fetchMe = (accessToken: string) => fetch(`${API_URL}/auth/me`, {
           headers: {
-            "Authorization": `Bearer ${token}`
+            "Authorization": `Bearer ${accessToken}`
           },
           cache: 'no-store'
         })
 
+        let response = await fetchMe(token)
+
+        // Access token expirado: renovarlo con el refresh token
+        if (response.status === 401) {
+          token = await refreshTokens()
+          if (token) {
+            response = await fetchMe(token)
+          }
+        }
+
         if (!response.ok) {
           console.error("Token inválido o expirado")
           localStorage.removeItem("token")
@@ -38,8 +38,11 @@ export default function LoginPage() {
 
       const data = await response.json()
       
-      // Guardar token
+      // Guardar tokens (el refresh token renueva el access token sin login)
       localStorage.setItem("token", data.access_token)
+      if (data.refresh_token) {
+        localStorage.setItem("refresh_token", data.refresh_token)
+      }
       
       // Verificar que se guardó
       const savedToken = localStorage.getItem("token")
@@ -0,0 +1,214 @@
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él sólo se ofrece gzip
+    brotli = None
+
+# Tipos que vale la pena comprimir (JSON, NDJSON, CSV, HTML...)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def supported_encodings() -> List[str]:
+    """Encodings en orden de preferencia del servidor."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Elegir el encoding según Accept-Encoding (respetando q=0), o None para
+    enviar sin comprimir.
+    """
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in supported_encodings():
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    Comprimir `body`. Con `best` se usa el nivel máximo (para contenido que
+    se comprime una sola vez, como los snapshots).
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9 if best else settings.GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def weak_etag(etag: Optional[str]) -> Optional[str]:
+    """
+    ETag de la variante comprimida: mismo valor pero débil, ya que los
+    bytes difieren (RFC 9110 §8.8.1). If-None-Match compara en forma débil.
+    """
+    if etag is None or etag.startswith("W/"):
+        return etag
+    return "W/" + etag
+
+
+def vary_on_encoding(headers: MutableHeaders) -> None:
+    """Agregar Accept-Encoding a Vary si no está ya."""
+    vary = [value.strip().lower() for value in headers.get("vary", "").split(",")]
+    if "accept-encoding" not in vary and "*" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+def encoded_headers(headers: MutableHeaders, encoding: str) -> None:
+    """Ajustar los headers de una respuesta que pasa a ir comprimida."""
+    headers["Content-Encoding"] = encoding
+    vary_on_encoding(headers)
+    etag = weak_etag(headers.get("etag"))
+    if etag is not None:
+        headers["ETag"] = etag
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            # wbits 16 + MAX_WBITS: formato gzip
+            self._compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """
+    Comprimir respuestas (br / gzip) según Accept-Encoding.
+
+    - Sólo tipos de texto/JSON y cuerpos de al menos `minimum_size` bytes
+    - Las respuestas que ya traen Content-Encoding (p. ej. variantes
+      precomprimidas de la cache) pasan sin tocar
+    - Las respuestas en streaming (export) se comprimen por partes
+    - Toda respuesta de un tipo comprimible lleva `Vary: Accept-Encoding`,
+      también la que sale sin comprimir: si no, una cache intermedia puede
+      servir la variante identity a quien acepta gzip, o al revés
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Se retiene hasta ver el primer bloque del cuerpo
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            # p. ej. http.response.pathsend (FileResponse zero-copy): sin tocar
+            if not self.passthrough and self.compressor is None:
+                self.passthrough = True
+                self._add_vary(MutableHeaders(raw=self.start_message["headers"]))
+                await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if self.compressor is not None:
+            await self._send_stream_chunk(message)
+            return
+
+        await self._first_body(message)
+
+    async def _first_body(self, message: Message) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if (
+            self.encoding is None
+            or "content-encoding" in headers
+            or not is_compressible(headers.get("content-type"))
+            or (not more_body and len(body) < self.minimum_size)
+        ):
+            self.passthrough = True
+            self._add_vary(headers)
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        encoded_headers(headers, self.encoding)
+
+        if not more_body:
+            compressed = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(compressed))
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming: largo desconocido
+        del headers["Content-Length"]
+        self.compressor = _StreamCompressor(self.encoding)
+        await self._send(self.start_message)
+        await self._send_stream_chunk(message)
+
+    @staticmethod
+    def _add_vary(headers: MutableHeaders) -> None:
+        # Respuesta sin comprimir aquí: sólo si otra petición podría recibirla comprimida
+        if is_compressible(headers.get("content-type")) or "content-encoding" in headers:
+            vary_on_encoding(headers)
+
+    async def _send_stream_chunk(self, message: Message) -> None:
+        data = self.compressor.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            data += self.compressor.finish()
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
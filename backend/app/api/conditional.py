@@ -0,0 +1,88 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    """ETag fuerte a partir de los valores que identifican una representación."""
+    digest = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = ("" if part is None else str(part)).encode("utf-8")
+        digest.update(part)
+        digest.update(b"|")
+    return '"' + digest.hexdigest() + '"'
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Los timestamps se guardan con datetime.utcnow() (naive, en UTC)
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Headers ETag / Last-Modified para una respuesta."""
+    headers = {"ETag": etag}
+    last_modified = _as_utc(last_modified)
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Comparación débil (RFC 9110 §13.1.2): se ignora el prefijo W/
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluar If-None-Match / If-Modified-Since.
+
+    If-None-Match tiene prioridad; If-Modified-Since sólo se considera
+    cuando el cliente no envía ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = _as_utc(last_modified)
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified <= _as_utc(since)
+
+    return False
+
+
+def not_modified_response(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """
+    Si el cliente ya tiene la versión descrita por `headers` (ETag y
+    Last-Modified, ver validator_headers), retornar un 304 vacío.
+
+    Sirve tanto para respuestas recién calculadas como para respuestas
+    cacheadas, que sólo guardan los validadores como headers.
+    """
+    etag = headers.get("ETag")
+    if etag is None:
+        return None
+    last_modified = None
+    if "Last-Modified" in headers:
+        last_modified = parsedate_to_datetime(headers["Last-Modified"])
+    if is_not_modified(request, etag, last_modified):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=validator_headers(etag, last_modified)
+        )
+    return None
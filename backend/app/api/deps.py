@@ -1,12 +1,19 @@
-﻿from typing import Generator, Optional
+﻿import logging
+from typing import AsyncGenerator, Callable, Generator, Optional, TypeVar, Union
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, SessionLocal, async_replica_router, replica_router
 from app.core.security import verify_token
 from app.models.user import User
+from app.services.principal_cache import Principal, principal_cache
+from app.services.response_cache import project_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+logger = logging.getLogger(__name__)
 
 def get_db() -> Generator:
     """
@@ -19,65 +26,170 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_async_db() -> AsyncGenerator:
+    """
+    Dependency para obtener una AsyncSession (DATABASE_ASYNC=true).
+    Se cierra automáticamente después de cada request.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+class ReadSession:
+    """
+    Sesión sólo lectura diferida (get_read_session): no toma conexión
+    hasta el primer run_db, así las respuestas servidas desde la cache no
+    hacen checkout (ni pre-ping) de una réplica.
+    
+    Va a una réplica sana (DATABASE_REPLICA_URLS) en round-robin, o al
+    primario si no hay. Durante REPLICA_MAX_LAG_SECONDS después de una
+    invalidación de project_cache lee del primario: la réplica puede no
+    tener todavía la escritura y lo leído se vuelve a cachear.
+    """
+    
+    def __init__(self, is_async: bool):
+        self.is_async = is_async
+        self.session = None
+        self.connection = None
+    
+    def _use_replica(self) -> bool:
+        return not project_cache.invalidated_within(settings.REPLICA_MAX_LAG_SECONDS)
+    
+    def open(self) -> Session:
+        if self.session is None:
+            if self._use_replica():
+                self.connection = replica_router.connect()
+            self.session = SessionLocal(bind=self.connection) if self.connection is not None else SessionLocal()
+        return self.session
+    
+    async def open_async(self) -> AsyncSession:
+        if self.session is None:
+            if self._use_replica():
+                self.connection = await async_replica_router.connect_async()
+            self.session = AsyncSessionLocal(bind=self.connection) if self.connection is not None else AsyncSessionLocal()
+        return self.session
+    
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+        if self.connection is not None:
+            self.connection.close()
+    
+    async def close_async(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+        if self.connection is not None:
+            await self.connection.close()
+
+async def get_read_session() -> AsyncGenerator:
+    """
+    Dependency de sesión sólo lectura (ReadSession), sync o async según
+    DATABASE_ASYNC. Se usa con run_db.
+    
+    Sólo para handlers que no escriben: las escrituras y lo que se lee
+    después de escribir en el mismo request usan get_db (primario).
+    """
+    db = ReadSession(settings.DATABASE_ASYNC)
+    try:
+        yield db
+    finally:
+        if db.is_async:
+            await db.close_async()
+        elif db.session is not None:
+            await run_in_threadpool(db.close)
+
+# Sesión de los endpoints que soportan ambos modos: async si
+# DATABASE_ASYNC=true, si no la sesión sync de siempre
+get_session = get_async_db if settings.DATABASE_ASYNC else get_db
+
+DBSession = Union[Session, AsyncSession, ReadSession]
+
+T = TypeVar("T")
+
+async def run_db(db: DBSession, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Ejecutar `fn(session, *args, **kwargs)` (código ORM sync) con la
+    sesión de get_session o get_read_session.
+    
+    - AsyncSession: vía run_sync, sin ocupar un hilo del threadpool
+    - Session: en el threadpool, como un endpoint `def`
+    - ReadSession: la abre en el primer uso y sigue como las anteriores
+    """
+    if isinstance(db, ReadSession):
+        if db.is_async:
+            db = await db.open_async()
+        else:
+            return await run_in_threadpool(_run_read, db, fn, *args, **kwargs)
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+def _run_read(read: ReadSession, fn: Callable[..., T], *args, **kwargs) -> T:
+    # En el hilo: connect() a la réplica también bloquea
+    return fn(read.open(), *args, **kwargs)
+
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """Buscar un usuario por email (para usar con run_db)."""
+    return db.query(User).filter(User.email == email).first()
+
+def load_principal(db: Session, email: str) -> Optional[Principal]:
+    """Principal del usuario con ese email, o None (para usar con run_db)."""
+    user = get_user_by_email(db, email)
+    return Principal.from_user(user) if user is not None else None
+
+async def get_current_user(
+    db: DBSession = Depends(get_session),
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> Principal:
     """
     Dependency para obtener el usuario actual desde el JWT token.
     
+    Los tokens ya verificados se resuelven desde principal_cache (TTL
+    corto, acotado al `exp` del token) sin ir a la DB; la sesión sólo
+    abre conexión si hay que buscar al usuario.
+    
     Raises:
         HTTPException 401: Si el token es inválido o el usuario no existe
+        HTTPException 403: Si el usuario está inactivo
     """
-    print(f"🔐 [DEPS] get_current_user called")
-    print(f"📦 [DEPS] Token (first 20): {token[:20]}...")
-    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="No se pudo validar las credenciales",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    # Verificar token - retorna el payload completo
-    payload = verify_token(token)
-    print(f"📦 [DEPS] Payload from verify_token: {payload}")
-    
-    if payload is None:
-        print(f"❌ [DEPS] Token inválido - payload es None")
-        raise credentials_exception
-    
-    # Extraer email del payload
-    email = payload.get("sub")
-    print(f"📧 [DEPS] Email extraído: {email}")
-    
-    if email is None:
-        print(f"❌ [DEPS] Email no encontrado en payload")
-        raise credentials_exception
-    
-    # Buscar usuario
-    print(f"🔍 [DEPS] Buscando usuario: {email}")
-    user = db.query(User).filter(User.email == email).first()
-    
-    if user is None:
-        print(f"❌ [DEPS] Usuario no encontrado: {email}")
-        raise credentials_exception
+    principal = principal_cache.get(token)
+    cached = principal is not None
+    if principal is None:
+        # Verificar token - retorna el payload completo
+        payload = verify_token(token)
+        if payload is None:
+            raise credentials_exception
+        
+        email = payload.get("sub")
+        if email is None:
+            raise credentials_exception
+        
+        principal = await run_db(db, load_principal, email)
+        if principal is None:
+            raise credentials_exception
+        
+        principal_cache.set(token, principal, token_expires_at=payload.get("exp"))
     
-    print(f"✅ [DEPS] Usuario encontrado: {user.email}")
+    # Una línea por request: se muestrea (LOG_DEBUG_SAMPLE_RATE)
+    logger.debug("principal resolved", extra={"user_id": str(principal.id), "cached": cached})
     
     # Verificar que esté activo
-    if not user.is_active:
-        print(f"❌ [DEPS] Usuario inactivo: {email}")
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuario inactivo"
         )
     
-    print(f"✅ [DEPS] Usuario activo, retornando user")
-    return user
+    return principal
 
 def get_current_active_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Dependency para verificar que el usuario sea admin.
     
@@ -0,0 +1,73 @@
+import csv
+import io
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+
+from app.api.fieldsets import LIST_FIELDS, projection_columns, serialize_rows
+from app.api.responses import render_json
+from app.db.session import SessionLocal
+from app.models.project import Project
+
+# Mismos campos y orden que ProjectList
+EXPORT_FIELDS = LIST_FIELDS
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _iter_batches(published: Optional[bool], batch_size: int) -> Iterator[list]:
+    """
+    Recorrer el catálogo con un cursor del lado del servidor, entregando
+    lotes de `batch_size` proyectos ya con su media (una query por lote).
+
+    Abre su propia sesión: la de get_db se cierra antes de que termine
+    de enviarse una StreamingResponse.
+    """
+    db = SessionLocal()
+    try:
+        statement = select(*projection_columns(EXPORT_FIELDS, "id")).order_by(Project.id)
+        if published is not None:
+            statement = statement.where(Project.published == published)
+
+        result = db.execute(
+            statement,
+            execution_options={"yield_per": batch_size, "stream_results": True}
+        )
+        for rows in result.partitions():
+            yield serialize_rows(db, rows, EXPORT_FIELDS)
+    finally:
+        db.close()
+
+
+def ndjson_stream(published: Optional[bool], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """Un proyecto JSON por línea."""
+    for items in _iter_batches(published, batch_size):
+        yield b"".join(render_json(item) + b"\n" for item in items)
+
+
+def _csv_value(name: str, value):
+    if value is None:
+        return ""
+    if name in ("tags", "highlights"):
+        return "|".join(value)
+    if name in ("images", "videos"):
+        # La media va como JSON dentro de la celda
+        return render_json(value).decode("utf-8")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def csv_stream(published: Optional[bool], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """CSV con encabezado; tags/highlights separados por `|` y media como JSON."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode("utf-8")
+
+    for items in _iter_batches(published, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for item in items:
+            writer.writerow([_csv_value(name, item[name]) for name in EXPORT_FIELDS])
+        yield buffer.getvalue().encode("utf-8")
@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+
+# Facetas disponibles con ?facets=
+FACET_FIELDS = ("tags", "category")
+
+
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """Tags separados por coma, sin vacíos ni duplicados."""
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags.split(",") if tag.strip()))
+
+
+def tags_criterion(tags: List[str], match: str):
+    """
+    Filtro por tags usando los operadores de arrays (&& / @>), que son
+    los que aprovecha el índice GIN idx_projects_tags.
+    """
+    if match == "all":
+        return Project.tags.contains(tags)
+    return Project.tags.overlap(tags)
+
+
+def parse_facets(facets: Optional[str]) -> List[str]:
+    """
+    Raises:
+        HTTPException 400: Si se pide una faceta desconocida
+    """
+    if not facets:
+        return []
+    names = list(dict.fromkeys(name.strip() for name in facets.split(",") if name.strip()))
+    unknown = [name for name in names if name not in FACET_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown facets: {', '.join(unknown)}"
+        )
+    return names
+
+
+def compute_facets(db: Session, names: List[str], criteria: list) -> Dict[str, List[dict]]:
+    """
+    Conteos por tag y/o categoría para el conjunto filtrado por `criteria`,
+    en una sola query (UNION ALL de un GROUP BY por faceta).
+    """
+    if not names:
+        return {}
+
+    selects = []
+    if "tags" in names:
+        tag = func.unnest(Project.tags).label("value")
+        tag_rows = select(tag).where(*criteria).subquery()
+        selects.append(
+            select(
+                literal("tags").label("facet"),
+                tag_rows.c.value,
+                func.count().label("count")
+            ).group_by(tag_rows.c.value)
+        )
+    if "category" in names:
+        selects.append(
+            select(
+                literal("category").label("facet"),
+                Project.category.label("value"),
+                func.count().label("count")
+            ).where(*criteria).group_by(Project.category)
+        )
+
+    statement = selects[0] if len(selects) == 1 else union_all(*selects)
+
+    result = {name: [] for name in names}
+    for facet, value, count in db.execute(statement):
+        result[facet].append({"value": value, "count": count})
+    for values in result.values():
+        values.sort(key=lambda item: (-item["count"], item["value"] or ""))
+    return result
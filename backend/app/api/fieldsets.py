@@ -0,0 +1,140 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.project import Project, ProjectImage, ProjectVideo
+
+# Columnas escalares de Project que se pueden pedir con ?fields=
+PROJECT_COLUMNS = {
+    "id": Project.id,
+    "slug": Project.slug,
+    "title": Project.title,
+    "description": Project.description,
+    "category": Project.category,
+    "published": Project.published,
+    "client": Project.client,
+    "location": Project.location,
+    "start_date": Project.start_date,
+    "duration": Project.duration,
+    "tags": Project.tags,
+    "highlights": Project.highlights,
+    "created_at": Project.created_at,
+    "updated_at": Project.updated_at,
+}
+
+# Relaciones que se cargan con una query aparte por página
+MEDIA_FIELDS = {"images", "videos"}
+
+# URL de la primera imagen (menor display_order), calculada en SQL
+COVER_IMAGE = "cover_image"
+
+SUMMARY_FIELDS = ["id", "slug", "title", "category", COVER_IMAGE]
+
+# Vista completa de los listados: mismos campos y orden que ProjectList
+LIST_FIELDS = [
+    "id", "slug", "title", "description", "category", "published",
+    "client", "start_date", "duration", "location", "tags", "highlights",
+    "created_at", "updated_at", "images", "videos",
+]
+
+# Mismo orden que ProjectImageRead / ProjectVideoRead
+IMAGE_COLUMNS = ["url", "alt_text", "caption", "display_order", "id", "project_id", "created_at"]
+VIDEO_COLUMNS = ["video_url", "thumbnail_url", "title", "duration", "display_order", "id", "project_id", "created_at"]
+
+
+def parse_fields(fields: Optional[str], view: str) -> Optional[List[str]]:
+    """
+    Resolver qué campos retornar.
+
+    Retorna None para la vista completa (ProjectList), o la lista de
+    campos pedidos para una proyección parcial.
+
+    Raises:
+        HTTPException 400: Si se pide un campo desconocido
+    """
+    if fields:
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [
+            name for name in names
+            if name not in PROJECT_COLUMNS and name not in MEDIA_FIELDS and name != COVER_IMAGE
+        ]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+        # Mantener el orden pedido sin duplicados
+        return list(dict.fromkeys(names))
+
+    if view == "summary":
+        return list(SUMMARY_FIELDS)
+
+    return None
+
+
+def _cover_image_column():
+    return (
+        select(ProjectImage.url)
+        .where(ProjectImage.project_id == Project.id)
+        .order_by(ProjectImage.display_order)
+        .limit(1)
+        .correlate(Project)
+        .scalar_subquery()
+        .label(COVER_IMAGE)
+    )
+
+
+def projection_columns(names: List[str], sort: str) -> list:
+    """
+    Columnas a seleccionar en SQL para los campos pedidos.
+
+    Siempre incluye id y la columna de orden, necesarias para el cursor
+    de la página siguiente.
+    """
+    wanted = dict.fromkeys(["id", sort] + [n for n in names if n in PROJECT_COLUMNS])
+    columns = [PROJECT_COLUMNS[name].label(name) for name in wanted]
+    if COVER_IMAGE in names:
+        columns.append(_cover_image_column())
+    return columns
+
+
+def load_media(db: Session, model, columns: List[str], project_ids: list) -> Dict:
+    """Cargar la media de una página de proyectos en una sola query, agrupada por proyecto."""
+    grouped = defaultdict(list)
+    if not project_ids:
+        return grouped
+    rows = db.execute(
+        select(*[getattr(model, column) for column in columns])
+        .where(model.project_id.in_(project_ids))
+        .order_by(model.project_id, model.display_order)
+    ).mappings()
+    for row in rows:
+        grouped[row["project_id"]].append(dict(row))
+    return grouped
+
+
+def serialize_rows(db: Session, rows: list, names: List[str]) -> List[dict]:
+    """Construir los dicts de respuesta sólo con los campos pedidos."""
+    media = {}
+    project_ids = [row.id for row in rows]
+    if "images" in names:
+        media["images"] = load_media(db, ProjectImage, IMAGE_COLUMNS, project_ids)
+    if "videos" in names:
+        media["videos"] = load_media(db, ProjectVideo, VIDEO_COLUMNS, project_ids)
+
+    items = []
+    for row in rows:
+        mapping = row._mapping
+        item = {}
+        for name in names:
+            if name in media:
+                item[name] = media[name].get(row.id, [])
+            elif name in ("tags", "highlights"):
+                item[name] = mapping[name] or []
+            else:
+                item[name] = mapping[name]
+        items.append(item)
+    return items
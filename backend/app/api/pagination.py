@@ -0,0 +1,134 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, tuple_
+
+from app.models.project import Project
+
+# Columnas permitidas para ordenar/paginar por cursor.
+# Cada una tiene su índice en database/schema.sql
+SORT_COLUMNS = {
+    "created_at": Project.created_at,
+    "start_date": Project.start_date,
+}
+
+# Columnas que admiten NULL: van al final (NULLS LAST, como su índice)
+NULLABLE_SORTS = {"start_date"}
+
+DEFAULT_SORT = "created_at"
+
+# Orden por relevancia de GET /projects/search (no es una columna)
+RANK_SORT = "rank"
+
+
+def encode_cursor(sort: str, value: Any, project_id: UUID) -> str:
+    """
+    Codificar la posición (valor de orden, id) de la última fila de la página
+    en un string opaco y URL-safe.
+    """
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, str(project_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, UUID]:
+    """
+    Decodificar un cursor generado por encode_cursor.
+
+    Raises:
+        HTTPException 400: Si el cursor es inválido o fue generado con otro orden
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, project_id = json.loads(base64.urlsafe_b64decode(padded))
+        project_id = UUID(project_id)
+    except (ValueError, TypeError):
+        raise invalid
+
+    if cursor_sort != sort or (sort == RANK_SORT and value is None):
+        raise invalid
+
+    if value is not None:
+        try:
+            if sort == "start_date":
+                value = date.fromisoformat(value)
+            elif sort == RANK_SORT:
+                value = float(value)
+            else:
+                value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise invalid
+
+    return value, project_id
+
+
+def order_for(sort: str) -> tuple:
+    """
+    ORDER BY estable (valor DESC, id DESC) para el orden pedido, igual al
+    de su índice: created_at es NOT NULL (DESC a secas) y start_date
+    lleva NULLS LAST.
+    """
+    column = SORT_COLUMNS[sort]
+    if sort in NULLABLE_SORTS:
+        return (column.desc().nullslast(), Project.id.desc())
+    return (column.desc(), Project.id.desc())
+
+
+def keyset_filter(sort: str, value: Any, project_id: UUID):
+    """
+    Condición WHERE que selecciona las filas posteriores al cursor dentro
+    de su región (valores no nulos o NULL), como un rango del índice
+    (valor, id). La región de NULL que sigue a los no nulos la agrega
+    keyset_rows.
+    """
+    column = SORT_COLUMNS[sort]
+    if value is None:
+        return and_(column.is_(None), Project.id < project_id)
+    # Comparación de filas: excluye los NULL y Postgres la usa como
+    # límite del índice (un OR de columnas no)
+    return tuple_(column, Project.id) < tuple_(value, project_id)
+
+
+def keyset_rows(query, sort: str, value: Any, project_id: UUID, limit: int) -> list:
+    """
+    Hasta `limit` filas de `query` posteriores al cursor, en el orden de
+    order_for(sort).
+
+    Con un orden que admite NULL y el cursor todavía en los no nulos, si
+    la página no se completa se sigue con la región NULL en una segunda
+    query: cada una es un rango del índice, sin recorrer lo anterior.
+    """
+    rows = query.filter(keyset_filter(sort, value, project_id)).order_by(*order_for(sort)).limit(limit).all()
+    if sort in NULLABLE_SORTS and value is not None and len(rows) < limit:
+        column = SORT_COLUMNS[sort]
+        rows += (
+            query.filter(column.is_(None))
+            .order_by(*order_for(sort))
+            .limit(limit - len(rows))
+            .all()
+        )
+    return rows
+
+
+def rank_keyset_filter(rank, value: float, project_id: UUID):
+    """Condición keyset para ORDER BY rank DESC, id DESC."""
+    return or_(
+        rank < value,
+        and_(rank == value, Project.id < project_id),
+    )
+
+
+def next_cursor(sort: str, last: Optional[Project]) -> Optional[str]:
+    """Cursor para la página siguiente a partir de la última fila retornada."""
+    if last is None:
+        return None
+    return encode_cursor(sort, getattr(last, sort), last.id)
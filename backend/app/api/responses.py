@@ -0,0 +1,65 @@
+from typing import Hashable, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.api.compression import choose_encoding, compress, weak_etag
+from app.api.conditional import not_modified_response
+from app.core.config import settings
+from app.services.response_cache import CacheEntry, project_cache
+
+
+def _default(value):
+    # orjson ya resuelve datetime, date, UUID y dataclasses
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return jsonable_encoder(value)
+
+
+def render_json(content) -> bytes:
+    """Serializar con orjson (compacto, UTF-8), sin pasar por jsonable_encoder."""
+    return orjson.dumps(content, default=_default)
+
+
+def json_response(body: bytes, headers: dict) -> Response:
+    """Respuesta JSON a partir de bytes ya serializados."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _cached_response(request: Request, entry: CacheEntry) -> Response:
+    """
+    Body de la entrada, comprimido según Accept-Encoding si supera el
+    umbral. La variante comprimida queda guardada en la entrada, así los
+    hits siguientes no vuelven a comprimir (y el middleware la deja pasar).
+    """
+    if len(entry.body) < settings.COMPRESSION_MIN_SIZE:
+        return json_response(entry.body, entry.headers)
+
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    headers = {**entry.headers, "Vary": "Accept-Encoding"}
+    if encoding is None:
+        return json_response(entry.body, headers)
+
+    body = entry.variants.get(encoding)
+    if body is None:
+        body = entry.variants[encoding] = compress(entry.body, encoding)
+
+    headers["Content-Encoding"] = encoding
+    if "ETag" in headers:
+        headers["ETag"] = weak_etag(headers["ETag"])
+    return json_response(body, headers)
+
+
+def serve_cached(request: Request, cache_key: Hashable) -> Optional[Response]:
+    """Responder desde la cache (200 o 304) si hay una entrada vigente."""
+    entry = project_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    not_modified = not_modified_response(request, entry.headers)
+    if not_modified is not None:
+        return not_modified
+
+    return _cached_response(request, entry)
@@ -0,0 +1,302 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.api.compression import compress, supported_encodings
+from app.api.conditional import make_etag
+from app.api.fieldsets import LIST_FIELDS, projection_columns, serialize_rows
+from app.api.pagination import order_for
+from app.api.responses import render_json
+from app.api.v1.categories import render_categories
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.project import Project
+from app.schemas.project import ProjectRead
+
+logger = logging.getLogger(__name__)
+
+# Documentos del snapshot (rutas relativas a la carpeta de la versión)
+CATALOGUE = "projects.json"
+CATEGORIES = "categories.json"
+MANIFEST = "manifest.json"
+CURRENT = "CURRENT"
+
+# Extensión de la variante precomprimida por encoding
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Versiones que se conservan (la actual y la anterior, por lecturas en curso)
+KEEP_VERSIONS = 2
+
+# Backoff tras un build fallido antes de reintentarlo (se duplica por
+# fallo seguido)
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 300.0
+
+# Campos de un proyecto en el orden de ProjectRead
+READ_FIELDS = list(ProjectRead.model_fields)
+
+
+def enabled() -> bool:
+    return bool(settings.SNAPSHOT_DIR)
+
+
+def slug_document(slug: str) -> str:
+    return f"projects/{slug}.json"
+
+
+# ----------------------------------------------------------------------------
+# Render (compartido por el builder y el fallback a la DB)
+# ----------------------------------------------------------------------------
+
+def published_projects(db: Session, slug: Optional[str] = None) -> List[dict]:
+    """Proyectos publicados (vista ProjectList), más recientes primero."""
+    query = db.query(*projection_columns(LIST_FIELDS, "created_at")).filter(Project.published.is_(True))
+    if slug is not None:
+        query = query.filter(Project.slug == slug)
+    rows = query.order_by(*order_for("created_at")).all()
+    return serialize_rows(db, rows, LIST_FIELDS)
+
+
+def render_project(item: dict) -> bytes:
+    """Documento de un proyecto con los campos y el orden de ProjectRead."""
+    return render_json({name: item[name] for name in READ_FIELDS})
+
+
+# ----------------------------------------------------------------------------
+# Builder
+# ----------------------------------------------------------------------------
+
+def _write(directory: Path, name: str, body: bytes, best: bool) -> None:
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    for encoding in supported_encodings():
+        data = compress(body, encoding, best=best)
+        path.with_name(path.name + ENCODING_SUFFIXES[encoding]).write_bytes(data)
+
+
+def _replace_text(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _prune(root: Path, current: str) -> None:
+    versions = sorted(
+        (path for path in root.glob("v-*") if path.is_dir() and path.name != f"v-{current}"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in versions[KEEP_VERSIONS - 1:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def build_snapshot(db: Session) -> Optional[str]:
+    """
+    Materializar el catálogo publicado en SNAPSHOT_DIR.
+
+    - `projects.json`: todos los proyectos publicados (ProjectList)
+    - `projects/{slug}.json`: un documento por proyecto (ProjectRead)
+    - `categories.json`: igual que GET /categories
+
+    Cada documento va también precomprimido (.gz y, si hay brotli, .br).
+    La versión es un hash del contenido: se escribe en una carpeta
+    temporal que se renombra a `v-{versión}` y luego se reemplaza el
+    puntero CURRENT, ambos con rename atómico; los lectores nunca ven un
+    snapshot a medio escribir.
+
+    Retorna la versión, o None si el snapshot está deshabilitado.
+    """
+    if not enabled():
+        return None
+
+    items = published_projects(db)
+    documents: Dict[str, bytes] = {
+        CATALOGUE: render_json(items),
+        CATEGORIES: render_categories(db),
+    }
+    for item in items:
+        documents[slug_document(item["slug"])] = render_project(item)
+
+    digest = hashlib.sha1()
+    for name in sorted(documents):
+        digest.update(name.encode("utf-8"))
+        digest.update(documents[name])
+    version = digest.hexdigest()[:16]
+
+    root = Path(settings.SNAPSHOT_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / f"v-{version}"
+
+    if not target.exists():
+        tmp = root / f".tmp-{version}-{os.getpid()}-{threading.get_ident()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for name, body in documents.items():
+            # Nivel máximo sólo para los documentos grandes: los de cada
+            # slug son chicos y muchos, y el nivel por defecto casi no pierde
+            _write(tmp, name, body, best=name in (CATALOGUE, CATEGORIES))
+        manifest = {name: make_etag(body) for name, body in documents.items()}
+        (tmp / MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # Otro proceso publicó la misma versión entretanto
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    _replace_text(root / CURRENT, version)
+    _prune(root, version)
+    return version
+
+
+# Reconstrucción en segundo plano tras las escrituras: un solo hilo que
+# agrupa las escrituras que llegan mientras construye
+_rebuild_lock = threading.Lock()
+_rebuild_pending = False
+_rebuild_running = False
+_failures = 0
+_retry_at = 0.0
+_retry_timer: Optional[threading.Timer] = None
+
+
+def _drop_current() -> None:
+    """
+    Quitar el puntero CURRENT tras un build fallido: el snapshot vigente
+    ya no refleja la DB y, sin puntero, todos los workers sirven /catalog
+    desde la DB hasta que un build termine bien.
+    """
+    try:
+        (Path(settings.SNAPSHOT_DIR) / CURRENT).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("could not remove stale snapshot pointer", exc_info=True)
+
+
+def _build_failed() -> float:
+    """Contar el fallo y programar el reintento; retorna la espera. Con el lock tomado."""
+    global _failures, _retry_at, _retry_timer
+    _failures += 1
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (_failures - 1))
+    _retry_at = time.monotonic() + delay
+    # Reintentar aunque no lleguen más escrituras ni requests
+    if _retry_timer is not None:
+        _retry_timer.cancel()
+    _retry_timer = threading.Timer(delay, schedule_snapshot)
+    _retry_timer.daemon = True
+    _retry_timer.start()
+    return delay
+
+
+def _rebuild_loop() -> None:
+    global _rebuild_pending, _rebuild_running, _failures, _retry_at
+    while True:
+        with _rebuild_lock:
+            if not _rebuild_pending:
+                _rebuild_running = False
+                return
+            _rebuild_pending = False
+        db = SessionLocal()
+        try:
+            build_snapshot(db)
+        except Exception:
+            _drop_current()
+            with _rebuild_lock:
+                delay = _build_failed()
+            logger.exception("catalogue snapshot build failed", extra={"retry_in": delay})
+        else:
+            with _rebuild_lock:
+                _failures = 0
+                _retry_at = 0.0
+                if _retry_timer is not None:
+                    _retry_timer.cancel()
+        finally:
+            db.close()
+
+
+def schedule_snapshot() -> None:
+    """Pedir una reconstrucción del snapshot (no bloquea el request)."""
+    global _rebuild_pending, _rebuild_running
+    if not enabled():
+        return
+    with _rebuild_lock:
+        if _retry_timer is not None:
+            _retry_timer.cancel()
+        _rebuild_pending = True
+        if _rebuild_running:
+            return
+        _rebuild_running = True
+    threading.Thread(target=_rebuild_loop, name="catalogue-snapshot", daemon=True).start()
+
+
+def ensure_snapshot() -> None:
+    """
+    Pedir el primer build cuando todavía no hay snapshot (fallback de
+    /catalog). No hace nada si ya hay uno en curso o si el último falló
+    hace menos que el backoff; las escrituras usan schedule_snapshot.
+    """
+    with _rebuild_lock:
+        if _rebuild_running or time.monotonic() < _retry_at:
+            return
+    schedule_snapshot()
+
+
+# ----------------------------------------------------------------------------
+# Lectura
+# ----------------------------------------------------------------------------
+
+@dataclass
+class Snapshot:
+    version: str
+    directory: Path
+    etags: Dict[str, str]
+
+    def path(self, name: str, encoding: Optional[str] = None) -> Path:
+        path = self.directory / name
+        if encoding is not None:
+            path = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+        return path
+
+
+_loaded: Optional[Snapshot] = None
+_loaded_mtime: Optional[int] = None
+_load_lock = threading.Lock()
+
+
+def current_snapshot() -> Optional[Snapshot]:
+    """
+    Snapshot vigente, o None si no hay o si el último build de este
+    proceso falló (no está al día con la DB). El manifest se relee sólo
+    cuando cambia CURRENT (un stat por request), así lo ven todos los
+    workers.
+    """
+    global _loaded, _loaded_mtime
+    if not enabled() or _failures:
+        return None
+    pointer = Path(settings.SNAPSHOT_DIR) / CURRENT
+    try:
+        mtime = pointer.stat().st_mtime_ns
+    except OSError:
+        # Sin CURRENT todavía (o SNAPSHOT_DIR inaccesible): se sirve de la DB
+        return None
+
+    with _load_lock:
+        if _loaded is None or mtime != _loaded_mtime:
+            try:
+                version = pointer.read_text(encoding="utf-8").strip()
+                directory = pointer.parent / f"v-{version}"
+                etags = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            _loaded = Snapshot(version=version, directory=directory, etags=etags)
+            _loaded_mtime = mtime
+        return _loaded
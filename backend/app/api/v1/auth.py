@@ -1,29 +1,47 @@
+import logging
 from datetime import timedelta, datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import DBSession, get_current_user, get_session, get_user_by_email, run_db
 from app.core.config import settings
-from app.core.security import verify_password, create_access_token
+from app.core.password_executor import PasswordExecutorBusy, password_executor
+from app.core.security import create_access_token
 from app.models.user import User
-from app.schemas.auth import Token, UserResponse
+from app.schemas.auth import RefreshRequest, Token, UserResponse
+from app.services.login_throttle import login_throttle, resolve_client_ip, retry_after_header
+from app.services.principal_cache import Principal
+from app.services.refresh_tokens import issue_refresh_token, revoke_refresh_token, rotate_refresh_token
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+def _record_login(db: Session, user: User) -> str:
+    """Registrar el login y emitir un refresh token en la misma transacción."""
+    user.last_login = datetime.utcnow()
+    refresh_token = issue_refresh_token(db, user.id)
+    db.commit()
+    return refresh_token
+
+def _token_response(email: str, refresh_token: str) -> dict:
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": email},
+        expires_delta=access_token_expires
+    )
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    }
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-  
-    # DEBUG
-    print(f"🔍 Login attempt:")
-    print(f"   Email: {form_data.username}")
-    print(f"   Password length: {len(form_data.password)} chars")
-    print(f"   Password bytes: {len(form_data.password.encode('utf-8'))} bytes")
-    print(f"   Password (first 20 chars): {form_data.password[:20]}...")
-  
     """
     Login con email y password.
     
@@ -33,19 +51,46 @@ def login(
     - username (usaremos email aquí)
     - password
     """
+    # Límite de intentos por IP y por cuenta, antes de la DB y de bcrypt
+    client_ip = resolve_client_ip(
+        request.headers.get("x-forwarded-for"),
+        request.client.host if request.client else None
+    )
+    retry_after = login_throttle.check(client_ip, form_data.username)
+    if retry_after is not None:
+        logger.info("login throttled", extra={"client_ip": client_ip})
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Demasiados intentos de inicio de sesión, intenta más tarde",
+            headers={"Retry-After": retry_after_header(retry_after)},
+        )
+    
     # Buscar usuario por email
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await run_db(db, get_user_by_email, form_data.username)
     
     # Verificar que existe
     if not user:
+        logger.info("login failed", extra={"client_ip": client_ip})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email o contraseña incorrectos",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Verificar password
-    if not verify_password(form_data.password, user.hashed_password):
+    # Verificar password (bcrypt es CPU: en su propio executor acotado,
+    # fuera del event loop y del threadpool compartido)
+    try:
+        password_ok = await password_executor.verify(form_data.password, user.hashed_password)
+    except PasswordExecutorBusy:
+        logger.warning("login rejected: password executor busy")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Demasiados inicios de sesión en curso, intenta nuevamente",
+            headers={"Retry-After": "1"},
+        )
+    
+    if not password_ok:
+        logger.info("login failed", extra={"client_ip": client_ip})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email o contraseña incorrectos",
@@ -59,25 +104,52 @@ def login(
             detail="Usuario inactivo"
         )
     
-    # Actualizar last_login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    login_throttle.succeeded(form_data.username)
     
-    # Crear access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email},
-        expires_delta=access_token_expires
-    )
+    # Actualizar last_login (el commit expira `user`: leer el email antes)
+    email = user.email
+    refresh_token = await run_db(db, _record_login, user)
     
-    return {
-        "access_token": access_token,
-        "token_type": "bearer"
-    }
+    # Crear access token + refresh token
+    return _token_response(email, refresh_token)
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    body: RefreshRequest,
+    db: DBSession = Depends(get_session)
+):
+    """
+    Canjear un refresh token por un access token nuevo, sin password
+    (no corre bcrypt).
+    
+    El refresh token se rota: el usado queda revocado y se retorna otro.
+    Presentar uno ya usado revoca la sesión completa.
+    """
+    rotated = await run_db(db, rotate_refresh_token, body.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token inválido o expirado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    email, refresh_token = rotated
+    return _token_response(email, refresh_token)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    body: RefreshRequest,
+    db: DBSession = Depends(get_session)
+):
+    """
+    Revocar el refresh token y todos los de su sesión. El access token
+    sigue siendo válido hasta que expira.
+    """
+    await run_db(db, revoke_refresh_token, body.refresh_token)
 
 @router.get("/me", response_model=UserResponse)
 def read_users_me(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Obtener información del usuario actual.
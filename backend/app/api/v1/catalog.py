@@ -0,0 +1,129 @@
+from typing import Callable, List, Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.api import snapshot
+from app.api.compression import choose_encoding, weak_etag
+from app.api.conditional import make_etag, not_modified_response
+from app.api.responses import json_response, render_json, serve_cached
+from app.api.v1.categories import render_categories
+from app.db.session import SessionLocal
+from app.schemas.category import CategoryRead
+from app.schemas.project import ProjectList, ProjectRead
+from app.services.response_cache import LIST_TAG, project_cache
+
+router = APIRouter()
+
+
+def _snapshot_response(request: Request, name: str) -> Optional[Response]:
+    """
+    Servir un documento del snapshot vigente como archivo (sendfile /
+    pathsend si el servidor lo soporta), eligiendo la variante
+    precomprimida según Accept-Encoding. None si no está en el snapshot.
+    """
+    current = snapshot.current_snapshot()
+    if current is None or name not in current.etags:
+        return None
+
+    etag = current.etags[name]
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    not_modified = not_modified_response(request, headers)
+    if not_modified is not None:
+        return not_modified
+
+    path = current.path(name)
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if encoding is not None and current.path(name, encoding).is_file():
+        path = current.path(name, encoding)
+        headers.update({"Content-Encoding": encoding, "ETag": weak_etag(etag)})
+    elif not path.is_file():
+        # Versión ya eliminada por una más nueva: ir a la DB
+        return None
+
+    return FileResponse(path, media_type="application/json", headers=headers)
+
+
+def _render(render: Callable[[Session], Optional[bytes]]) -> Optional[bytes]:
+    db = SessionLocal()
+    try:
+        return render(db)
+    finally:
+        db.close()
+
+
+async def _serve(
+    request: Request,
+    name: str,
+    render: Callable[[Session], Optional[bytes]],
+    not_found_detail: str = "Not found"
+) -> Response:
+    """
+    Documento `name` desde el snapshot o, si no está, generado desde la DB
+    (con el mismo contenido y ETag) y guardado en la cache en memoria.
+    """
+    response = _snapshot_response(request, name)
+    if response is not None:
+        return response
+
+    if snapshot.current_snapshot() is None:
+        # Habilitado pero todavía sin generar: construirlo en segundo plano
+        snapshot.ensure_snapshot()
+
+    cache_key = ("catalog", name)
+    cached = serve_cached(request, cache_key)
+    if cached is not None:
+        return cached
+
+    generation = project_cache.generation()
+    body = await run_in_threadpool(_render, render)
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+
+    headers = {"ETag": make_etag(body)}
+    project_cache.set(cache_key, body, headers, tags=[LIST_TAG], generation=generation)
+    not_modified = not_modified_response(request, headers)
+    if not_modified is not None:
+        return not_modified
+
+    return json_response(body, headers)
+
+
+def _render_catalogue(db: Session) -> bytes:
+    return render_json(snapshot.published_projects(db))
+
+
+@router.get("/catalog/projects", response_model=List[ProjectList])
+async def catalogue_projects(request: Request):
+    """
+    Catálogo público completo: todos los proyectos publicados (ProjectList),
+    más recientes primero, sin paginar.
+
+    Se sirve desde el snapshot en disco (SNAPSHOT_DIR) sin tocar la DB,
+    precomprimido (br/gzip) y con un ETag que sólo cambia con el contenido.
+    Si no hay snapshot, se arma desde la DB.
+    """
+    return await _serve(request, snapshot.CATALOGUE, _render_catalogue)
+
+
+@router.get("/catalog/projects/{slug}", response_model=ProjectRead)
+async def catalogue_project(slug: str, request: Request):
+    """Un proyecto publicado por slug (ProjectRead), desde el snapshot si existe."""
+    def render(db: Session) -> Optional[bytes]:
+        items = snapshot.published_projects(db, slug=slug)
+        return snapshot.render_project(items[0]) if items else None
+
+    return await _serve(
+        request,
+        snapshot.slug_document(slug),
+        render,
+        not_found_detail=f"Project with slug '{slug}' not found"
+    )
+
+
+@router.get("/catalog/categories", response_model=List[CategoryRead])
+async def catalogue_categories(request: Request):
+    """Categorías activas con su cantidad de proyectos publicados, desde el snapshot si existe."""
+    return await _serve(request, snapshot.CATEGORIES, render_categories)
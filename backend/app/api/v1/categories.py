@@ -0,0 +1,67 @@
+from typing import List
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.api.conditional import make_etag, not_modified_response
+from app.api.deps import DBSession, get_read_session, run_db
+from app.api.responses import json_response, render_json, serve_cached
+from app.models.project import Category, Project
+from app.schemas.category import CategoryRead
+from app.services.response_cache import LIST_TAG, project_cache
+
+router = APIRouter()
+
+
+def render_categories(db: Session) -> bytes:
+    """JSON de las categorías activas con su cantidad de proyectos publicados."""
+    rows = (
+        db.query(
+            Category.id,
+            Category.name,
+            Category.description,
+            Category.icon,
+            Category.display_order,
+            func.count(Project.id).label("project_count")
+        )
+        .outerjoin(
+            Project,
+            and_(Project.category == Category.id, Project.published.is_(True))
+        )
+        .filter(Category.active.is_(True))
+        .group_by(Category.id)
+        .order_by(Category.display_order, Category.id)
+        .all()
+    )
+    
+    return render_json([CategoryRead.model_validate(row) for row in rows])
+
+
+@router.get("/categories", response_model=List[CategoryRead])
+async def list_categories(
+    request: Request,
+    db: DBSession = Depends(get_read_session)
+):
+    """
+    Listar las categorías activas ordenadas por `display_order`,
+    con la cantidad de proyectos publicados de cada una.
+    
+    Los conteos se calculan en una sola query agrupada (equivalente a
+    `count_projects_by_category()` en database/schema.sql). La respuesta
+    se cachea junto a los listados de proyectos y se invalida con ellos.
+    """
+    cache_key = ("categories",)
+    cached = serve_cached(request, cache_key)
+    if cached is not None:
+        return cached
+    
+    generation = project_cache.generation()
+    body = await run_db(db, render_categories)
+    headers = {"ETag": make_etag("categories", body)}
+    
+    not_modified = not_modified_response(request, headers)
+    project_cache.set(cache_key, body, headers, tags=[LIST_TAG], generation=generation)
+    if not_modified is not None:
+        return not_modified
+    
+    return json_response(body, headers)
@@ -1,9 +1,11 @@
+import logging
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 from app.services.ai_service import ai_service
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 class ChatMessage(BaseModel):
     role: str = Field(..., description="Rol del mensaje: 'user' o 'assistant'")
@@ -45,7 +47,7 @@ async def chat_with_bot(request: ChatRequest):
     Retorna la respuesta generada por el asistente de IA.
     """
     try:
-        print(f"💬 [CHAT] Mensaje recibido: {request.message[:50]}...")
+        logger.debug("chat message received", extra={"length": len(request.message), "history": len(request.history or [])})
         
         # Convertir history a formato dict simple
         history_dict = [
@@ -59,12 +61,12 @@ async def chat_with_bot(request: ChatRequest):
             history=history_dict
         )
         
-        print(f"✅ [CHAT] Respuesta generada: {response_text[:50]}...")
+        logger.debug("chat response generated", extra={"length": len(response_text)})
         
         return ChatResponse(response=response_text)
         
     except Exception as e:
-        print(f"❌ [CHAT] Error: {str(e)}")
+        logger.exception("chat failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al procesar el mensaje: {str(e)}"
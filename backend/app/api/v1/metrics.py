@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_active_admin
+from app.core.logging import dropped_records
+from app.core.password_executor import password_executor
+from app.db.pool_metrics import pool_stats
+from app.db.session import async_replica_router, replica_router
+from app.services.login_throttle import login_throttle
+from app.services.principal_cache import principal_cache
+from app.services.response_cache import project_cache
+
+# Sólo admins: exponen tamaños de pools y colas, y conteos de logins
+router = APIRouter(dependencies=[Depends(get_current_active_admin)])
+
+
+@router.get("/metrics/cache")
+def cache_metrics():
+    """
+    Contadores de la cache en memoria de proyectos públicos.
+    
+    Son por proceso: con varios workers cada uno tiene su propia cache.
+    """
+    return project_cache.stats()
+
+
+@router.get("/metrics/auth")
+def auth_metrics():
+    """
+    Contadores de autenticación (por proceso).
+    
+    `principal_cache`: cache token → usuario de get_current_user.
+    `password_executor`: pool de bcrypt; `rejected` cuenta los logins
+    rechazados con 503 por tener la cola llena.
+    `login_throttle`: intentos de login permitidos y rechazados con 429
+    por IP o por cuenta.
+    """
+    return {
+        "principal_cache": principal_cache.stats(),
+        "password_executor": password_executor.stats(),
+        "login_throttle": login_throttle.stats(),
+    }
+
+
+@router.get("/metrics/pool")
+def pool_metrics():
+    """
+    Estado y contadores de los pools de conexiones a la DB.
+    
+    Por engine: conexiones en uso (`checked_out`), `overflow`, libres,
+    histograma de espera de checkout en ms (conteo por bucket, clave =
+    límite superior), checkouts que agotaron `pool_timeout` y fallos del
+    pre-ping. Son por proceso, como la cache.
+    
+    `replicas` indica qué réplicas de lectura están en rotación.
+    """
+    replicas = replica_router.stats()
+    if async_replica_router is not None:
+        replicas += async_replica_router.stats()
+    return {"pools": pool_stats(), "replicas": replicas}
+
+
+@router.get("/metrics/logs")
+def log_metrics():
+    """Registros de log descartados por tener la cola llena (por proceso)."""
+    return {"dropped": dropped_records()}
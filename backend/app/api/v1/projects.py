@@ -1,16 +1,230 @@
-﻿import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
+﻿from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Literal, Optional, Union
 from uuid import UUID
-from slugify import slugify  # Asegúrate que esté importado
-from app.api.deps import get_db
+from app.api.conditional import make_etag, not_modified_response, validator_headers
+from app.api.deps import DBSession, get_db, get_read_session, run_db
+from app.api.export import csv_stream, ndjson_stream
+from app.api.facets import compute_facets, parse_facets, parse_tags, tags_criterion
+from app.api.fieldsets import LIST_FIELDS, parse_fields, projection_columns, serialize_rows
+from app.api.pagination import (
+    RANK_SORT, decode_cursor, encode_cursor, keyset_rows, next_cursor, order_for, rank_keyset_filter
+)
+from app.api.responses import json_response, render_json, serve_cached
+from app.api.snapshot import schedule_snapshot
 from app.models.project import Project, ProjectImage, ProjectVideo
-from app.schemas.project import ( ProjectCreate, ProjectUpdate, ProjectRead, ProjectList )
+from app.schemas.project import ( ProjectCreate, ProjectUpdate, ProjectRead, ProjectList, ProjectListWithFacets, ProjectImportResult )
+from app.services.response_cache import LIST_TAG, project_cache, project_tag
+from app.services.project_import import DEFAULT_CHUNK_SIZE, ImportReport, aiter_ndjson_chunks, import_chunk
+from app.services.media_sync import insert_media, sync_images, sync_videos
+from app.services.search import search_expressions
+from app.services.slugs import SlugTakenError, flush_with_slug, slug_base
 
 router = APIRouter()
 
 
+
+def _with_media(query):
+    """
+    Precargar imágenes y videos con selectin (una query por relación
+    para toda la página), evitando el N+1 al serializar.
+    """
+    return query.options(
+        selectinload(Project.images),
+        selectinload(Project.videos)
+    )
+
+
+def _load_project(db: Session, project_id: UUID) -> Optional[Project]:
+    """Obtener un proyecto con su media ya cargada (o None)."""
+    return (
+        _with_media(db.query(Project))
+        .filter(Project.id == project_id)
+        .populate_existing()
+        .first()
+    )
+
+
+def _project_criteria(
+    published: Optional[bool],
+    category: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    tags_match: str = "any"
+) -> list:
+    """Condiciones WHERE de los filtros comunes de listado."""
+    criteria = []
+    
+    if published is not None:
+        criteria.append(Project.published == published)
+    
+    if category:
+        criteria.append(Project.category == category)
+    
+    if tags:
+        criteria.append(tags_criterion(tags, tags_match))
+    
+    return criteria
+
+
+def _project_version(db: Session, not_found_detail: str, *criteria):
+    """
+    Leer sólo (id, updated_at) de un proyecto, sin cargar el objeto.
+    Lanza 404 con `not_found_detail` si no existe.
+    """
+    row = db.query(Project.id, Project.updated_at).filter(*criteria).first()
+    
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail
+        )
+    
+    return row
+
+
+def _invalidate_cache(project_id: Optional[UUID] = None) -> None:
+    """
+    Invalidar los listados y, si se indica, las entradas de un proyecto,
+    y regenerar el snapshot del catálogo en segundo plano.
+    """
+    tags = [LIST_TAG]
+    if project_id is not None:
+        tags.append(project_tag(project_id))
+    project_cache.invalidate(*tags)
+    schedule_snapshot()
+
+
+# Partes de los endpoints de lectura que usan la DB: código ORM sync que
+# se ejecuta con run_db, sea la sesión sync o async (DATABASE_ASYNC)
+
+def _list_page(
+    db: Session,
+    request: Request,
+    *,
+    criteria: list,
+    names: Optional[List[str]],
+    facet_names: List[str],
+    sort: str,
+    keyset: Optional[tuple],
+    skip: int,
+    limit: int,
+    cache_key
+) -> Response:
+    """Página de GET /projects (ver list_projects)."""
+    # Antes de leer: si se invalida mientras tanto, no se cachea el resultado
+    generation = project_cache.generation()
+    
+    # Vista completa o proyección: se seleccionan columnas (sin instanciar
+    # objetos ORM) y la media va en una query por página
+    fields = names or LIST_FIELDS
+    query = db.query(*projection_columns(fields, sort)).filter(*criteria)
+    
+    # Pedir una fila extra para saber si existe una página siguiente
+    if keyset:
+        projects = keyset_rows(query, sort, *keyset, limit + 1)
+    else:
+        projects = query.order_by(*order_for(sort)).offset(skip).limit(limit + 1).all()
+    
+    cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        cursor = next_cursor(sort, projects[-1])
+    
+    # El JSON se arma directo desde las filas, sin validar con ProjectList
+    body = render_json(serialize_rows(db, projects, fields))
+    
+    if facet_names:
+        facet_counts = compute_facets(db, facet_names, criteria)
+        body = b'{"items":' + body + b',"facets":' + render_json(facet_counts) + b"}"
+    
+    # ETag del body ya armado (y del cursor siguiente): sin una agregación
+    # aparte sobre todo el conjunto filtrado. Sin Last-Modified: no hay un
+    # timestamp barato que cambie también al borrar
+    headers = validator_headers(make_etag("list", body, cursor), None)
+    if cursor is not None:
+        headers["X-Next-Cursor"] = cursor
+    
+    if cache_key is not None:
+        project_cache.set(cache_key, body, headers, tags=[LIST_TAG], generation=generation)
+    
+    not_modified = not_modified_response(request, headers)
+    if not_modified is not None:
+        return not_modified
+    
+    return json_response(body, headers)
+
+
+def _search_page(
+    db: Session,
+    q: str,
+    published: Optional[bool],
+    keyset: Optional[tuple],
+    limit: int,
+    cache_key
+) -> Response:
+    """Página de GET /projects/search (ver search_projects)."""
+    generation = project_cache.generation()
+    condition, rank = search_expressions(db, q)
+    query = db.query(*projection_columns(LIST_FIELDS, "id"), rank.label("rank")).filter(condition)
+    query = query.filter(*_project_criteria(published))
+    
+    if keyset:
+        query = query.filter(rank_keyset_filter(rank, *keyset))
+    
+    rows = query.order_by(rank.desc(), Project.id.desc()).limit(limit + 1).all()
+    
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(RANK_SORT, rows[-1].rank, rows[-1].id)
+    
+    body = render_json(serialize_rows(db, rows, LIST_FIELDS))
+    
+    if cache_key is not None:
+        project_cache.set(cache_key, body, headers, tags=[LIST_TAG], generation=generation)
+    
+    return json_response(body, headers)
+
+
+def _project_detail(
+    db: Session,
+    request: Request,
+    not_found_detail: str,
+    criteria: list,
+    cache_key
+) -> Response:
+    """
+    Detalle de un proyecto (GET por id o por slug) con GET condicional.
+    Sólo se cachean proyectos publicados.
+    """
+    generation = project_cache.generation()
+    version = _project_version(db, not_found_detail, *criteria)
+    headers = validator_headers(
+        make_etag("project", version.id, version.updated_at), version.updated_at
+    )
+    not_modified = not_modified_response(request, headers)
+    if not_modified is not None:
+        return not_modified
+    
+    project = _with_media(db.query(Project)).filter(*criteria).first()
+    
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail
+        )
+    
+    body = ProjectRead.model_validate(project).model_dump_json().encode("utf-8")
+    
+    if cache_key is not None and project.published:
+        project_cache.set(cache_key, body, headers, tags=[project_tag(project.id)], generation=generation)
+    
+    return json_response(body, headers)
+
+
 @router.post("/projects", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
 def create_project(
     project_in: ProjectCreate,
@@ -20,34 +234,13 @@ def create_project(
     Crear un nuevo proyecto.
     
     - **title**: Título del proyecto (requerido)
-    - **slug**: URL-friendly identifier (requerido, único)
+    - **slug**: URL-friendly identifier (opcional, único; si no viene se genera desde el título)
     - **category**: ID de categoría (debe existir)
     - **published**: Estado de publicación (default: false)
     - **images**: Lista de imágenes (opcional)
     - **videos**: Lista de videos (opcional)
     """
     
-   # Generar slug automáticamente si no viene
-    if not project_in.slug:
-        base_slug = slugify(project_in.title)
-        slug = base_slug
-        counter = 1
-        
-        # Asegurar que el slug sea único
-        while db.query(Project).filter(Project.slug == slug).first():
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        
-        project_in.slug = slug
-    else:
-        # Verificar que el slug no exista si viene provisto
-        existing_project = db.query(Project).filter(Project.slug == project_in.slug).first()
-        if existing_project:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Project with slug '{project_in.slug}' already exists"
-            )
-    
     # Crear proyecto
     db_project = Project(
         title=project_in.title,
@@ -63,84 +256,279 @@ def create_project(
         highlights=project_in.highlights
     )
     
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    
-    # Agregar imágenes si existen
-    for img in project_in.images:
-        db_image = ProjectImage(
-            project_id=db_project.id,
-            url=img.url,
-            alt_text=img.alt_text,
-            caption=img.caption,
-            display_order=img.display_order
+    # Slug: el provisto o uno libre generado desde el título. La unicidad
+    # la garantiza el UNIQUE de la tabla, no una consulta previa
+    try:
+        flush_with_slug(
+            db,
+            db_project,
+            base=None if project_in.slug else slug_base(project_in.title)
         )
-        db.add(db_image)
-    
-    # Agregar videos si existen
-    for vid in project_in.videos:
-        db_video = ProjectVideo(
-            project_id=db_project.id,
-            video_url=vid.video_url,
-            thumbnail_url=vid.thumbnail_url,
-            title=vid.title,
-            duration=vid.duration,
-            display_order=vid.display_order
+    except SlugTakenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        db.add(db_video)
+    
+    # Media con INSERTs multi-fila en la misma transacción: si algo falla
+    # no queda un proyecto a medio crear
+    images = insert_media(db, ProjectImage, db_project.id, project_in.images)
+    videos = insert_media(db, ProjectVideo, db_project.id, project_in.videos)
+    
+    # Armar la respuesta antes del commit (que expira el objeto) con los
+    # valores ya conocidos, sin volver a consultar
+    project = ProjectRead.model_validate({
+        **{column.key: getattr(db_project, column.key) for column in Project.__table__.columns},
+        "images": images,
+        "videos": videos,
+    })
     
     db.commit()
-    db.refresh(db_project)
+    _invalidate_cache()
+    
+    return project
+
+
+@router.post("/projects/import", response_model=ProjectImportResult)
+async def import_projects(
+    request: Request,
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=5000),
+    db: Session = Depends(get_db)
+):
+    """
+    Importar proyectos en masa desde un body NDJSON
+    (`application/x-ndjson`, un ProjectCreate por línea).
+    
+    El body se procesa a medida que llega, en chunks de `chunk_size`
+    líneas. Cada chunk se valida, resuelve sus slugs con una sola query y
+    se inserta (proyectos, imágenes y videos) con INSERTs multi-fila en
+    una transacción propia.
+    
+    Retorna el resumen con los errores por línea (ordenados por número de
+    línea); las líneas con error no impiden importar el resto. Las líneas
+    de más de 1 MiB se rechazan sin leerlas completas.
+    """
+    report = ImportReport()
+    
+    async for chunk in aiter_ndjson_chunks(request.stream(), chunk_size):
+        await run_in_threadpool(import_chunk, db, chunk, report)
+    
+    if report.created:
+        _invalidate_cache()
     
-    return db_project
+    return report.as_dict()
 
 
-@router.get("/projects", response_model=List[ProjectList])
-def list_projects(
+@router.get("/projects", response_model=Union[List[ProjectList], ProjectListWithFacets])
+async def list_projects(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1),
     published: bool = None,
     category: str = None,
-    db: Session = Depends(get_db)
+    tags: Optional[str] = None,
+    tags_match: Literal["any", "all"] = "any",
+    sort: Literal["created_at", "start_date"] = "created_at",
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
+    facets: Optional[str] = None,
+    db: DBSession = Depends(get_read_session)
 ):
     """
     Listar proyectos con filtros opcionales.
     
-    - **skip**: Número de registros a saltar (paginación)
+    - **skip**: Número de registros a saltar (paginación por offset)
     - **limit**: Número máximo de registros a retornar
     - **published**: Filtrar por estado de publicación
     - **category**: Filtrar por categoría
+    - **tags**: Tags separados por coma
+    - **tags_match**: `any` (default, al menos uno) o `all` (todos)
+    - **sort**: Orden descendente por `created_at` (default) o `start_date`
+    - **cursor**: Cursor opaco de la página anterior (paginación keyset)
+    - **view**: `full` (default, ProjectList) o `summary` (id, slug, title,
+      category, cover_image) para tarjetas del catálogo
+    - **fields**: Lista separada por comas de campos a retornar; tiene
+      prioridad sobre `view`. Acepta columnas del proyecto, `images`,
+      `videos` y `cover_image`
+    - **facets**: `tags` y/o `category`. Si se indica, la respuesta pasa a
+      ser `{"items": [...], "facets": {"tags": [{"value", "count"}], ...}}`
+      con los conteos del conjunto filtrado (sin paginar)
+    
+    Tanto la vista completa como las proyecciones seleccionan sólo las
+    columnas necesarias en SQL y el JSON se arma directo desde las filas
+    (orjson), sin instanciar objetos ORM ni validar con ProjectList.
+    
+    Si hay más resultados, el header `X-Next-Cursor` trae el cursor
+    de la página siguiente.
+    
+    Soporta GET condicional: el ETag es un hash de la página (y del cursor
+    siguiente); con If-None-Match coincidente se responde 304 sin body.
+    Desde la cache el 304 no toca la DB. Los listados no envían
+    Last-Modified.
+    
+    Los listados públicos (`published=true`) se sirven desde la cache en
+    memoria hasta que un endpoint de escritura la invalide.
     """
-    query = db.query(Project)
+    if cursor and skip:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="skip and cursor cannot be combined"
+        )
     
-    if published is not None:
-        query = query.filter(Project.published == published)
+    names = parse_fields(fields, view)
+    facet_names = parse_facets(facets)
+    tag_list = parse_tags(tags)
+    keyset = decode_cursor(cursor, sort) if cursor else None
+    criteria = _project_criteria(published, category, tag_list, tags_match)
+    
+    cache_key = None
+    if published:
+        cache_key = (
+            "list", skip, limit, category, tuple(tag_list), tags_match, sort, cursor,
+            tuple(names) if names is not None else None, tuple(facet_names)
+        )
+        cached = serve_cached(request, cache_key)
+        if cached is not None:
+            return cached
+    
+    return await run_db(
+        db, _list_page, request,
+        criteria=criteria,
+        names=names,
+        facet_names=facet_names,
+        sort=sort,
+        keyset=keyset,
+        skip=skip,
+        limit=limit,
+        cache_key=cache_key,
+    )
+
+
+@router.get("/projects/search", response_model=List[ProjectList])
+async def search_projects(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    published: bool = None,
+    cursor: Optional[str] = None,
+    db: DBSession = Depends(get_read_session)
+):
+    """
+    Buscar proyectos por texto, ordenados por relevancia.
     
-    if category:
-        query = query.filter(Project.category == category)
+    Busca en título, descripción, cliente, ubicación, tags y highlights
+    usando el `search_vector` (español, sin acentos, índice GIN) de
+    Postgres. Acepta la sintaxis de `websearch_to_tsquery`
+    (`"frase exacta"`, `-excluir`, `or`).
+    
+    - **q**: Texto a buscar
+    - **limit**: Número máximo de resultados por página
+    - **published**: Filtrar por estado de publicación
+    - **cursor**: Cursor opaco de la página anterior
     
-    projects = query.offset(skip).limit(limit).all()
-    return projects
+    Si hay más resultados, el header `X-Next-Cursor` trae el cursor
+    de la página siguiente.
+    """
+    q = q.strip()
+    keyset = decode_cursor(cursor, RANK_SORT) if cursor else None
+    
+    cache_key = None
+    if published:
+        cache_key = ("search", q, limit, cursor)
+        cached = serve_cached(request, cache_key)
+        if cached is not None:
+            return cached
+    
+    return await run_db(db, _search_page, q, published, keyset, limit, cache_key)
+
+
+@router.get("/projects/export")
+def export_projects(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    published: bool = None
+):
+    """
+    Exportar el catálogo completo en streaming.
+    
+    - **format**: `ndjson` (default, un ProjectList por línea) o `csv`
+    - **published**: Filtrar por estado de publicación
+    
+    Las filas se leen con un cursor del lado del servidor en lotes
+    (imágenes y videos con una query por lote), así la memoria no crece
+    con el tamaño del catálogo y los bytes empiezan a salir de inmediato.
+    """
+    if format == "csv":
+        stream, media_type = csv_stream(published), "text/csv; charset=utf-8"
+    else:
+        stream, media_type = ndjson_stream(published), "application/x-ndjson"
+    
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="projects.{format}"'}
+    )
 
 
 @router.get("/projects/{project_id}", response_model=ProjectRead)
-def get_project(
+async def get_project(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: DBSession = Depends(get_read_session)
 ):
     """
     Obtener un proyecto por su ID (con imágenes y videos).
+    
+    Soporta GET condicional (ETag / Last-Modified por `updated_at`).
+    Los proyectos publicados se sirven desde la cache en memoria.
+    """
+    cache_key = ("project", project_id)
+    cached = serve_cached(request, cache_key)
+    if cached is not None:
+        return cached
+    
+    return await run_db(
+        db, _project_detail, request,
+        f"Project with id {project_id} not found",
+        [Project.id == project_id],
+        cache_key,
+    )
+
+@router.get("/projects/by-slug/{slug}", response_model=ProjectRead)
+async def get_project_by_slug(
+    slug: str,
+    request: Request,
+    published: bool = None,
+    db: DBSession = Depends(get_read_session)
+):
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    Obtener un proyecto por su slug (con imágenes y videos).
     
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found"
-        )
+    Usa el índice único de `slug`: una sola fila en vez de todo el catálogo.
     
-    return project
+    - **published**: Si se indica, el proyecto debe tener ese estado
+    
+    Soporta GET condicional (ETag / Last-Modified por `updated_at`).
+    Con `published=true` la respuesta se sirve desde la cache en memoria.
+    """
+    cache_key = None
+    if published:
+        cache_key = ("slug", slug)
+        cached = serve_cached(request, cache_key)
+        if cached is not None:
+            return cached
+    
+    criteria = [Project.slug == slug]
+    
+    if published is not None:
+        criteria.append(Project.published == published)
+    
+    return await run_db(
+        db, _project_detail, request,
+        f"Project with slug '{slug}' not found",
+        criteria,
+        cache_key,
+    )
 
 @router.put("/projects/{project_id}", response_model=ProjectRead)
 def update_project(
@@ -162,19 +550,6 @@ def update_project(
             detail=f"Project with id {project_id} not found"
         )
     
-    # Verificar slug único si se está actualizando
-    if project_in.slug and project_in.slug != db_project.slug:
-        existing_slug = db.query(Project).filter(
-            Project.slug == project_in.slug,
-            Project.id != project_id
-        ).first()
-        
-        if existing_slug:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Project with slug '{project_in.slug}' already exists"
-            )
-    
     # IMPORTANTE: Excluir images y videos del update_data
     update_data = project_in.dict(exclude_unset=True, exclude={'images', 'videos'})
     
@@ -182,45 +557,35 @@ def update_project(
     for field, value in update_data.items():
         setattr(db_project, field, value)
     
-    # Actualizar imágenes si se proporcionan
-    if project_in.images is not None:
-        # Eliminar imágenes existentes
-        db.query(ProjectImage).filter(ProjectImage.project_id == project_id).delete()
-        
-        # Agregar nuevas imágenes
-        for img_data in project_in.images:
-            new_image = ProjectImage(
-                id=uuid.uuid4(),
-                project_id=project_id,
-                url=img_data.url,
-                alt_text=img_data.alt_text or "",
-                caption=img_data.caption or "",
-                display_order=img_data.display_order
+    # Verificar slug único si se está actualizando (vía el UNIQUE de la tabla)
+    if project_in.slug:
+        try:
+            flush_with_slug(db, db_project)
+        except SlugTakenError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
             )
-            db.add(new_image)
     
-    # Actualizar videos si se proporcionan
+    # Actualizar imágenes y videos si se proporcionan: sólo se escriben
+    # las filas que cambian (ids y created_at se conservan)
+    media_changed = False
+    
+    if project_in.images is not None:
+        media_changed |= sync_images(db, project_id, project_in.images)
+    
     if project_in.videos is not None:
-        # Eliminar videos existentes
-        db.query(ProjectVideo).filter(ProjectVideo.project_id == project_id).delete()
-        
-        # Agregar nuevos videos
-        for vid_data in project_in.videos:
-            new_video = ProjectVideo(
-                id=uuid.uuid4(),
-                project_id=project_id,
-                video_url=vid_data.video_url,
-                thumbnail_url=vid_data.thumbnail_url or "",
-                title=vid_data.title or "",
-                duration=vid_data.duration or 0,
-                display_order=vid_data.display_order
-            )
-            db.add(new_video)
+        media_changed |= sync_videos(db, project_id, project_in.videos)
+    
+    # Cambios sólo de media no tocan columnas del proyecto: marcar
+    # updated_at para que los ETag de detalle y listado cambien
+    if media_changed:
+        db_project.updated_at = datetime.utcnow()
     
     db.commit()
-    db.refresh(db_project)
+    _invalidate_cache(project_id)
     
-    return db_project
+    return _load_project(db, project_id)
 
 
 @router.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -243,6 +608,7 @@ def delete_project(
     
     db.delete(db_project)
     db.commit()
+    _invalidate_cache(project_id)
     
     return None
 
@@ -269,6 +635,6 @@ def toggle_publish(
     db_project.published = not db_project.published
     
     db.commit()
-    db.refresh(db_project)
+    _invalidate_cache(project_id)
     
-    return db_project
+    return _load_project(db, project_id)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import List
 from dotenv import load_dotenv
 
@@ -7,27 +8,116 @@ class Settings:
         # IMPORTANTE: Cargar .env antes de leer variables
         load_dotenv()
         
-        # DEBUG: Imprimir para ver qué está leyendo
-        db_url = os.environ.get("DATABASE_URL")
-        print(f"🔍 DEBUG: DATABASE_URL from env = {db_url[:50] if db_url else 'NOT SET'}...")
-        print(f"🔍 DEBUG: All env vars with DATABASE: {[k for k in os.environ.keys() if 'DATABASE' in k]}")
-        
         # Leer variables
-        self.DATABASE_URL = db_url
+        self.DATABASE_URL = os.environ.get("DATABASE_URL")
         self.SECRET_KEY = os.environ.get("SECRET_KEY")
         self.ALGORITHM = os.environ.get("ALGORITHM", "HS256")
         self.ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+        self.REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
         self.ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
         self.DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
         self.ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
         
+        # Pool de conexiones (por engine y por proceso): dimensionar con
+        # workers * (POOL_SIZE + MAX_OVERFLOW) <= límite de conexiones de Postgres
+        self.DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+        # Reciclar antes de que el proxy de Railway corte conexiones ociosas (-1 = nunca)
+        self.DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+        self.DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "True").lower() == "true"
+        
+        # Réplicas de lectura (URLs separadas por coma) para los GET públicos;
+        # una réplica que falla queda fuera de la rotación REPLICA_RETRY_SECONDS
+        self.DATABASE_REPLICA_URLS = os.environ.get("DATABASE_REPLICA_URLS", "")
+        self.REPLICA_RETRY_SECONDS = float(os.environ.get("REPLICA_RETRY_SECONDS", "30"))
+        # Tras invalidar la cache de proyectos, los GET leen del primario
+        # este tiempo (el lag de replicación tolerado) para no cachear datos viejos
+        self.REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", "5"))
+        
+        # Sesiones async (asyncpg / aiosqlite) en los endpoints de lectura
+        # de proyectos y en auth; por defecto se usa el engine sync
+        self.DATABASE_ASYNC = os.environ.get("DATABASE_ASYNC", "False").lower() == "true"
+        
+        # Compresión de respuestas (br si está instalado brotli, si no gzip)
+        self.COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+        self.GZIP_LEVEL = int(os.environ.get("GZIP_LEVEL", "6"))
+        self.BROTLI_QUALITY = int(os.environ.get("BROTLI_QUALITY", "5"))
+        
+        # Carpeta del snapshot del catálogo publicado ("" = deshabilitado)
+        self.SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", "")
+        
+        # Cache en memoria de lecturas públicas de proyectos (0 = deshabilitada)
+        self.PROJECT_CACHE_MAX_ENTRIES = int(os.environ.get("PROJECT_CACHE_MAX_ENTRIES", "256"))
+        self.PROJECT_CACHE_TTL_SECONDS = int(os.environ.get("PROJECT_CACHE_TTL_SECONDS", "300"))
+        
+        # Cache token → usuario de get_current_user (0 = deshabilitada). Al
+        # desactivar/eliminar un usuario se invalida; AUTH_CACHE_STAMP_FILE
+        # (un archivo compartido, por defecto en el directorio temporal del
+        # host) propaga eso entre workers y scripts. "" = sólo en el proceso
+        self.AUTH_CACHE_MAX_ENTRIES = int(os.environ.get("AUTH_CACHE_MAX_ENTRIES", "1024"))
+        self.AUTH_CACHE_TTL_SECONDS = int(os.environ.get("AUTH_CACHE_TTL_SECONDS", "60"))
+        self.AUTH_CACHE_STAMP_FILE = os.environ.get(
+            "AUTH_CACHE_STAMP_FILE", os.path.join(tempfile.gettempdir(), "sitecel-auth-cache.stamp")
+        )
+        
+        # Executor dedicado para bcrypt ("thread" o "process"): a lo sumo
+        # PASSWORD_WORKERS en curso y PASSWORD_QUEUE_LIMIT esperando; el
+        # resto de los logins recibe 503 sin esperar
+        self.PASSWORD_EXECUTOR = os.environ.get("PASSWORD_EXECUTOR", "thread").lower()
+        self.PASSWORD_WORKERS = int(os.environ.get("PASSWORD_WORKERS", "2"))
+        self.PASSWORD_QUEUE_LIMIT = int(os.environ.get("PASSWORD_QUEUE_LIMIT", "16"))
+        
+        # Límite de intentos de login (token bucket) por IP y por cuenta:
+        # BURST intentos seguidos y luego PER_MINUTE por minuto. Detrás de
+        # TRUSTED_PROXY_HOPS proxies la IP sale de X-Forwarded-For (en
+        # Railway, 1 por defecto: su proxy agrega la IP real al final).
+        # Backend "memory" (por proceso) o "paquete.modulo:Fabrica"
+        self.TRUSTED_PROXY_HOPS = int(os.environ.get(
+            "TRUSTED_PROXY_HOPS", "1" if os.environ.get("RAILWAY_ENVIRONMENT") else "0"
+        ))
+        self.LOGIN_THROTTLE_BACKEND = os.environ.get("LOGIN_THROTTLE_BACKEND", "memory")
+        self.LOGIN_THROTTLE_MAX_KEYS = int(os.environ.get("LOGIN_THROTTLE_MAX_KEYS", "10000"))
+        self.LOGIN_IP_BURST = float(os.environ.get("LOGIN_IP_BURST", "20"))
+        self.LOGIN_IP_PER_MINUTE = float(os.environ.get("LOGIN_IP_PER_MINUTE", "10"))
+        self.LOGIN_ACCOUNT_BURST = float(os.environ.get("LOGIN_ACCOUNT_BURST", "5"))
+        self.LOGIN_ACCOUNT_PER_MINUTE = float(os.environ.get("LOGIN_ACCOUNT_PER_MINUTE", "5"))
+        
+        # Logging JSON en segundo plano: nivel general, niveles por logger
+        # ("app.api.deps=DEBUG,sqlalchemy.engine=INFO"), fracción de los
+        # DEBUG que se escriben y tamaño de la cola (lo que no entra se descarta)
+        self.LOG_LEVEL = os.environ.get("LOG_LEVEL", "DEBUG" if self.DEBUG else "INFO").upper()
+        self.LOG_LEVELS = os.environ.get("LOG_LEVELS", "")
+        self.LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+        self.LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+        
         # Validar
         if not self.DATABASE_URL:
             raise ValueError(f"❌ DATABASE_URL is required but got: {self.DATABASE_URL}")
         if not self.SECRET_KEY:
             raise ValueError(f"❌ SECRET_KEY is required")
-            
-        print(f"✅ Config loaded: DB={self.DATABASE_URL[:30]}... ENV={self.ENVIRONMENT}")
+    
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    
+    @property
+    def async_database_url(self) -> str:
+        """DATABASE_URL con el driver async equivalente."""
+        return self.to_async_url(self.DATABASE_URL)
+    
+    @staticmethod
+    def to_async_url(url: str) -> str:
+        """URL de DB con el driver async equivalente (asyncpg / aiosqlite)."""
+        for prefix, async_prefix in (
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+            ("postgres://", "postgresql+asyncpg://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(prefix):
+                return async_prefix + url[len(prefix):]
+        return url
     
     @property
     def cors_origins(self) -> List[str]:
@@ -0,0 +1,141 @@
+import atexit
+import copy
+import logging
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import orjson
+
+# Atributos propios de LogRecord: todo lo demás viene de `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Campos que nunca se escriben aunque lleguen en `extra=`
+REDACTED_FIELDS = {
+    "password", "hashed_password", "token", "access_token", "refresh_token",
+    "authorization", "secret", "secret_key", "api_key",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro: ts, level, logger, message, campos extra y exc."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key in _RECORD_ATTRS or key.startswith("_"):
+                continue
+            entry[key] = "[redacted]" if key.lower() in REDACTED_FIELDS else value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        elif record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode("utf-8")
+
+
+class DebugSampler(logging.Filter):
+    """Dejar pasar sólo una fracción `rate` de los registros DEBUG (por request)."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler con cola acotada: si la cola está llena el registro se
+    descarta (y se cuenta) en vez de bloquear el request.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # La cola es en memoria: no hace falta serializar. Sólo se fijan
+        # el mensaje y el traceback ahora; el JSON se arma en el listener
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            type(self).dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """`"app.api.deps=DEBUG,sqlalchemy.engine=INFO"` → {logger: nivel}."""
+    levels = {}
+    for part in spec.split(","):
+        name, _, level = part.strip().partition("=")
+        if name and level:
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(settings) -> None:
+    """
+    Configurar el logging de la app una sola vez por proceso.
+
+    Los handlers del root sólo encolan el registro; un hilo
+    (QueueListener) lo formatea como JSON y lo escribe en stdout, fuera
+    del request. Niveles: LOG_LEVEL para el root y LOG_LEVELS por logger;
+    los DEBUG se muestrean con LOG_DEBUG_SAMPLE_RATE.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return
+
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(JsonFormatter())
+
+        handler = _DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+        handler.addFilter(DebugSampler(settings.LOG_DEBUG_SAMPLE_RATE))
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(settings.LOG_LEVEL)
+        for name, level in parse_levels(settings.LOG_LEVELS).items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = QueueListener(handler.queue, stream, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Vaciar la cola y detener el hilo de escritura."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def dropped_records() -> int:
+    return _DroppingQueueHandler.dropped
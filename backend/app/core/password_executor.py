@@ -0,0 +1,116 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordExecutorBusy(Exception):
+    """Hay más trabajos de bcrypt en curso y en cola de los permitidos."""
+
+
+class PasswordExecutor:
+    """
+    Executor dedicado y acotado para bcrypt (verify / hash).
+
+    bcrypt es CPU puro (~100-300 ms por llamada): en el threadpool
+    compartido de Starlette una ráfaga de logins ocupa todos sus hilos y
+    frena al resto de los endpoints. Acá corre en su propio pool:
+
+    - `kind="thread"`: hilos (el backend bcrypt libera el GIL mientras hashea)
+    - `kind="process"`: procesos (spawn), paralelismo real sin GIL
+    - Como máximo `workers` trabajos corriendo y `queue_limit` esperando;
+      más allá de eso run() falla de inmediato con PasswordExecutorBusy
+    """
+
+    def __init__(self, kind: str, workers: int, queue_limit: int):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"PASSWORD_EXECUTOR inválido: {kind} (usar 'thread' o 'process')")
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> Executor:
+        # Se crea al primer uso: los procesos no se levantan si nadie hace login
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="bcrypt",
+                    )
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Ejecutar `fn(*args)` en el pool sin bloquear el event loop.
+
+        Raises:
+            PasswordExecutorBusy: Si ya hay workers + queue_limit trabajos
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.queue_limit:
+                self._rejected += 1
+                raise PasswordExecutorBusy()
+            self._pending += 1
+        try:
+            executor = self._get_executor()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # Un worker murió: descartar el pool, el próximo trabajo crea otro
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self.run(get_password_hash, password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+
+# Instancia global usada por login
+password_executor = PasswordExecutor(
+    kind=settings.PASSWORD_EXECUTOR,
+    workers=settings.PASSWORD_WORKERS,
+    queue_limit=settings.PASSWORD_QUEUE_LIMIT,
+)
@@ -1,9 +1,13 @@
+import hashlib
+import logging
+import secrets
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verificar password - truncar a 72 bytes para bcrypt"""
@@ -13,8 +17,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         # Volver a string
         truncated_password = password_bytes.decode('utf-8', errors='ignore')
         return pwd_context.verify(truncated_password, hashed_password)
-    except Exception as e:
-        print(f"❌ Error verificando password: {e}")
+    except Exception:
+        logger.exception("password verification failed")
         return False
 
 def get_password_hash(password: str) -> str:
@@ -25,8 +29,8 @@ def get_password_hash(password: str) -> str:
         # Volver a string
         truncated_password = password_bytes.decode('utf-8', errors='ignore')
         return pwd_context.hash(truncated_password)
-    except Exception as e:
-        print(f"❌ Error hasheando password: {e}")
+    except Exception:
+        logger.exception("password hashing failed")
         raise
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -46,4 +50,12 @@ def verify_token(token: str) -> dict | None:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+def create_refresh_token() -> str:
+    """Refresh token opaco: 256 bits aleatorios (no es un JWT)"""
+    return secrets.token_urlsafe(32)
+
+def hash_refresh_token(token: str) -> str:
+    """Hash para guardar el refresh token: SHA-256 alcanza (el token ya es aleatorio)"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
\ No newline at end of file
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+# Límites superiores (ms) de los buckets del histograma de espera de checkout
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """
+    Métricas de un pool de conexiones.
+
+    - Espera de checkout (histograma, promedio y máximo), medida en
+      `_do_get` del pool: incluye abrir la conexión si hay que crearla
+    - Checkouts que agotaron `pool_timeout`
+    - Fallos del pre-ping (conexiones muertas que se reabrieron)
+    - Estado actual del pool (en uso, overflow, libres) al pedir el snapshot
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Optional[Engine] = None
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._waits = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._timeouts = 0
+        self._pre_ping_failures = 0
+
+    def observe_wait(self, elapsed_ms: float) -> None:
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self._buckets[index] += 1
+            self._waits += 1
+            self._wait_total_ms += elapsed_ms
+            self._wait_max_ms = max(self._wait_max_ms, elapsed_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def _on_error(self, context) -> None:
+        if getattr(context, "is_pre_ping", False):
+            with self._lock:
+                self._pre_ping_failures += 1
+
+    def watch(self, engine: Engine) -> None:
+        """Asociar el engine (sync; para uno async, su `sync_engine`)."""
+        self.engine = engine
+        event.listen(engine, "handle_error", self._on_error)
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            labels = [str(bound) for bound in WAIT_BUCKETS_MS] + ["+Inf"]
+            stats = {
+                "name": self.name,
+                "checkout_wait_ms": {
+                    "count": self._waits,
+                    "mean": round(self._wait_total_ms / self._waits, 3) if self._waits else 0.0,
+                    "max": round(self._wait_max_ms, 3),
+                    # Conteos por bucket (no acumulados), clave = límite superior en ms
+                    "buckets": dict(zip(labels, self._buckets)),
+                },
+                "timeouts": self._timeouts,
+                "pre_ping_failures": self._pre_ping_failures,
+            }
+        if pool is not None and hasattr(pool, "checkedout"):
+            stats.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "timeout_seconds": pool.timeout(),
+            })
+        return stats
+
+
+# Un PoolMetrics por engine, en orden de creación
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def instrumented_pool(name: str, base: type) -> type:
+    """
+    Subclase de `base` (QueuePool / AsyncAdaptedQueuePool) que registra la
+    espera de cada checkout en el PoolMetrics `name`.
+
+    Las métricas van en la clase para que sobrevivan a `pool.recreate()`
+    (engine.dispose), que instancia `self.__class__`.
+    """
+    metrics = _registry.setdefault(name, PoolMetrics(name))
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.observe_wait((time.perf_counter() - started) * 1000)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    InstrumentedPool.__qualname__ = InstrumentedPool.__name__
+    return InstrumentedPool
+
+
+def watch_engine(name: str, engine: Engine) -> None:
+    """Asociar el engine creado con `instrumented_pool(name, ...)` a sus métricas."""
+    _registry.setdefault(name, PoolMetrics(name)).watch(engine)
+
+
+def pool_stats() -> List[dict]:
+    """Snapshot de todos los pools registrados."""
+    return [metrics.snapshot() for metrics in _registry.values()]
@@ -0,0 +1,76 @@
+import itertools
+import time
+from dataclasses import dataclass
+from typing import List
+
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: object  # Engine o AsyncEngine
+    down_until: float = 0.0
+    failures: int = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+
+class ReplicaRouter:
+    """
+    Elegir réplica de lectura: round-robin entre las sanas, con failover.
+
+    Una réplica que falla al entregar una conexión queda fuera de la
+    rotación por `retry_seconds`; si no hay ninguna disponible, quien
+    llama usa el primario.
+    """
+
+    def __init__(self, replicas: List[Replica], retry_seconds: float):
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._turn = itertools.count()
+
+    def candidates(self) -> List[Replica]:
+        """Réplicas sanas, empezando por la que sigue en turno."""
+        if not self.replicas:
+            return []
+        start = next(self._turn) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.healthy]
+
+    def mark_down(self, replica: Replica) -> None:
+        replica.failures += 1
+        replica.down_until = time.monotonic() + self.retry_seconds
+
+    def connect(self):
+        """
+        Conexión (sync) a la siguiente réplica sana, o None si no hay.
+
+        Con pool_pre_ping el checkout ya valida la conexión, así una réplica
+        caída se detecta aquí y se pasa a la siguiente; también una con el
+        pool agotado (pool_timeout vencido) o que no responde.
+        """
+        for replica in self.candidates():
+            try:
+                return replica.engine.connect()
+            except (DBAPIError, PoolTimeoutError):
+                self.mark_down(replica)
+        return None
+
+    async def connect_async(self):
+        """Como connect(), para réplicas con AsyncEngine."""
+        for replica in self.candidates():
+            try:
+                return await replica.engine.connect()
+            except (DBAPIError, PoolTimeoutError):
+                self.mark_down(replica)
+        return None
+
+    def stats(self) -> List[dict]:
+        return [
+            {"name": replica.name, "healthy": replica.healthy, "failures": replica.failures}
+            for replica in self.replicas
+        ]
+
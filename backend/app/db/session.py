@@ -1,21 +1,81 @@
 ﻿from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from app.db.pool_metrics import instrumented_pool, watch_engine
+from app.db.replicas import Replica, ReplicaRouter
 
 # Usar DATABASE_URL de settings (que lee de variables de entorno)
 DATABASE_URL = settings.DATABASE_URL
 
+def pool_options(name: str, pool_class: type = QueuePool) -> dict:
+    """Opciones de pool desde Settings, con métricas registradas como `name`."""
+    return {
+        "poolclass": instrumented_pool(name, pool_class),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 # Crear engine
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    echo=False
+    echo=False,
+    **pool_options("primary")
 )
+watch_engine("primary", engine)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Réplicas de lectura (DATABASE_REPLICA_URLS). Sin réplicas todo va al primario
+replica_router = ReplicaRouter(
+    [
+        Replica(f"replica-{i}", create_engine(url, echo=False, **pool_options(f"replica-{i}")))
+        for i, url in enumerate(settings.replica_urls, start=1)
+    ],
+    settings.REPLICA_RETRY_SECONDS
+)
+for replica in replica_router.replicas:
+    watch_engine(replica.name, replica.engine)
+
+# Engine async opcional (DATABASE_ASYNC=true). Requiere asyncpg para
+# Postgres o aiosqlite para SQLite
+async_engine = None
+AsyncSessionLocal = None
+async_replica_router = None
+
+if settings.DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        echo=False,
+        **pool_options("primary_async", AsyncAdaptedQueuePool)
+    )
+    watch_engine("primary_async", async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
+    async_replica_router = ReplicaRouter(
+        [
+            Replica(
+                f"{replica.name}_async",
+                create_async_engine(
+                    settings.to_async_url(url),
+                    echo=False,
+                    **pool_options(f"{replica.name}_async", AsyncAdaptedQueuePool)
+                )
+            )
+            for replica, url in zip(replica_router.replicas, settings.replica_urls)
+        ],
+        settings.REPLICA_RETRY_SECONDS
+    )
+    for replica in async_replica_router.replicas:
+        watch_engine(replica.name, replica.engine.sync_engine)
+
 # Base para los modelos
 Base = declarative_base()
 
@@ -1,11 +1,30 @@
-﻿from fastapi import FastAPI
+﻿import logging
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import projects, auth, chat
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import make_url
+from app.api.compression import CompressionMiddleware
+from app.api.v1 import projects, categories, catalog, auth, chat, metrics
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.core.password_executor import password_executor
+
+# Logging JSON en segundo plano (antes que nada para no perder registros)
+setup_logging(settings)
+logger = logging.getLogger(__name__)
+logger.info(
+    "config loaded",
+    extra={
+        "database": make_url(settings.DATABASE_URL).render_as_string(hide_password=True),
+        "environment": settings.ENVIRONMENT,
+    },
+)
 
 app = FastAPI(
     title="Sitecel API",
     description="API para gestion de proyectos de Sitecel Technology",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -14,12 +33,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Compresión br/gzip según Accept-Encoding (queda por fuera de CORS)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # Incluir router de proyectos
 app.include_router(projects.router, prefix="/api/v1", tags=["projects"])
+app.include_router(categories.router, prefix="/api/v1", tags=["categories"])
+app.include_router(catalog.router, prefix="/api/v1", tags=["catalog"])
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(chat.router, prefix="/api/v1", tags=["chat"])
+app.include_router(metrics.router, prefix="/api/v1", tags=["metrics"])
+
+# Cerrar el pool de bcrypt (hilos o procesos) al apagar
+app.add_event_handler("shutdown", password_executor.shutdown)
 
 @app.get("/")
 def root():
@@ -1,4 +1,4 @@
 from app.models.project import Category, Project, ProjectImage, ProjectVideo
-from app.models.user import User
+from app.models.user import RefreshToken, User
 
-__all__ = ["Category", "Project", "ProjectImage", "ProjectVideo", "User"]
+__all__ = ["Category", "Project", "ProjectImage", "ProjectVideo", "RefreshToken", "User"]
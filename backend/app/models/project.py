@@ -1,5 +1,5 @@
-﻿from sqlalchemy import Column, String, Text, Boolean, Date, DateTime, Integer, ARRAY, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+﻿from sqlalchemy import Column, String, Text, Boolean, Date, DateTime, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -54,8 +54,18 @@ class Project(Base):
     
     # Relaciones
     category_rel = relationship("Category", back_populates="projects")
-    images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan")
-    videos = relationship("ProjectVideo", back_populates="project", cascade="all, delete-orphan")
+    images = relationship(
+        "ProjectImage",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        order_by="ProjectImage.display_order",
+    )
+    videos = relationship(
+        "ProjectVideo",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        order_by="ProjectVideo.display_order",
+    )
     
     def __repr__(self):
         return f"<Project(slug='{self.slug}', title='{self.title}')>"
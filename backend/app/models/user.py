@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
@@ -18,4 +18,24 @@ class User(Base):
     
     def __repr__(self):
         return f"<User(email='{self.email}')>"
-    
\ No newline at end of file
+
+
+class RefreshToken(Base):
+    """
+    Refresh token emitido en el login. Sólo se guarda su hash (SHA-256:
+    el token es aleatorio de 256 bits, no hace falta bcrypt). Cada uso lo
+    revoca y emite otro de la misma familia; si se presenta uno ya
+    revocado se revoca la familia completa (token robado).
+    """
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False, index=True)
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<RefreshToken(user_id='{self.user_id}', family_id='{self.family_id}')>"
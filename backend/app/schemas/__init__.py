@@ -1,3 +1,4 @@
+from app.schemas.category import CategoryRead
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -5,17 +6,26 @@ from app.schemas.project import (
     ProjectList,
     ProjectImageCreate,
     ProjectImageRead,
+    ProjectImageUpdate,
     ProjectVideoCreate,
-    ProjectVideoRead
+    ProjectVideoRead,
+    ProjectVideoUpdate,
+    ProjectImportFailure,
+    ProjectImportResult
 )
 
 __all__ = [
+    "CategoryRead",
     "ProjectCreate",
     "ProjectUpdate", 
     "ProjectRead",
     "ProjectList",
     "ProjectImageCreate",
     "ProjectImageRead",
+    "ProjectImageUpdate",
     "ProjectVideoCreate",
-    "ProjectVideoRead"
+    "ProjectVideoRead",
+    "ProjectVideoUpdate",
+    "ProjectImportFailure",
+    "ProjectImportResult"
 ]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class CategoryRead(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    icon: Optional[str] = None
+    display_order: Optional[int] = 0
+    project_count: int = 0
+
+    class Config:
+        from_attributes = True
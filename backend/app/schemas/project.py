@@ -1,5 +1,5 @@
 ﻿from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import date, datetime
 from uuid import UUID
 import re
@@ -17,6 +17,10 @@ class ProjectImageBase(BaseModel):
 class ProjectImageCreate(ProjectImageBase):
     pass
 
+class ProjectImageUpdate(ProjectImageBase):
+    # Si viene, identifica la imagen existente a conservar/actualizar
+    id: Optional[UUID] = None
+
 class ProjectImageRead(ProjectImageBase):
     id: UUID
     project_id: UUID
@@ -40,6 +44,10 @@ class ProjectVideoBase(BaseModel):
 class ProjectVideoCreate(ProjectVideoBase):
     pass
 
+class ProjectVideoUpdate(ProjectVideoBase):
+    # Si viene, identifica el video existente a conservar/actualizar
+    id: Optional[UUID] = None
+
 class ProjectVideoRead(ProjectVideoBase):
     id: UUID
     project_id: UUID
@@ -89,8 +97,8 @@ class ProjectUpdate(BaseModel):
     duration: Optional[str] = Field(None, max_length=50)
     tags: Optional[List[str]] = None
     highlights: Optional[List[str]] = None
-    images: Optional[List[ProjectImageCreate]] = None  # ← AGREGAR
-    videos: Optional[List[ProjectVideoCreate]] = None  # ← AGREGAR
+    images: Optional[List[ProjectImageUpdate]] = None  # ← AGREGAR
+    videos: Optional[List[ProjectVideoUpdate]] = None  # ← AGREGAR
 
 class ProjectRead(ProjectBase):
     id: UUID
@@ -123,3 +131,29 @@ class ProjectList(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class ProjectListWithFacets(BaseModel):
+    """Respuesta de GET /projects con `facets`: la página y los conteos por faceta"""
+    items: List[ProjectList]
+    facets: Dict[str, List[FacetCount]]
+
+
+# ============================================================================
+# SCHEMAS PARA IMPORTACIÓN MASIVA
+# ============================================================================
+
+class ProjectImportFailure(BaseModel):
+    line: int
+    slug: Optional[str] = None
+    error: str
+
+class ProjectImportResult(BaseModel):
+    received: int
+    created: int
+    failed: int
+    errors: List[ProjectImportFailure] = []
@@ -1,8 +1,11 @@
 from google import genai
 from google.genai import types
+import logging
 import os
 from typing import List, Dict
 
+logger = logging.getLogger(__name__)
+
 class AIService:
     def __init__(self):
         """Inicializar servicio de IA con Gemini"""
@@ -113,8 +116,8 @@ Asistente: "Entiendo, un calefón que no funciona es urgente. ¿Es un calefón a
             
             return response.text
             
-        except Exception as e:
-            print(f"Error en AIService.chat: {str(e)}")
+        except Exception:
+            logger.exception("AIService.chat failed")
             return "Disculpa, estoy teniendo problemas técnicos en este momento. Por favor, contacta directamente a contacto@sitecel.cl"
 
 # Instancia global del servicio
@@ -0,0 +1,206 @@
+import importlib
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class BucketRule:
+    """Token bucket: hasta `capacity` intentos seguidos, recarga `per_minute`."""
+    capacity: float
+    per_minute: float
+
+    @property
+    def per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+class ThrottleBackend(ABC):
+    """
+    Almacén de buckets. El de memoria es por proceso; para compartir los
+    límites entre workers se implementa esta interfaz sobre un almacén
+    compartido (p. ej. Redis) y se configura con LOGIN_THROTTLE_BACKEND.
+    """
+
+    @abstractmethod
+    def take(self, key: str, rule: BucketRule) -> Tuple[bool, float]:
+        """
+        Consumir un token de `key`. Retorna (permitido, segundos hasta
+        que haya un token disponible si no lo está).
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Dejar el bucket de `key` lleno."""
+
+    def size(self) -> int:
+        return 0
+
+
+class MemoryThrottleBackend(ThrottleBackend):
+    """
+    Buckets en memoria del proceso, acotados por cantidad de claves.
+
+    Sólo se descartan buckets que ya se recargaron por completo (equivalen
+    a no tener entrada): llenar la tabla con claves inventadas no borra el
+    bucket de una cuenta atacada. Si la tabla está llena de buckets
+    todavía en uso, las claves nuevas se rechazan hasta que se liberen.
+    """
+
+    # Buckets más antiguos revisados por cada clave nueva con la tabla llena
+    EVICT_SCAN = 64
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        # clave → (tokens, instante de la última recarga, instante en que queda lleno)
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rule: BucketRule) -> Tuple[bool, float]:
+        now = self.clock()
+        with self._lock:
+            if key not in self._buckets and not self._make_room(now):
+                # Tabla llena de buckets activos: rechazar antes que olvidar uno
+                return False, self._retry_after(0.0, rule)
+            tokens, updated, _ = self._buckets.get(key, (rule.capacity, now, now))
+            tokens = min(rule.capacity, tokens + (now - updated) * rule.per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            full_at = now + (rule.capacity - tokens) / rule.per_second if rule.per_second > 0 else math.inf
+            self._buckets[key] = (tokens, now, full_at)
+            self._buckets.move_to_end(key)
+        if allowed:
+            return True, 0.0
+        return False, self._retry_after(tokens, rule)
+
+    @staticmethod
+    def _retry_after(tokens: float, rule: BucketRule) -> float:
+        """Segundos hasta que `tokens` llegue a 1."""
+        if tokens >= 1:
+            return 0.0
+        return (1 - tokens) / rule.per_second if rule.per_second > 0 else math.inf
+
+    def _make_room(self, now: float) -> bool:
+        # Llamar con el lock tomado
+        if len(self._buckets) < self.max_keys:
+            return True
+        for key, (_, _, full_at) in list(self._buckets.items())[:self.EVICT_SCAN]:
+            if full_at <= now:
+                del self._buckets[key]
+        return len(self._buckets) < self.max_keys
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._buckets)
+
+
+class LoginThrottle:
+    """
+    Límite de intentos de login por IP y por cuenta (email), evaluado
+    antes de tocar la DB o bcrypt.
+
+    - Por IP: frena a un cliente que prueba muchas cuentas
+    - Por cuenta: frena el ataque distribuido contra un mismo email; un
+      login exitoso deja su bucket lleno
+    """
+
+    def __init__(self, backend: ThrottleBackend, ip_rule: BucketRule, account_rule: BucketRule):
+        self.backend = backend
+        self.ip_rule = ip_rule
+        self.account_rule = account_rule
+        self._lock = threading.Lock()
+        self._allowed = 0
+        self._rejected_ip = 0
+        self._rejected_account = 0
+
+    @staticmethod
+    def account_key(email: str) -> str:
+        return f"login:account:{email.strip().lower()}"
+
+    @staticmethod
+    def ip_key(ip: str) -> str:
+        return f"login:ip:{ip}"
+
+    def check(self, ip: Optional[str], email: str) -> Optional[float]:
+        """
+        Registrar un intento. Retorna None si está permitido, o los
+        segundos a esperar si se rechaza.
+        """
+        if ip:
+            allowed, retry_after = self.backend.take(self.ip_key(ip), self.ip_rule)
+            if not allowed:
+                with self._lock:
+                    self._rejected_ip += 1
+                return retry_after
+
+        allowed, retry_after = self.backend.take(self.account_key(email), self.account_rule)
+        if not allowed:
+            with self._lock:
+                self._rejected_account += 1
+            return retry_after
+
+        with self._lock:
+            self._allowed += 1
+        return None
+
+    def succeeded(self, email: str) -> None:
+        self.backend.reset(self.account_key(email))
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "keys": self.backend.size(),
+                "allowed": self._allowed,
+                "rejected_ip": self._rejected_ip,
+                "rejected_account": self._rejected_account,
+            }
+
+
+def resolve_client_ip(forwarded_for: Optional[str], peer: Optional[str]) -> Optional[str]:
+    """
+    IP del cliente para el límite por IP. Con TRUSTED_PROXY_HOPS > 0 es la
+    entrada de X-Forwarded-For que agregó el primer proxy confiable,
+    contando desde el final: las anteriores las manda el cliente y no
+    sirven para identificarlo. Sin el header (o con menos entradas) se usa
+    `peer`, la IP de la conexión.
+    """
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops > 0 and forwarded_for:
+        hosts = [host.strip() for host in forwarded_for.split(",") if host.strip()]
+        if len(hosts) >= hops:
+            return hosts[-hops]
+    return peer
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+def _create_backend(name: str) -> ThrottleBackend:
+    """`memory` o la ruta `paquete.modulo:Fabrica` de otro backend."""
+    if name == "memory":
+        return MemoryThrottleBackend(max_keys=settings.LOGIN_THROTTLE_MAX_KEYS)
+    module_name, _, attr = name.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr)
+    return factory()
+
+
+# Instancia global usada por login
+login_throttle = LoginThrottle(
+    backend=_create_backend(settings.LOGIN_THROTTLE_BACKEND),
+    ip_rule=BucketRule(settings.LOGIN_IP_BURST, settings.LOGIN_IP_PER_MINUTE),
+    account_rule=BucketRule(settings.LOGIN_ACCOUNT_BURST, settings.LOGIN_ACCOUNT_PER_MINUTE),
+)
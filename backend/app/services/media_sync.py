@@ -0,0 +1,126 @@
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.project import ProjectImage, ProjectVideo
+
+
+IMAGE_FIELDS = ["url", "alt_text", "caption", "display_order"]
+VIDEO_FIELDS = ["video_url", "thumbnail_url", "title", "duration", "display_order"]
+
+
+def _image_values(item) -> dict:
+    return {
+        "url": item.url,
+        "alt_text": item.alt_text or "",
+        "caption": item.caption or "",
+        "display_order": item.display_order,
+    }
+
+
+def _video_values(item) -> dict:
+    return {
+        "video_url": item.video_url,
+        "thumbnail_url": item.thumbnail_url or "",
+        "title": item.title or "",
+        "duration": item.duration or 0,
+        "display_order": item.display_order,
+    }
+
+
+def _same(stored, value) -> bool:
+    # insert_media guarda NULL donde los valores de arriba usan "" / 0
+    return stored == value or (stored is None and value in ("", 0))
+
+
+def _sync(
+    db: Session,
+    model,
+    project_id,
+    items: list,
+    url_field: str,
+    fields: List[str],
+    to_values: Callable[[object], Dict]
+) -> bool:
+    """
+    Llevar la media de un proyecto al estado de `items` con el mínimo de
+    escrituras, conservando id y created_at de las filas que siguen.
+
+    Cada item se empareja con una fila existente por `id` o, si no trae
+    id, por URL. Luego: un DELETE para las filas sobrantes, un UPDATE
+    (por lotes) sólo para las que cambiaron y un INSERT multi-fila para
+    las nuevas. Retorna True si hubo algún cambio.
+    """
+    columns = [model.id] + [getattr(model, name) for name in fields]
+    rows = db.execute(select(*columns).where(model.project_id == project_id)).mappings().all()
+
+    by_id = {row["id"]: row for row in rows}
+    by_url: Dict[str, List] = {}
+    for row in rows:
+        by_url.setdefault(row[url_field], []).append(row)
+
+    matched = set()
+    inserts, updates = [], []
+    for item in items:
+        values = to_values(item)
+        row = None
+        item_id = getattr(item, "id", None)
+        if item_id is not None and item_id in by_id and item_id not in matched:
+            row = by_id[item_id]
+        else:
+            for candidate in by_url.get(values[url_field], ()):
+                if candidate["id"] not in matched:
+                    row = candidate
+                    break
+
+        if row is None:
+            inserts.append({"id": uuid.uuid4(), "project_id": project_id, **values})
+            continue
+
+        matched.add(row["id"])
+        changed = {name: value for name, value in values.items() if not _same(row[name], value)}
+        if changed:
+            updates.append({"id": row["id"], **changed})
+
+    deletes = [row_id for row_id in by_id if row_id not in matched]
+
+    if deletes:
+        db.execute(delete(model).where(model.id.in_(deletes)))
+    if updates:
+        db.execute(update(model), updates)
+    if inserts:
+        db.execute(insert(model), inserts)
+
+    return bool(deletes or updates or inserts)
+
+
+def sync_images(db: Session, project_id, items: list) -> bool:
+    """Sincronizar las imágenes de un proyecto (ver _sync)."""
+    return _sync(db, ProjectImage, project_id, items, "url", IMAGE_FIELDS, _image_values)
+
+
+def sync_videos(db: Session, project_id, items: list) -> bool:
+    """Sincronizar los videos de un proyecto (ver _sync)."""
+    return _sync(db, ProjectVideo, project_id, items, "video_url", VIDEO_FIELDS, _video_values)
+
+
+def insert_media(db: Session, model, project_id, items: list) -> List[dict]:
+    """
+    Insertar la media de un proyecto nuevo con un INSERT multi-fila.
+
+    Los valores por defecto (id, created_at) se fijan aquí para poder
+    armar la respuesta con las filas retornadas, ordenadas por
+    display_order como la relación, sin volver a consultar.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {"id": uuid.uuid4(), "project_id": project_id, "created_at": now, **item.model_dump()}
+        for item in items
+    ]
+    if rows:
+        db.execute(insert(model), rows)
+    rows.sort(key=lambda row: row["display_order"])
+    return rows
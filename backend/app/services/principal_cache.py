@@ -0,0 +1,172 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Usuario autenticado, desacoplado de la sesión de DB: lo que
+    get_current_user entrega a los endpoints (y lo que /me serializa).
+    """
+    id: UUID
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=bool(user.is_active),
+            is_admin=bool(user.is_admin),
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+@dataclass
+class _Entry:
+    principal: Principal
+    expires_at: float
+
+
+class PrincipalCache:
+    """
+    Cache LRU con TTL de token JWT ya verificado → Principal.
+
+    - La clave es un hash del token (no se guardan tokens en memoria)
+    - Una entrada vive a lo sumo `ttl_seconds` y nunca más que el `exp`
+      del token
+    - invalidate_user(email) borra los tokens de ese usuario; si hay
+      `stamp_file`, además lo toca para que los demás procesos (workers,
+      scripts como delete_user.py) vacíen su cache: se revisa su mtime
+      con un stat por lookup
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, stamp_file: str = ""):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stamp_file = stamp_file
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stamp: Optional[int] = self._read_stamp()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Principal]:
+        if not self.enabled:
+            return None
+        self._check_stamp()
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.principal
+
+    def set(self, token: str, principal: Principal, token_expires_at: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        key = self.key(token)
+        with self._lock:
+            self._entries[key] = _Entry(principal, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, email: str) -> int:
+        """
+        Olvidar los tokens de `email` (al desactivar o eliminar el usuario).
+        Retorna cuántas entradas se borraron en este proceso.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.principal.email == email]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+        self._touch_stamp()
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+    def _read_stamp(self) -> Optional[int]:
+        if not self.stamp_file:
+            return None
+        try:
+            return os.stat(self.stamp_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _check_stamp(self) -> None:
+        if not self.stamp_file:
+            return
+        stamp = self._read_stamp()
+        if stamp != self._stamp:
+            with self._lock:
+                self._invalidations += len(self._entries)
+                self._entries.clear()
+            self._stamp = stamp
+
+    def _touch_stamp(self) -> None:
+        if not self.stamp_file:
+            return
+        path = Path(self.stamp_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        # Esta cache ya está al día: no vaciarla otra vez
+        self._stamp = self._read_stamp()
+
+
+# Instancia global usada por get_current_user
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    stamp_file=settings.AUTH_CACHE_STAMP_FILE,
+)
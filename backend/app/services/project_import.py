@@ -0,0 +1,261 @@
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.project import Category, Project, ProjectImage, ProjectVideo
+from app.schemas.project import ProjectCreate
+from app.services.slugs import existing_slugs, first_free_slug, slug_base
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Una línea más larga se reporta como error sin retenerla en memoria
+MAX_LINE_BYTES = 1024 * 1024
+
+
+@dataclass
+class ImportFailure:
+    line: int
+    error: str
+    slug: Optional[str] = None
+
+
+@dataclass
+class ImportReport:
+    received: int = 0
+    created: int = 0
+    errors: List[ImportFailure] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def as_dict(self) -> dict:
+        # Cada chunk reporta por etapa (parseo, categoría, slug, insert):
+        # ordenar por línea para el resumen
+        return {
+            "received": self.received,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": [
+                {"line": e.line, "slug": e.slug, "error": e.error}
+                for e in sorted(self.errors, key=lambda e: e.line)
+            ],
+        }
+
+
+async def aiter_ndjson_chunks(
+    stream: AsyncIterable[bytes],
+    chunk_size: int,
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[List[Tuple[int, Optional[str]]]]:
+    """
+    Partir un body NDJSON que llega por partes en chunks de líneas
+    numeradas (desde 1), sin cargar el body entero en memoria.
+
+    Sólo se parte cada bloque recibido; la línea incompleta se acumula
+    como lista de partes y se une al llegar su fin, así una línea larga
+    que llega en muchos bloques cuesta lineal. Las líneas de más de
+    `max_line_bytes` se descartan a medida que llegan y se entregan como
+    None (import_chunk las reporta).
+    """
+    pending: List[bytes] = []
+    pending_size = 0
+    overlong = False
+    line_number = 0
+    chunk = []
+
+    def finish_line(last_part: bytes) -> Optional[str]:
+        if overlong or pending_size + len(last_part) > max_line_bytes:
+            return None
+        return b"".join(pending + [last_part]).decode("utf-8", errors="replace")
+
+    async for data in stream:
+        *lines, tail = data.split(b"\n")
+        for line in lines:
+            line_number += 1
+            chunk.append((line_number, finish_line(line)))
+            pending, pending_size, overlong = [], 0, False
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if tail and not overlong:
+            if pending_size + len(tail) > max_line_bytes:
+                pending, pending_size, overlong = [], 0, True
+            else:
+                pending.append(tail)
+                pending_size += len(tail)
+    if pending or overlong:
+        chunk.append((line_number + 1, finish_line(b"")))
+    if chunk:
+        yield chunk
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+def _parse(line_number: int, line: str, report: ImportReport) -> Optional[ProjectCreate]:
+    try:
+        return ProjectCreate.model_validate(json.loads(line))
+    except json.JSONDecodeError as e:
+        report.errors.append(ImportFailure(line=line_number, error=f"Invalid JSON: {e.msg}"))
+    except ValidationError as e:
+        report.errors.append(ImportFailure(line=line_number, error=_validation_message(e)))
+    except (TypeError, ValueError) as e:
+        report.errors.append(ImportFailure(line=line_number, error=str(e)))
+    return None
+
+
+def _allocate_slugs(
+    db: Session,
+    records: List[Tuple[int, ProjectCreate]],
+    report: ImportReport
+) -> List[Tuple[int, ProjectCreate]]:
+    """
+    Resolver los slugs de un chunk con una sola query.
+
+    - Slug explícito ya existente (en la DB o antes en el chunk): error
+    - Sin slug: slugify(title) con sufijo -N libre, como create_project
+    """
+    explicit = {record.slug for _, record in records if record.slug}
+    bases = {slug_base(record.title) for _, record in records if not record.slug}
+    taken = existing_slugs(db, bases, exact=explicit)
+
+    accepted = []
+    for line_number, record in records:
+        if record.slug:
+            if record.slug in taken:
+                report.errors.append(ImportFailure(
+                    line=line_number,
+                    slug=record.slug,
+                    error=f"Project with slug '{record.slug}' already exists"
+                ))
+                continue
+        else:
+            record.slug = first_free_slug(slug_base(record.title), taken)
+        taken.add(record.slug)
+        accepted.append((line_number, record))
+    return accepted
+
+
+def _check_categories(
+    db: Session,
+    records: List[Tuple[int, ProjectCreate]],
+    report: ImportReport
+) -> List[Tuple[int, ProjectCreate]]:
+    """Descartar registros con categorías inexistentes (evita abortar el chunk por la FK)."""
+    wanted = {record.category for _, record in records}
+    existing = set(db.scalars(select(Category.id).where(Category.id.in_(wanted)))) if wanted else set()
+    accepted = []
+    for line_number, record in records:
+        if record.category not in existing:
+            report.errors.append(ImportFailure(
+                line=line_number,
+                slug=record.slug,
+                error=f"Category '{record.category}' does not exist"
+            ))
+            continue
+        accepted.append((line_number, record))
+    return accepted
+
+
+def _insert_chunk(db: Session, records: List[Tuple[int, ProjectCreate]]) -> None:
+    """Insertar proyectos, imágenes y videos con INSERTs multi-fila."""
+    project_rows, image_rows, video_rows = [], [], []
+    for _, record in records:
+        project_id = uuid.uuid4()
+        project_rows.append({
+            "id": project_id,
+            **record.model_dump(exclude={"images", "videos"}),
+        })
+        image_rows.extend(
+            {"id": uuid.uuid4(), "project_id": project_id, **image.model_dump()}
+            for image in record.images
+        )
+        video_rows.extend(
+            {"id": uuid.uuid4(), "project_id": project_id, **video.model_dump()}
+            for video in record.videos
+        )
+
+    db.execute(insert(Project), project_rows)
+    if image_rows:
+        db.execute(insert(ProjectImage), image_rows)
+    if video_rows:
+        db.execute(insert(ProjectVideo), video_rows)
+
+
+def import_chunk(db: Session, lines: List[Tuple[int, Optional[str]]], report: ImportReport) -> None:
+    """
+    Validar e insertar un chunk de líneas NDJSON en una transacción.
+
+    Si la transacción falla, todo el chunk se reporta como fallido. Una
+    línea None es una que superó MAX_LINE_BYTES.
+    """
+    records = []
+    for line_number, line in lines:
+        if line is None:
+            report.received += 1
+            report.errors.append(ImportFailure(line=line_number, error="Line too long"))
+            continue
+        if not line.strip():
+            continue
+        report.received += 1
+        record = _parse(line_number, line, report)
+        if record is not None:
+            records.append((line_number, record))
+
+    if not records:
+        return
+
+    records = _check_categories(db, records, report)
+    records = _allocate_slugs(db, records, report)
+    if not records:
+        db.rollback()
+        return
+
+    try:
+        _insert_chunk(db, records)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = str(getattr(e, "orig", None) or e).strip()
+        report.errors.extend(
+            ImportFailure(line=line_number, slug=record.slug, error=message)
+            for line_number, record in records
+        )
+        return
+
+    report.created += len(records)
+
+
+def chunked_lines(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Agrupar líneas numeradas (desde 1) en chunks."""
+    chunk = []
+    for line_number, line in enumerate(lines, start=1):
+        chunk.append((line_number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_projects(
+    db: Session,
+    lines: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> ImportReport:
+    """Importar proyectos desde líneas NDJSON (un ProjectCreate por línea)."""
+    report = ImportReport()
+    for chunk in chunked_lines(lines, chunk_size):
+        import_chunk(db, chunk, report)
+    return report
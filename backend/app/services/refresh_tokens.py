@@ -0,0 +1,95 @@
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import create_refresh_token, hash_refresh_token
+from app.models.user import RefreshToken, User
+
+logger = logging.getLogger(__name__)
+
+
+def issue_refresh_token(db: Session, user_id, family_id: Optional[uuid.UUID] = None) -> str:
+    """
+    Emitir un refresh token para `user_id` (sin commit). Sin `family_id`
+    empieza una familia nueva (login) y se borran los vencidos del usuario.
+
+    Retorna el token en claro: es la única vez que existe fuera del cliente.
+    """
+    now = datetime.utcnow()
+    if family_id is None:
+        family_id = uuid.uuid4()
+        db.query(RefreshToken).filter(
+            RefreshToken.user_id == user_id,
+            RefreshToken.expires_at <= now,
+        ).delete(synchronize_session=False)
+
+    token = create_refresh_token()
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(token),
+        family_id=family_id,
+        expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return token
+
+
+def _revoke_family(db: Session, family_id: uuid.UUID, now: datetime) -> None:
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+
+
+def rotate_refresh_token(db: Session, token: str) -> Optional[Tuple[str, str]]:
+    """
+    Canjear un refresh token: lo revoca y emite el siguiente de la familia.
+
+    Retorna (email, nuevo refresh token), o None si el token no existe,
+    venció, el usuario ya no está activo o el token ya había sido usado;
+    en este último caso se revoca toda la familia.
+    """
+    record = db.query(RefreshToken).filter(RefreshToken.token_hash == hash_refresh_token(token)).first()
+    if record is None:
+        return None
+
+    now = datetime.utcnow()
+    # Reclamar el token con un UPDATE condicional: de dos canjes
+    # simultáneos sólo uno lo logra
+    claimed = db.query(RefreshToken).filter(
+        RefreshToken.id == record.id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+
+    if not claimed:
+        # Reuso de un token ya rotado: asumir robo y cortar la sesión completa
+        logger.warning(
+            "refresh token reuse, revoking session",
+            extra={"user_id": str(record.user_id), "family_id": str(record.family_id)},
+        )
+        _revoke_family(db, record.family_id, now)
+        db.commit()
+        return None
+
+    user = db.get(User, record.user_id)
+    if record.expires_at <= now or user is None or not user.is_active:
+        db.commit()
+        return None
+
+    email = user.email
+    new_token = issue_refresh_token(db, user.id, family_id=record.family_id)
+    db.commit()
+    return email, new_token
+
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """Revocar la familia del token (logout). False si el token no existe."""
+    record = db.query(RefreshToken).filter(RefreshToken.token_hash == hash_refresh_token(token)).first()
+    if record is None:
+        return False
+    _revoke_family(db, record.family_id, datetime.utcnow())
+    db.commit()
+    return True
@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional
+
+from app.core.config import settings
+
+
+@dataclass
+class CacheEntry:
+    """Respuesta ya serializada lista para enviarse."""
+    body: bytes
+    headers: Dict[str, str]
+    tags: FrozenSet[str] = frozenset()
+    expires_at: float = 0.0
+    # Variantes comprimidas del body por encoding ("br", "gzip"), se
+    # calculan la primera vez que se piden
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    stale_skips: int = 0
+
+
+class ResponseCache:
+    """
+    Cache LRU con TTL, en memoria del proceso, para respuestas públicas.
+
+    - Acotada por cantidad de entradas (LRU) y por tiempo de vida (TTL)
+    - Cada entrada tiene tags; invalidate(tag) borra todas las que lo tengan
+    - Generaciones: quien va a leer de la DB toma generation() antes y la
+      pasa a set(); si mientras tanto se invalidó alguno de los tags de la
+      entrada, la respuesta (posiblemente vieja) no se guarda
+    - Thread-safe: los handlers sync corren en el threadpool de Starlette
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        # Contador global de invalidaciones y, por tag, el valor que tenía
+        # en su última invalidación (clear() cuenta para todos los tags)
+        self._generation = 0
+        self._tag_generations: Dict[str, int] = {}
+        self._cleared_generation = 0
+        self._invalidated_at = float("-inf")
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry
+
+    def set(
+        self,
+        key: Hashable,
+        body: bytes,
+        headers: Dict[str, str],
+        tags: Iterable[str] = (),
+        generation: Optional[int] = None
+    ) -> Optional[CacheEntry]:
+        """
+        Guardar una respuesta. `generation` es el valor de generation()
+        tomado antes de leer la DB: si algún tag se invalidó después, no
+        se guarda y se retorna None.
+        """
+        if not self.enabled:
+            return None
+        entry = CacheEntry(
+            body=body,
+            headers=dict(headers),
+            tags=frozenset(tags),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        with self._lock:
+            if generation is not None and (
+                self._cleared_generation > generation
+                or any(self._tag_generations.get(tag, 0) > generation for tag in entry.tags)
+            ):
+                self._stats.stale_skips += 1
+                return None
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+        return entry
+
+    def generation(self) -> int:
+        """Generación actual; tomarla antes de leer la DB para pasarla a set()."""
+        with self._lock:
+            return self._generation
+
+    def invalidated_within(self, seconds: float) -> bool:
+        """Si hubo una invalidación (o clear) en los últimos `seconds` segundos."""
+        return time.monotonic() - self._invalidated_at < seconds
+
+    def invalidate(self, *tags: str) -> int:
+        """Eliminar todas las entradas con alguno de los tags. Retorna cuántas."""
+        removed = 0
+        with self._lock:
+            self._generation += 1
+            self._invalidated_at = time.monotonic()
+            for tag in tags:
+                self._tag_generations[tag] = self._generation
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            self._stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._generation += 1
+            self._tag_generations.clear()
+            self._cleared_generation = self._generation
+            self._invalidated_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "evictions": self._stats.evictions,
+                "expirations": self._stats.expirations,
+                "invalidations": self._stats.invalidations,
+                "stale_skips": self._stats.stale_skips,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        # Llamar con el lock tomado
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+# Tags usados por el router de proyectos
+LIST_TAG = "projects:list"
+
+
+def project_tag(project_id) -> str:
+    return f"project:{project_id}"
+
+
+# Instancia global para lecturas públicas de proyectos
+project_cache = ResponseCache(
+    max_entries=settings.PROJECT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PROJECT_CACHE_TTL_SECONDS,
+)
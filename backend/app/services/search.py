@@ -0,0 +1,67 @@
+from typing import Tuple
+
+from sqlalchemy import Float, String, and_, case, cast, false, func, literal, literal_column, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.project import Project
+
+# Configuración creada en database/schema.sql (spanish + unaccent)
+TS_CONFIG = "spanish_unaccent"
+
+# Columna mantenida por trigger en Postgres; no se mapea en el modelo
+# para que Project siga siendo portable a otros motores
+SEARCH_VECTOR = literal_column("projects.search_vector")
+
+# Peso de cada campo en el fallback portable (mismo orden que los pesos A-D)
+FALLBACK_WEIGHTS = (
+    (Project.title, 4),
+    (cast(Project.tags, String), 2),
+    (cast(Project.highlights, String), 2),
+    (Project.description, 1),
+    (Project.client, 1),
+    (Project.location, 1),
+)
+
+
+def _postgres_search(q: str) -> Tuple[ColumnElement, ColumnElement]:
+    ts_query = func.websearch_to_tsquery(TS_CONFIG, q)
+    condition = SEARCH_VECTOR.op("@@")(ts_query)
+    # ts_rank_cd retorna real: se pasa a double para que el valor que viaja
+    # en el cursor se compare exacto en la página siguiente
+    rank = cast(func.ts_rank_cd(SEARCH_VECTOR, ts_query), Float)
+    return condition, rank
+
+
+def _fallback_search(q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Búsqueda portable (SQLite en tests): cada término debe aparecer en
+    algún campo; el ranking suma el peso de los campos donde aparece.
+    Cubierta por tests/api/test_search.py (tags y highlights como JSON).
+    """
+    terms = [term.lower() for term in q.split()]
+    if not terms:
+        return false(), literal(0.0)
+    conditions = []
+    score = []
+    for term in terms:
+        matches = [
+            (func.lower(column).contains(term, autoescape=True), weight)
+            for column, weight in FALLBACK_WEIGHTS
+        ]
+        conditions.append(or_(*[match for match, _ in matches]))
+        score.extend(case((match, weight), else_=0) for match, weight in matches)
+    rank = sum(score[1:], score[0])
+    return and_(*conditions), cast(rank, Float)
+
+
+def search_expressions(db: Session, q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Condición WHERE y expresión de ranking (mayor = más relevante) para `q`.
+
+    En Postgres usa el tsvector indexado con GIN; en otros motores cae a
+    un LIKE por término sin índice, pensado sólo para tests.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _postgres_search(q)
+    return _fallback_search(q)
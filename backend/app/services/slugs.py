@@ -0,0 +1,100 @@
+from typing import Iterable, Optional, Set
+
+from slugify import slugify
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+
+# Reintentos si otro proceso inserta el mismo slug entre la consulta y el INSERT
+MAX_ATTEMPTS = 5
+
+
+class SlugTakenError(Exception):
+    """El slug ya existe (violación del UNIQUE de projects.slug)."""
+
+    def __init__(self, slug: str):
+        super().__init__(f"Project with slug '{slug}' already exists")
+        self.slug = slug
+
+
+def slug_base(title: str) -> str:
+    """Slug base a partir del título."""
+    return slugify(title) or "proyecto"
+
+
+def existing_slugs(db: Session, bases: Iterable[str], exact: Iterable[str] = ()) -> Set[str]:
+    """
+    Slugs ya usados que chocan con `bases` (el base o `base-...`) o con
+    `exact`, en una sola query por prefijo (el LIKE usa el índice
+    `text_pattern_ops` de slug, ver database/schema.sql).
+    """
+    conditions = []
+    exact = set(exact)
+    if exact:
+        conditions.append(Project.slug.in_(exact))
+    for base in set(bases):
+        conditions.append(Project.slug == base)
+        conditions.append(Project.slug.startswith(f"{base}-", autoescape=True))
+    if not conditions:
+        return set()
+    return set(db.scalars(select(Project.slug).where(or_(*conditions))))
+
+
+def first_free_slug(base: str, taken: Set[str]) -> str:
+    """`base`, o `base-N` con el menor N >= 1 que no esté en `taken`."""
+    if base not in taken:
+        return base
+    prefix = f"{base}-"
+    used = {
+        int(slug[len(prefix):])
+        for slug in taken
+        if slug.startswith(prefix) and slug[len(prefix):].isdigit()
+    }
+    counter = 1
+    while counter in used:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+def next_free_slug(db: Session, base: str) -> str:
+    """Siguiente slug libre para `base` con una sola query."""
+    return first_free_slug(base, existing_slugs(db, [base]))
+
+
+def is_slug_conflict(exc: IntegrityError) -> bool:
+    # Postgres: projects_slug_key / ix_projects_slug; SQLite: projects.slug
+    return "slug" in str(exc.orig)
+
+
+def flush_with_slug(db: Session, project: Project, base: Optional[str] = None) -> str:
+    """
+    Hacer flush de `project` apoyándose en el UNIQUE de slug en vez de
+    consultar antes de insertar.
+
+    - Con `base`: asigna el siguiente slug libre y, si otro proceso lo
+      tomó entretanto, vuelve a calcularlo (hasta MAX_ATTEMPTS veces)
+    - Sin `base`: usa `project.slug` tal cual
+
+    Cada intento corre en un SAVEPOINT, así un choque no invalida el
+    resto de la transacción.
+
+    Raises:
+        SlugTakenError: Si el slug sigue ocupado
+    """
+    attempts = MAX_ATTEMPTS if base is not None else 1
+    slug = project.slug
+    for _ in range(attempts):
+        if base is not None:
+            slug = project.slug = next_free_slug(db, base)
+        try:
+            with db.begin_nested():
+                db.add(project)
+                db.flush()
+            return slug
+        except IntegrityError as e:
+            if not is_slug_conflict(e):
+                raise
+    # No leer project.slug aquí: el rollback del SAVEPOINT expira el objeto
+    raise SlugTakenError(slug)
@@ -75,9 +75,17 @@ CREATE INDEX idx_projects_published ON projects(published);
 CREATE INDEX idx_projects_category ON projects(category);
 CREATE INDEX idx_projects_start_date ON projects(start_date DESC);
 CREATE INDEX idx_projects_slug ON projects(slug);
+-- LIKE 'base-%' al asignar slugs (app/services/slugs.py): con una
+-- collation distinta de "C" el btree anterior no sirve para prefijos
+CREATE INDEX idx_projects_slug_pattern ON projects(slug text_pattern_ops);
 CREATE INDEX idx_projects_tags ON projects USING GIN(tags);
 CREATE INDEX idx_projects_created_at ON projects(created_at DESC);
 
+-- Índices compuestos para paginación keyset (cursor) en GET /projects:
+-- ORDER BY <columna> DESC, id DESC sin ordenar en memoria
+CREATE INDEX idx_projects_created_at_id ON projects(created_at DESC, id DESC);
+CREATE INDEX idx_projects_start_date_id ON projects(start_date DESC NULLS LAST, id DESC);
+
 -- Trigger para actualizar updated_at automáticamente
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -180,6 +188,77 @@ CREATE TRIGGER update_users_updated_at
 INSERT INTO users (email, hashed_password, full_name, role, is_active) VALUES
 ('pedro@sitecel.cl', '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5lWnJVMQm7ufG', 'Pedro Araujo', 'admin', true);
 
+-- ============================================================================
+-- TABLA: refresh_tokens
+-- Descripción: Refresh tokens rotativos (POST /auth/refresh). Sólo el hash
+-- SHA-256 del token; family_id agrupa las rotaciones de un mismo login.
+-- Se puede ejecutar por separado sobre una base existente.
+-- ============================================================================
+
+CREATE TABLE refresh_tokens (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    token_hash VARCHAR(64) UNIQUE NOT NULL,
+    family_id UUID NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+-- Índices
+CREATE INDEX idx_refresh_tokens_user ON refresh_tokens(user_id);
+CREATE INDEX idx_refresh_tokens_family ON refresh_tokens(family_id);
+
+-- ============================================================================
+-- BÚSQUEDA FULL-TEXT (GET /projects/search)
+-- Descripción: tsvector en español, sin acentos, mantenido por trigger.
+-- Se puede ejecutar por separado sobre una base existente.
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- Configuración "spanish" que además quita acentos (camion = camión)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+            ALTER MAPPING FOR hword, hword_part, word
+            WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+-- Pesos: título (A), tags y highlights (B), descripción (C), cliente y ubicación (D)
+CREATE OR REPLACE FUNCTION projects_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('spanish_unaccent', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('spanish_unaccent',
+            coalesce(array_to_string(NEW.tags, ' '), '') || ' ' ||
+            coalesce(array_to_string(NEW.highlights, ' '), '')), 'B') ||
+        setweight(to_tsvector('spanish_unaccent', coalesce(NEW.description, '')), 'C') ||
+        setweight(to_tsvector('spanish_unaccent',
+            coalesce(NEW.client, '') || ' ' || coalesce(NEW.location, '')), 'D');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_projects_search_vector ON projects;
+CREATE TRIGGER update_projects_search_vector
+    BEFORE INSERT OR UPDATE OF title, description, client, location, tags, highlights
+    ON projects
+    FOR EACH ROW
+    EXECUTE FUNCTION projects_search_vector_update();
+
+-- Poblar filas existentes (dispara el trigger)
+UPDATE projects SET title = title WHERE search_vector IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_projects_search ON projects USING GIN(search_vector);
+
 -- ============================================================================
 -- VISTAS ÚTILES
 -- ============================================================================
@@ -0,0 +1,83 @@
+"""
+Benchmark de requests/segundo con alta concurrencia contra una API en
+ejecución, para comparar el modo sync (por defecto) con DATABASE_ASYNC=true.
+
+Levantar la API en cada modo y correr el mismo benchmark:
+
+    DATABASE_ASYNC=false uvicorn app.main:app --port 8000
+    python scripts/benchmark_async.py --url http://localhost:8000 --concurrency 200
+
+    DATABASE_ASYNC=true uvicorn app.main:app --port 8000
+    python scripts/benchmark_async.py --url http://localhost:8000 --concurrency 200
+
+Por defecto pide GET /api/v1/projects sin `published=true` (que se
+serviría desde la cache en memoria y no tocaría la DB).
+
+Requiere httpx (pip install httpx).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    raise SystemExit("❌ Este benchmark requiere httpx: pip install httpx")
+
+
+async def _worker(client: httpx.AsyncClient, path: str, deadline: float, latencies: list, errors: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run(url: str, path: str, concurrency: int, duration: float) -> None:
+    latencies, errors = [], []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        # Calentar conexiones y pool de la DB
+        await client.get(path)
+
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            _worker(client, path, deadline, latencies, errors)
+            for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0
+
+    print(f"\n📊 {path} ({concurrency} concurrentes, {elapsed:.1f}s):")
+    print(f"   Requests/s: {len(latencies) / elapsed:.1f}")
+    if latencies:
+        print(f"   Mediana: {statistics.median(latencies):.1f} ms")
+        print(f"   p99: {p99:.1f} ms")
+    print(f"   ❌ Errores: {len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async de la API")
+    parser.add_argument("--url", default="http://localhost:8000", help="URL base de la API")
+    parser.add_argument("--path", default="/api/v1/projects?limit=20", help="Ruta a pedir")
+    parser.add_argument("--concurrency", type=int, default=200, help="Requests concurrentes (default: 200)")
+    parser.add_argument("--duration", type=float, default=15, help="Segundos de medición (default: 15)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.path, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark de creación de proyectos con media.
+
+Llama a create_project (el mismo código del endpoint POST /projects)
+contra la base configurada en DATABASE_URL y reporta la latencia y las
+queries por creación. Los proyectos creados se eliminan al final.
+
+Uso:
+python scripts/benchmark_create.py --category telecom-it [--runs 20] [--images 50]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar app
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, event
+
+from app.api.v1.projects import create_project
+from app.db.session import SessionLocal, engine
+from app.models.project import Project
+from app.schemas.project import ProjectCreate
+
+
+def _payload(run: int, images: int, category: str) -> ProjectCreate:
+    return ProjectCreate(
+        title=f"Benchmark creación {run}",
+        category=category,
+        images=[
+            {"url": f"https://example.com/bench/{run}/{i}.jpg", "alt_text": f"Imagen {i}", "display_order": i}
+            for i in range(images)
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de POST /projects")
+    parser.add_argument("--category", required=True, help="ID de una categoría existente")
+    parser.add_argument("--runs", type=int, default=20, help="Creaciones a medir (default: 20)")
+    parser.add_argument("--images", type=int, default=50, help="Imágenes por proyecto (default: 50)")
+    args = parser.parse_args()
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    timings, queries, created = [], [], []
+
+    print(f"🚀 Creando {args.runs} proyectos con {args.images} imágenes...")
+
+    try:
+        for run in range(args.runs):
+            payload = _payload(run, args.images, args.category)
+            db = SessionLocal()
+            statements.clear()
+            started = time.perf_counter()
+            try:
+                project = create_project(payload, db)
+            finally:
+                db.close()
+            timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(statements))
+            created.append(project.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+        if created:
+            db = SessionLocal()
+            try:
+                db.execute(delete(Project).where(Project.id.in_(created)))
+                db.commit()
+            finally:
+                db.close()
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+    print(f"\n📊 Resultados ({args.runs} creaciones, {args.images} imágenes):")
+    print(f"   Mediana: {statistics.median(timings):.2f} ms")
+    print(f"   p95: {p95:.2f} ms")
+    print(f"   Queries por creación: {max(queries)}")
+
+
+if __name__ == "__main__":
+    main()
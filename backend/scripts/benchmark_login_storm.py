@@ -0,0 +1,113 @@
+"""
+Benchmark de latencia del catálogo durante una ráfaga de logins.
+
+Mide la latencia de un endpoint público (por defecto el listado de
+proyectos) primero sin carga y luego mientras otros clientes hacen login
+sin parar. bcrypt corre en su executor dedicado (PASSWORD_EXECUTOR,
+PASSWORD_WORKERS, PASSWORD_QUEUE_LIMIT): el p99 del catálogo no debería
+moverse, y los logins que no entran en la cola reciben 503 al instante.
+
+Levantar la API y correr:
+
+    uvicorn app.main:app --port 8000
+    python scripts/benchmark_login_storm.py --email admin@sitecel.cl --password ...
+
+Para comparar con el threadpool compartido, correr el mismo benchmark
+sobre un commit anterior. Requiere httpx (pip install httpx).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    raise SystemExit("❌ Este benchmark requiere httpx: pip install httpx")
+
+
+async def _reader(client: httpx.AsyncClient, path: str, deadline: float, latencies: list, errors: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def _login(client: httpx.AsyncClient, credentials: dict, deadline: float, statuses: Counter):
+    while time.perf_counter() < deadline:
+        try:
+            response = await client.post("/api/v1/auth/login", data=credentials)
+            statuses[response.status_code] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+
+
+def _report(label: str, latencies: list, errors: list, elapsed: float) -> float:
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0
+    print(f"\n📊 {label} ({elapsed:.1f}s):")
+    print(f"   Requests/s: {len(latencies) / elapsed:.1f}")
+    if latencies:
+        print(f"   Mediana: {statistics.median(latencies):.1f} ms")
+        print(f"   p99: {p99:.1f} ms")
+    print(f"   ❌ Errores: {len(errors)}")
+    return p99
+
+
+async def _phase(client, path, readers, duration, credentials=None, logins=0):
+    latencies, errors, statuses = [], [], Counter()
+    started = time.perf_counter()
+    deadline = started + duration
+    tasks = [_reader(client, path, deadline, latencies, errors) for _ in range(readers)]
+    if credentials is not None:
+        tasks += [_login(client, credentials, deadline, statuses) for _ in range(logins)]
+    await asyncio.gather(*tasks)
+    return latencies, errors, statuses, time.perf_counter() - started
+
+
+async def run(args) -> None:
+    limits = httpx.Limits(max_connections=args.readers + args.logins)
+    credentials = {"username": args.email, "password": args.password}
+
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        # Calentar conexiones, pool de la DB y executor de bcrypt
+        await client.get(args.path)
+        await client.post("/api/v1/auth/login", data=credentials)
+
+        latencies, errors, _, elapsed = await _phase(client, args.path, args.readers, args.duration)
+        baseline = _report(f"{args.path} sin logins", latencies, errors, elapsed)
+
+        latencies, errors, statuses, elapsed = await _phase(
+            client, args.path, args.readers, args.duration, credentials, args.logins
+        )
+        storm = _report(f"{args.path} con {args.logins} clientes haciendo login", latencies, errors, elapsed)
+
+    print(f"\n🔐 Logins por status: {dict(statuses)}")
+    print(f"📈 p99 del catálogo: {baseline:.1f} ms → {storm:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia del catálogo durante una ráfaga de logins")
+    parser.add_argument("--url", default="http://localhost:8000", help="URL base de la API")
+    parser.add_argument("--path", default="/api/v1/projects?limit=20", help="Ruta del catálogo a medir")
+    parser.add_argument("--email", required=True, help="Email de un usuario existente")
+    parser.add_argument("--password", required=True, help="Password (puede ser incorrecta: igual corre bcrypt)")
+    parser.add_argument("--readers", type=int, default=20, help="Clientes leyendo el catálogo (default: 20)")
+    parser.add_argument("--logins", type=int, default=50, help="Clientes haciendo login (default: 50)")
+    parser.add_argument("--duration", type=float, default=10, help="Segundos por fase (default: 10)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Micro-benchmark de serialización de un listado de proyectos.
+
+Compara, para una página de proyectos con su media (sin tocar la DB):
+
+- FastAPI por defecto: ProjectList con from_attributes + jsonable_encoder + json
+- Pydantic: ProjectList con from_attributes + dump_json
+- Directo: dicts desde filas (como serialize_rows) + orjson (render_json)
+
+Uso:
+python scripts/benchmark_serialization.py [--rows 100] [--images 8] [--repeat 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import List
+
+# Agregar el directorio padre al path para importar app
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.fieldsets import IMAGE_COLUMNS, LIST_FIELDS, VIDEO_COLUMNS
+from app.api.responses import render_json
+from app.models.project import Project, ProjectImage, ProjectVideo
+from app.schemas.project import ProjectList
+
+
+def _page(rows: int, images: int):
+    """Objetos ORM (sin sesión) y las filas equivalentes de la proyección."""
+    projects, records = [], []
+    now = datetime.utcnow()
+    for i in range(rows):
+        project_id = uuid.uuid4()
+        values = {
+            "id": project_id,
+            "slug": f"proyecto-{i}",
+            "title": f"Proyecto de telecomunicaciones {i}",
+            "description": "Instalación de fibra óptica y enlaces de microondas " * 4,
+            "category": "telecom-it",
+            "published": True,
+            "client": "Cliente S.A.",
+            "start_date": date(2024, 1, 1),
+            "duration": "6 meses",
+            "location": "Santiago, Chile",
+            "tags": ["fibra", "microondas", "5g"],
+            "highlights": ["Sin cortes de servicio", "Entrega anticipada"],
+            "created_at": now,
+            "updated_at": now,
+        }
+        image_rows = [
+            {
+                "url": f"https://cdn.example.com/{project_id}/{j}.jpg",
+                "alt_text": f"Imagen {j}",
+                "caption": "Vista general de la obra",
+                "display_order": j,
+                "id": uuid.uuid4(),
+                "project_id": project_id,
+                "created_at": now,
+            }
+            for j in range(images)
+        ]
+        video_rows = [{
+            "video_url": f"https://cdn.example.com/{project_id}/video.mp4",
+            "thumbnail_url": None,
+            "title": "Recorrido",
+            "duration": 95,
+            "display_order": 0,
+            "id": uuid.uuid4(),
+            "project_id": project_id,
+            "created_at": now,
+        }]
+
+        project = Project(**values)
+        project.images = [ProjectImage(**row) for row in image_rows]
+        project.videos = [ProjectVideo(**row) for row in video_rows]
+        projects.append(project)
+
+        records.append({
+            **values,
+            "images": [{column: row[column] for column in IMAGE_COLUMNS} for row in image_rows],
+            "videos": [{column: row[column] for column in VIDEO_COLUMNS} for row in video_rows],
+        })
+    return projects, records
+
+
+def _time(label: str, fn, repeat: int, baseline: float = None) -> float:
+    fn()  # calentar
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    per_call = (time.perf_counter() - started) / repeat * 1000
+    speedup = f"  ({baseline / per_call:.1f}x)" if baseline else ""
+    print(f"   {label:<40} {per_call:8.3f} ms{speedup}")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de serialización de listados")
+    parser.add_argument("--rows", type=int, default=100, help="Proyectos por página (default: 100)")
+    parser.add_argument("--images", type=int, default=8, help="Imágenes por proyecto (default: 8)")
+    parser.add_argument("--repeat", type=int, default=200, help="Repeticiones (default: 200)")
+    args = parser.parse_args()
+
+    projects, records = _page(args.rows, args.images)
+    adapter = TypeAdapter(List[ProjectList])
+
+    def fastapi_default():
+        validated = adapter.validate_python(projects, from_attributes=True)
+        return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def pydantic_dump():
+        return adapter.dump_json(adapter.validate_python(projects, from_attributes=True))
+
+    def direct():
+        # Lo que hace serialize_rows con las filas de la proyección
+        return render_json([{name: record[name] for name in LIST_FIELDS} for record in records])
+
+    assert json.loads(direct()) == json.loads(pydantic_dump())
+
+    print(f"📊 {args.rows} proyectos x {args.images} imágenes, {len(direct()) / 1024:.0f} KB por respuesta:")
+    baseline = _time("FastAPI (jsonable_encoder + json)", fastapi_default, args.repeat)
+    _time("Pydantic (from_attributes + dump_json)", pydantic_dump, args.repeat, baseline)
+    _time("Directo (filas + orjson)", direct, args.repeat, baseline)
+
+
+if __name__ == "__main__":
+    main()
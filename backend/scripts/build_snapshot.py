@@ -0,0 +1,53 @@
+"""
+Script para generar el snapshot del catálogo publicado.
+
+Escribe en SNAPSHOT_DIR (o en --dir) el catálogo, un documento por slug
+y las categorías, con sus variantes precomprimidas. La API lo regenera
+sola después de cada escritura; este script sirve para generarlo al
+desplegar o a demanda.
+
+Uso:
+python scripts/build_snapshot.py [--dir /data/snapshot]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar app
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.api.snapshot import build_snapshot
+from app.db.session import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generar el snapshot del catálogo publicado")
+    parser.add_argument("--dir", help="Carpeta destino (default: SNAPSHOT_DIR)")
+    args = parser.parse_args()
+
+    if args.dir:
+        settings.SNAPSHOT_DIR = args.dir
+
+    if not settings.SNAPSHOT_DIR:
+        print("❌ Indicar la carpeta con SNAPSHOT_DIR o --dir")
+        sys.exit(1)
+
+    print(f"🚀 Generando snapshot en {settings.SNAPSHOT_DIR}...")
+
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        version = build_snapshot(db)
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ Snapshot {version} listo ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
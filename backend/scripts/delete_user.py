@@ -11,6 +11,7 @@ sys.path.insert(0, '.')
 
 from app.db.session import SessionLocal
 from app.models.user import User
+from app.services.principal_cache import principal_cache
 
 
 def delete_user():
@@ -28,7 +29,7 @@ def delete_user():
         
         print("Usuarios existentes:")
         for i, user in enumerate(users, 1):
-            print(f"{i}. {user.email} - {user.full_name} ({user.role})")
+            print(f"{i}. {user.email} - {user.full_name} ({'admin' if user.is_admin else 'editor'})")
         
         # Solicitar email a eliminar
         email = input("\nEmail del usuario a eliminar: ").strip()
@@ -51,6 +52,11 @@ def delete_user():
         db.delete(user)
         db.commit()
         
+        # Invalidar sus tokens en la cache de autenticación; el archivo
+        # AUTH_CACHE_STAMP_FILE lo propaga a la API en ejecución (correr el
+        # script en el mismo host, o apuntarlo a un volumen compartido)
+        principal_cache.invalidate_user(email)
+        
         print(f"✅ Usuario {email} eliminado exitosamente")
         
     except Exception as e:
@@ -0,0 +1,57 @@
+"""
+Script para importar proyectos en masa desde un archivo NDJSON.
+
+Cada línea del archivo es un proyecto con el formato de ProjectCreate
+(title, category, slug opcional, images, videos, ...).
+
+Uso:
+python scripts/import_projects.py proyectos.ndjson [--chunk-size 500]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar app
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.db.session import SessionLocal
+from app.services.project_import import DEFAULT_CHUNK_SIZE, import_projects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importar proyectos desde NDJSON")
+    parser.add_argument("path", help="Archivo NDJSON (un proyecto por línea)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Proyectos por transacción (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    print(f"🚀 Importando proyectos desde {args.path}...")
+
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        with open(args.path, encoding="utf-8") as f:
+            report = import_projects(db, f, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+
+    print(f"\n📊 Resumen ({elapsed:.2f}s):")
+    print(f"   Recibidos: {report.received}")
+    print(f"   ✅ Creados: {report.created}")
+    print(f"   ❌ Fallidos: {report.failed}")
+
+    for error in report.errors:
+        slug = f" ({error.slug})" if error.slug else ""
+        print(f"   Línea {error.line}{slug}: {error.error}")
+
+    if report.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
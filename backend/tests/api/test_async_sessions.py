@@ -0,0 +1,62 @@
+"""Rutas de lectura con DATABASE_ASYNC=true: run_db y get_read_session async."""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api import deps
+from app.core.config import settings
+from app.db.replicas import ReplicaRouter
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_mode(monkeypatch):
+    # NullPool: TestClient corre cada request en su propio event loop
+    engine = create_async_engine(settings.async_database_url, poolclass=NullPool)
+    sessions = []
+
+    class RecordingSession(AsyncSession):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            sessions.append(self)
+
+    monkeypatch.setattr(settings, "DATABASE_ASYNC", True)
+    monkeypatch.setattr(deps, "AsyncSessionLocal", async_sessionmaker(engine, class_=RecordingSession, autoflush=False))
+    monkeypatch.setattr(deps, "async_replica_router", ReplicaRouter([], settings.REPLICA_RETRY_SECONDS))
+    yield sessions
+    asyncio.run(engine.dispose())
+
+
+def test_list_runs_on_the_async_session(client, create_project, async_mode):
+    created = create_project("Enlace async")
+
+    response = client.get("/api/v1/projects", params={"category": "telecom-it"})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [created["id"]]
+    assert len(async_mode) == 1
+
+
+def test_detail_and_slug_run_on_the_async_session(client, create_project, async_mode):
+    created = create_project("Detalle async")
+
+    detail = client.get(f"/api/v1/projects/{created['id']}")
+    by_slug = client.get(f"/api/v1/projects/by-slug/{created['slug']}")
+    missing = client.get("/api/v1/projects/by-slug/no-existe")
+
+    assert detail.status_code == 200
+    assert detail.json()["title"] == "Detalle async"
+    assert by_slug.json()["id"] == created["id"]
+    assert missing.status_code == 404
+    assert len(async_mode) == 3
+
+
+def test_cached_response_does_not_open_a_session(client, create_project, async_mode):
+    created = create_project("Cache async")
+    client.get(f"/api/v1/projects/{created['id']}")
+
+    assert client.get(f"/api/v1/projects/{created['id']}").status_code == 200
+    assert len(async_mode) == 1
@@ -0,0 +1,58 @@
+"""GET /projects/by-slug/{slug}: una fila por el índice de slug."""
+import pytest
+
+
+@pytest.fixture
+def draft(create_project):
+    return create_project(
+        "Borrador por slug",
+        published=False,
+        images=[{"url": "https://cdn.test/a.jpg", "display_order": 0}],
+    )
+
+
+def _by_slug(client, slug: str, **params):
+    return client.get(f"/api/v1/projects/by-slug/{slug}", params=params)
+
+
+def test_returns_the_project_with_media(client, draft):
+    response = _by_slug(client, draft["slug"])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == draft["id"]
+    assert [image["url"] for image in body["images"]] == ["https://cdn.test/a.jpg"]
+
+
+def test_unknown_slug_is_404(client, draft):
+    response = _by_slug(client, "no-existe")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Project with slug 'no-existe' not found"
+
+
+def test_published_filter(client, draft):
+    assert _by_slug(client, draft["slug"], published="true").status_code == 404
+    assert _by_slug(client, draft["slug"], published="false").status_code == 200
+
+
+def test_publishing_makes_it_visible(client, draft):
+    assert _by_slug(client, draft["slug"], published="true").status_code == 404
+
+    client.patch(f"/api/v1/projects/{draft['id']}/publish")
+
+    assert _by_slug(client, draft["slug"], published="true").status_code == 200
+    # Y al despublicar deja de servirse desde la cache
+    client.patch(f"/api/v1/projects/{draft['id']}/publish")
+    assert _by_slug(client, draft["slug"], published="true").status_code == 404
+
+
+def test_reads_a_single_project_row(client, draft, queries):
+    _by_slug(client, draft["slug"])
+
+    project_selects = [
+        statement for statement in queries
+        if statement.lstrip().startswith("SELECT") and "FROM projects" in statement
+    ]
+    assert project_selects
+    assert all("WHERE projects.slug = " in statement for statement in project_selects)
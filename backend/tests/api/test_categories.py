@@ -0,0 +1,41 @@
+"""GET /categories: conteo de proyectos publicados por categoría."""
+
+
+def _counts(client):
+    response = client.get("/api/v1/categories")
+    assert response.status_code == 200
+    return {category["id"]: category["project_count"] for category in response.json()}
+
+
+def test_counts_only_published_projects(client, create_project):
+    create_project("Publicado uno")
+    create_project("Publicado dos")
+    create_project("Borrador", published=False)
+    create_project("Obra", category="construccion", published=False)
+
+    assert _counts(client) == {"telecom-it": 2, "construccion": 0}
+
+
+def test_categories_keep_display_order(client):
+    response = client.get("/api/v1/categories")
+
+    assert [category["id"] for category in response.json()] == ["telecom-it", "construccion"]
+
+
+def test_counts_follow_publish_toggles(client, create_project):
+    draft = create_project("Borrador a publicar", published=False)
+    assert _counts(client)["telecom-it"] == 0
+
+    client.patch(f"/api/v1/projects/{draft['id']}/publish")
+
+    assert _counts(client)["telecom-it"] == 1
+
+
+def test_counts_in_a_single_query(client, create_project, queries):
+    create_project("Publicado")
+    queries.clear()
+
+    _counts(client)
+
+    assert len(queries) == 1
+    assert "FROM categories" in queries[0]
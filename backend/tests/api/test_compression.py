@@ -0,0 +1,133 @@
+"""CompressionMiddleware: elección de encoding, umbral, Vary y ETag débil."""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.compression import CompressionMiddleware, choose_encoding
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_SIZE = 100
+BIG = b'{"data": "' + b"x" * 500 + b'"}'
+SMALL = b'{"data": "x"}'
+
+
+@pytest.fixture(scope="module")
+def compressed_client():
+    app = FastAPI()
+
+    @app.get("/big")
+    def big():
+        return Response(BIG, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    def small():
+        return Response(SMALL, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\0" * 500, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a,b\n"] * 200), media_type="text/csv")
+
+    @app.get("/vary")
+    def vary():
+        return PlainTextResponse("x" * 500, headers={"Vary": "accept-encoding"})
+
+    app.add_middleware(CompressionMiddleware, minimum_size=MIN_SIZE)
+    return TestClient(app)
+
+
+def _get(client, path: str, accept_encoding: str):
+    return client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, br", "br" if brotli else "gzip"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br" if brotli else "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_choose_encoding(accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli no instalado")
+def test_brotli_is_preferred(compressed_client):
+    response = _get(compressed_client, "/big", "gzip, br")
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.content == BIG
+
+
+def test_gzip_variant_has_weak_etag_and_vary(compressed_client):
+    response = _get(compressed_client, "/big", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == BIG
+    assert int(response.headers["content-length"]) < len(BIG)
+
+
+def test_identity_response_still_varies(compressed_client):
+    response = _get(compressed_client, "/big", "identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == BIG
+
+
+def test_body_below_minimum_size_is_not_compressed(compressed_client):
+    response = _get(compressed_client, "/small", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_non_compressible_type_passes_untouched(compressed_client):
+    response = _get(compressed_client, "/binary", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_streaming_response_is_compressed_in_chunks(compressed_client):
+    with compressed_client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b"a,b\n" * 200
+
+
+def test_existing_vary_is_not_duplicated(compressed_client):
+    response = _get(compressed_client, "/vary", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"].lower() == "accept-encoding"
+
+
+def test_api_list_varies_on_encoding(client, create_project):
+    create_project("Proyecto comprimido")
+
+    response = client.get("/api/v1/projects", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["vary"] == "Accept-Encoding"
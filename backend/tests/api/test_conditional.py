@@ -0,0 +1,80 @@
+"""GET condicional (ETag / 304) en listados y detalle de proyectos."""
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from app.models.project import Project
+
+
+def _revalidate(client, url, response, **params):
+    return client.get(url, params=params, headers={"If-None-Match": response.headers["ETag"]})
+
+
+@pytest.mark.parametrize("params", [{}, {"published": True}])
+def test_list_returns_304_for_current_etag(client, create_project, queries, params):
+    create_project("Proyecto uno")
+    first = client.get("/api/v1/projects", params=params)
+    assert "Last-Modified" not in first.headers
+
+    response = _revalidate(client, "/api/v1/projects", first, **params)
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == first.headers["ETag"]
+    # Sin agregaciones sobre todo el conjunto
+    assert not any("count(" in statement.lower() for statement in queries)
+
+
+def test_list_etag_changes_after_writes(client, create_project):
+    project = create_project("Proyecto uno")
+    other = create_project("Proyecto dos")
+    first = client.get("/api/v1/projects", params={"published": True})
+
+    client.put(f"/api/v1/projects/{project['id']}", json={"title": "Proyecto renombrado"})
+    renamed = _revalidate(client, "/api/v1/projects", first, published=True)
+    assert renamed.status_code == 200
+
+    # Borrar un proyecto que no es el último modificado también cambia el ETag
+    client.delete(f"/api/v1/projects/{other['id']}")
+    deleted = _revalidate(client, "/api/v1/projects", renamed, published=True)
+    assert deleted.status_code == 200
+    assert [item["title"] for item in deleted.json()] == ["Proyecto renombrado"]
+
+
+def test_list_etag_covers_the_next_cursor(client, create_project, db):
+    create_project("Proyecto uno")
+    first = client.get("/api/v1/projects", params={"limit": 1})
+    assert "X-Next-Cursor" not in first.headers
+
+    # Un proyecto más antiguo: la página es la misma, pero ahora hay siguiente
+    older = create_project("Proyecto antiguo")
+    db.query(Project).filter(Project.id == UUID(older["id"])).update({Project.created_at: datetime(2000, 1, 1)})
+    db.commit()
+
+    response = client.get("/api/v1/projects", params={"limit": 1}, headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.content == first.content
+    assert "X-Next-Cursor" in response.headers
+
+
+@pytest.mark.parametrize("route", ["id", "slug"])
+def test_detail_304_and_etag_change(client, create_project, route):
+    project = create_project("Proyecto uno")
+    url = (
+        f"/api/v1/projects/{project['id']}" if route == "id"
+        else f"/api/v1/projects/by-slug/{project['slug']}"
+    )
+    first = client.get(url, params={"published": True} if route == "slug" else {})
+    assert first.status_code == 200
+    assert "Last-Modified" in first.headers
+
+    assert _revalidate(client, url, first).status_code == 304
+    # Desde la cache en memoria también
+    assert _revalidate(client, url, first).status_code == 304
+
+    client.put(f"/api/v1/projects/{project['id']}", json={"description": "Nueva descripción"})
+
+    changed = _revalidate(client, url, first)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != first.headers["ETag"]
+    assert changed.json()["description"] == "Nueva descripción"
@@ -0,0 +1,72 @@
+"""GET /projects/export: NDJSON y CSV en streaming, por lotes."""
+import csv
+import io
+import json
+
+import pytest
+
+from app.api import export
+from app.api.export import EXPORT_FIELDS
+
+
+@pytest.fixture
+def projects(create_project):
+    first = create_project(
+        "Exportado con media",
+        tags=["fibra", "5g"],
+        highlights=["Uno"],
+        images=[{"url": "https://cdn.test/a.jpg", "display_order": 0}],
+    )
+    second = create_project("Exportado borrador", published=False)
+    third = create_project("Exportado, con coma")
+    return [first, second, third]
+
+
+def _export(client, **params):
+    response = client.get("/api/v1/projects/export", params=params)
+    assert response.status_code == 200
+    return response
+
+
+def test_ndjson_has_one_project_per_line(client, projects):
+    response = _export(client)
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="projects.ndjson"'
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert {item["id"] for item in items} == {project["id"] for project in projects}
+    assert all(list(item) == EXPORT_FIELDS for item in items)
+    with_media = next(item for item in items if item["id"] == projects[0]["id"])
+    assert with_media["tags"] == ["fibra", "5g"]
+    assert [image["url"] for image in with_media["images"]] == ["https://cdn.test/a.jpg"]
+
+
+def test_csv_has_header_and_encoded_cells(client, projects):
+    response = _export(client, format="csv")
+
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert list(rows[0]) == EXPORT_FIELDS
+    by_id = {row["id"]: row for row in rows}
+    assert by_id[projects[2]["id"]]["title"] == "Exportado, con coma"
+    with_media = by_id[projects[0]["id"]]
+    assert with_media["tags"] == "fibra|5g"
+    assert with_media["client"] == ""
+    assert [image["url"] for image in json.loads(with_media["images"])] == ["https://cdn.test/a.jpg"]
+
+
+def test_published_filter(client, projects):
+    items = [json.loads(line) for line in _export(client, published="true").text.splitlines()]
+
+    assert {item["id"] for item in items} == {projects[0]["id"], projects[2]["id"]}
+
+
+def test_streams_in_batches(projects):
+    chunks = list(export.ndjson_stream(None, batch_size=2))
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+
+def test_empty_catalogue(client):
+    assert _export(client).text == ""
+    assert _export(client, format="csv").text.splitlines() == [",".join(EXPORT_FIELDS)]
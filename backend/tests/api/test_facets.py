@@ -0,0 +1,69 @@
+"""Filtro por tags (?tags=, ?tags_match=) y facetas (?facets=)."""
+import pytest
+
+from app.api.facets import parse_tags
+from app.db.session import engine
+
+requires_postgres = pytest.mark.skipif(
+    engine.dialect.name != "postgresql", reason="tags es ARRAY sólo en Postgres"
+)
+
+
+def _list(client, **params):
+    response = client.get("/api/v1/projects", params={"published": "true", **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_parse_tags_drops_blanks_and_duplicates():
+    assert parse_tags(" fibra, ,5g,fibra ") == ["fibra", "5g"]
+    assert parse_tags(None) == []
+
+
+def test_unknown_facet_is_rejected(client):
+    response = client.get("/api/v1/projects", params={"facets": "category,owner"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown facets: owner"
+
+
+def test_category_facet_shape(client, create_project):
+    create_project("Red troncal")
+    create_project("Enlace rural")
+    create_project("Edificio", category="construccion")
+    create_project("Borrador", published=False)
+
+    body = _list(client, facets="category", limit=1)
+
+    assert len(body["items"]) == 1
+    # Los conteos son del conjunto filtrado completo, no de la página
+    assert body["facets"] == {
+        "category": [{"value": "telecom-it", "count": 2}, {"value": "construccion", "count": 1}]
+    }
+
+
+@requires_postgres
+def test_tag_filter_any_and_all(client, create_project):
+    both = create_project("Fibra y 5G", tags=["fibra", "5g"])
+    fiber = create_project("Sólo fibra", tags=["fibra"])
+    create_project("Sin tags")
+
+    any_ids = {item["id"] for item in _list(client, tags="fibra,5g")}
+    all_ids = {item["id"] for item in _list(client, tags="fibra,5g", tags_match="all")}
+
+    assert any_ids == {both["id"], fiber["id"]}
+    assert all_ids == {both["id"]}
+
+
+@requires_postgres
+def test_tag_facets_count_the_filtered_set(client, create_project):
+    create_project("Fibra y 5G", tags=["fibra", "5g"])
+    create_project("Sólo fibra", tags=["fibra"])
+    create_project("Obra", category="construccion", tags=["fibra"])
+
+    body = _list(client, category="telecom-it", facets="tags,category")
+
+    assert body["facets"] == {
+        "tags": [{"value": "fibra", "count": 2}, {"value": "5g", "count": 1}],
+        "category": [{"value": "telecom-it", "count": 2}],
+    }
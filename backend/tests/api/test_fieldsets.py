@@ -0,0 +1,61 @@
+"""GET /projects con ?fields= y ?view=summary: proyección de columnas."""
+import pytest
+
+from app.api.fieldsets import LIST_FIELDS, SUMMARY_FIELDS
+
+
+@pytest.fixture
+def project(create_project):
+    return create_project(
+        "Proyecto proyectado",
+        client="Cliente",
+        images=[
+            {"url": "https://cdn.test/second.jpg", "display_order": 1},
+            {"url": "https://cdn.test/cover.jpg", "display_order": 0},
+        ],
+    )
+
+
+def _list(client, **params):
+    response = client.get("/api/v1/projects", params={"published": "true", **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_fields_returns_only_the_requested_keys_in_order(client, project):
+    items = _list(client, fields="title,id,client,title")
+
+    assert items == [{"title": "Proyecto proyectado", "id": project["id"], "client": "Cliente"}]
+
+
+def test_summary_view_uses_the_first_image_as_cover(client, project):
+    (item,) = _list(client, view="summary")
+
+    assert list(item) == SUMMARY_FIELDS
+    assert item["cover_image"] == "https://cdn.test/cover.jpg"
+
+
+def test_fields_take_precedence_over_view(client, project):
+    (item,) = _list(client, view="summary", fields="slug")
+
+    assert item == {"slug": project["slug"]}
+
+
+def test_media_fields_are_loaded_per_page(client, project):
+    (item,) = _list(client, fields="id,images,videos")
+
+    assert [image["url"] for image in item["images"]] == ["https://cdn.test/cover.jpg", "https://cdn.test/second.jpg"]
+    assert item["videos"] == []
+
+
+def test_full_view_matches_the_list_schema(client, project):
+    (item,) = _list(client)
+
+    assert list(item) == LIST_FIELDS
+
+
+def test_unknown_fields_are_rejected(client, project):
+    response = client.get("/api/v1/projects", params={"fields": "title,password,hashed_password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: password, hashed_password"
@@ -0,0 +1,140 @@
+"""POST /projects/import: NDJSON por chunks, errores por línea y rollback por chunk."""
+import asyncio
+import json
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.project import Project
+from app.services import project_import
+from app.services.project_import import aiter_ndjson_chunks
+
+
+def _ndjson(*records) -> bytes:
+    return b"".join(
+        (record if isinstance(record, bytes) else json.dumps(record).encode()) + b"\n"
+        for record in records
+    )
+
+
+def _import(client, body: bytes, chunk_size: int = 500):
+    response = client.post(
+        "/api/v1/projects/import",
+        params={"chunk_size": chunk_size},
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _chunks(parts, chunk_size: int, max_line_bytes: int = project_import.MAX_LINE_BYTES):
+    async def stream():
+        for part in parts:
+            yield part
+
+    async def collect():
+        return [chunk async for chunk in aiter_ndjson_chunks(stream(), chunk_size, max_line_bytes)]
+
+    return asyncio.run(collect())
+
+
+def test_chunker_joins_lines_split_across_parts():
+    parts = [b'{"a":', b' 1}\n{"b"', b": 2}\n\xc3", b"\xb1\n", b"sin-fin"]
+
+    assert _chunks(parts, chunk_size=2) == [
+        [(1, '{"a": 1}'), (2, '{"b": 2}')],
+        [(3, "ñ"), (4, "sin-fin")],
+    ]
+
+
+def test_chunker_drops_overlong_lines():
+    parts = [b"ok\n", b"x" * 6, b"x" * 6, b"\nfin\n", b"y" * 20]
+
+    assert _chunks(parts, chunk_size=10, max_line_bytes=10) == [
+        [(1, "ok"), (2, None), (3, "fin"), (4, None)],
+    ]
+
+
+def test_valid_lines_are_imported_and_errors_sorted_by_line(client, db):
+    body = _ndjson(
+        {"title": "Categoría inexistente", "category": "no-existe"},
+        b"{no es json",
+        {"title": "Importado uno", "category": "telecom-it", "published": True},
+        {"title": "x", "category": "telecom-it"},
+        {"title": "Importado dos", "category": "construccion"},
+    )
+
+    report = _import(client, body, chunk_size=2)
+
+    assert (report["received"], report["created"], report["failed"]) == (5, 2, 3)
+    assert [error["line"] for error in report["errors"]] == [1, 2, 4]
+    assert report["errors"][0]["error"] == "Category 'no-existe' does not exist"
+    assert report["errors"][1]["error"].startswith("Invalid JSON")
+    assert report["errors"][2]["error"].startswith("title:")
+    titles = {title for (title,) in db.query(Project.title)}
+    assert titles == {"Importado uno", "Importado dos"}
+
+
+def test_duplicate_slugs_in_and_across_chunks(client, create_project):
+    create_project("Existente", slug="existente")
+    body = _ndjson(
+        {"title": "Repetido", "category": "telecom-it", "slug": "existente"},
+        {"title": "Nuevo", "category": "telecom-it", "slug": "nuevo"},
+        {"title": "Nuevo otra vez", "category": "telecom-it", "slug": "nuevo"},
+        {"title": "Existente", "category": "telecom-it"},
+    )
+
+    report = _import(client, body)
+
+    assert [(error["line"], error["slug"]) for error in report["errors"]] == [(1, "existente"), (3, "nuevo")]
+    assert report["created"] == 2
+    slugs = client.get("/api/v1/projects", params={"fields": "slug"}).json()
+    assert {item["slug"] for item in slugs} == {"existente", "nuevo", "existente-1"}
+
+
+def test_failed_insert_rolls_back_only_its_chunk(client, db, monkeypatch):
+    insert_chunk = project_import._insert_chunk
+
+    def failing_insert(session, records):
+        insert_chunk(session, records)
+        if any(record.title == "Rompe el chunk" for _, record in records):
+            raise SQLAlchemyError("insert failed")
+
+    monkeypatch.setattr(project_import, "_insert_chunk", failing_insert)
+    body = _ndjson(
+        {"title": "Primer chunk", "category": "telecom-it"},
+        {"title": "Compañero", "category": "telecom-it"},
+        {"title": "Rompe el chunk", "category": "telecom-it"},
+        {"title": "Último chunk", "category": "telecom-it"},
+    )
+
+    report = _import(client, body, chunk_size=2)
+
+    assert report["created"] == 2
+    assert [(error["line"], error["error"]) for error in report["errors"]] == [
+        (3, "insert failed"), (4, "insert failed"),
+    ]
+    titles = {title for (title,) in db.query(Project.title)}
+    assert titles == {"Primer chunk", "Compañero"}
+
+
+def test_overlong_line_is_reported(db):
+    report = project_import.ImportReport()
+    lines = [(1, json.dumps({"title": "Corto", "category": "telecom-it"})), (2, None)]
+
+    project_import.import_chunk(db, lines, report)
+
+    assert report.as_dict() == {
+        "received": 2,
+        "created": 1,
+        "failed": 1,
+        "errors": [{"line": 2, "slug": None, "error": "Line too long"}],
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [0, 5001])
+def test_chunk_size_bounds(client, chunk_size):
+    response = client.post("/api/v1/projects/import", params={"chunk_size": chunk_size}, content=b"")
+
+    assert response.status_code == 422
@@ -0,0 +1,82 @@
+"""Límite de intentos de /auth/login: 429 con Retry-After, recarga y desalojo."""
+import pytest
+
+from app.core.config import settings
+from app.services.login_throttle import BucketRule, MemoryThrottleBackend, ThrottleBackend, login_throttle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _login(client, email: str):
+    return client.post("/api/v1/auth/login", data={"username": email, "password": "incorrecta"})
+
+
+def test_account_limit_returns_429_with_retry_after(client):
+    burst = int(settings.LOGIN_ACCOUNT_BURST)
+    for _ in range(burst):
+        assert _login(client, "victima@sitecel.test").status_code == 401
+
+    response = _login(client, "victima@sitecel.test")
+
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+    # Otra cuenta desde el mismo cliente sigue pudiendo intentar
+    assert _login(client, "otra@sitecel.test").status_code == 401
+
+
+def test_bucket_refills_over_time():
+    clock = FakeClock()
+    backend = MemoryThrottleBackend(clock=clock)
+    rule = BucketRule(capacity=2, per_minute=6)
+
+    assert backend.take("k", rule) == (True, 0.0)
+    assert backend.take("k", rule) == (True, 0.0)
+    allowed, retry_after = backend.take("k", rule)
+    assert not allowed
+    assert retry_after == pytest.approx(10.0)
+
+    clock.now += 10
+    assert backend.take("k", rule)[0]
+    assert not backend.take("k", rule)[0]
+
+
+def test_new_keys_do_not_evict_draining_buckets():
+    clock = FakeClock()
+    backend = MemoryThrottleBackend(max_keys=3, clock=clock)
+    rule = BucketRule(capacity=1, per_minute=1)
+
+    assert backend.take("victima", rule)[0]
+    assert backend.take("a", rule)[0]
+    assert backend.take("b", rule)[0]
+
+    # Tabla llena de buckets activos: la clave nueva se rechaza y la
+    # víctima conserva su límite
+    assert not backend.take("c", rule)[0]
+    assert not backend.take("victima", rule)[0]
+
+    # Un bucket recargado equivale a no tener entrada y se puede desalojar
+    clock.now += 60
+    assert backend.take("d", rule)[0]
+    assert backend.size() <= 3
+
+
+def test_login_throttle_uses_the_configured_backend(client, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(login_throttle, "backend", MemoryThrottleBackend(clock=clock))
+    for _ in range(int(settings.LOGIN_ACCOUNT_BURST)):
+        _login(client, "victima@sitecel.test")
+    assert _login(client, "victima@sitecel.test").status_code == 429
+
+    clock.now += 60 / settings.LOGIN_ACCOUNT_PER_MINUTE
+    assert _login(client, "victima@sitecel.test").status_code == 401
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        ThrottleBackend()
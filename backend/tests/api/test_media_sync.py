@@ -0,0 +1,65 @@
+"""PUT /projects/{id} con media: sólo se escriben las filas que cambian."""
+import pytest
+
+
+@pytest.fixture
+def project(create_project):
+    return create_project(
+        "Proyecto con media",
+        images=[
+            {"url": "https://cdn.test/a.jpg", "alt_text": "A", "display_order": 0},
+            {"url": "https://cdn.test/b.jpg", "alt_text": "B", "display_order": 1},
+            {"url": "https://cdn.test/c.jpg", "alt_text": "C", "display_order": 2},
+        ],
+        videos=[{"video_url": "https://video.test/1", "title": "Uno"}],
+    )
+
+
+def _image_writes(queries):
+    return [
+        statement.split()[0]
+        for statement in queries
+        if "project_images" in statement and not statement.lstrip().startswith("SELECT")
+    ]
+
+
+def test_update_diffs_images(client, project, queries):
+    a, b, _ = project["images"]
+    images = [
+        {"id": a["id"], "url": a["url"], "alt_text": "A editada", "display_order": 0},
+        {"url": b["url"], "alt_text": "B", "display_order": 1},
+        {"url": "https://cdn.test/d.jpg", "alt_text": "D", "display_order": 2},
+    ]
+
+    response = client.put(f"/api/v1/projects/{project['id']}", json={"images": images})
+
+    assert response.status_code == 200
+    updated = {image["url"]: image for image in response.json()["images"]}
+    assert set(updated) == {a["url"], b["url"], "https://cdn.test/d.jpg"}
+    # Las filas que siguen conservan id y created_at
+    assert updated[a["url"]]["id"] == a["id"] and updated[a["url"]]["alt_text"] == "A editada"
+    assert updated[b["url"]]["id"] == b["id"]
+    assert updated[b["url"]]["created_at"] == b["created_at"]
+    # Un DELETE (c), un UPDATE (a; b no cambió) y un INSERT (d)
+    assert sorted(_image_writes(queries)) == ["DELETE", "INSERT", "UPDATE"]
+
+
+def test_unchanged_media_writes_nothing(client, project, queries):
+    images = [{key: image[key] for key in ("id", "url", "alt_text", "display_order")} for image in project["images"]]
+    videos = [{"video_url": video["video_url"], "title": video["title"]} for video in project["videos"]]
+
+    response = client.put(f"/api/v1/projects/{project['id']}", json={"images": images, "videos": videos})
+
+    assert response.status_code == 200
+    assert _image_writes(queries) == []
+    assert not any("project_videos" in q and not q.lstrip().startswith("SELECT") for q in queries)
+    assert response.json()["updated_at"] == project["updated_at"]
+
+
+def test_media_only_change_bumps_updated_at(client, project):
+    videos = [{"video_url": "https://video.test/2", "title": "Dos"}]
+
+    response = client.put(f"/api/v1/projects/{project['id']}", json={"videos": videos})
+
+    assert [video["video_url"] for video in response.json()["videos"]] == ["https://video.test/2"]
+    assert response.json()["updated_at"] != project["updated_at"]
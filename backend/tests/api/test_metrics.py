@@ -0,0 +1,86 @@
+"""/metrics/*: sólo admins, y contadores de los pools de conexiones."""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import pool_metrics
+from app.models.user import User
+
+ENDPOINTS = ["/api/v1/metrics/cache", "/api/v1/metrics/auth", "/api/v1/metrics/pool", "/api/v1/metrics/logs"]
+
+
+def _auth_headers(db, email: str, is_admin: bool) -> dict:
+    db.add(User(email=email, hashed_password="x", full_name=email, is_active=True, is_admin=is_admin))
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+@pytest.fixture
+def admin_headers(db):
+    return _auth_headers(db, "admin@sitecel.test", is_admin=True)
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+def test_metrics_require_a_token(client, url):
+    assert client.get(url).status_code == 401
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+def test_metrics_reject_non_admins(client, db, url):
+    headers = _auth_headers(db, "editor@sitecel.test", is_admin=False)
+
+    assert client.get(url, headers=headers).status_code == 403
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+def test_metrics_for_admins(client, admin_headers, url):
+    assert client.get(url, headers=admin_headers).status_code == 200
+
+
+def _primary(client, headers) -> dict:
+    pools = client.get("/api/v1/metrics/pool", headers=headers).json()["pools"]
+    return next(pool for pool in pools if pool["name"] == "primary")
+
+
+def test_primary_pool_counts_checkouts(client, admin_headers, create_project):
+    before = _primary(client, admin_headers)["checkout_wait_ms"]["count"]
+
+    create_project("Cuenta un checkout")
+
+    stats = _primary(client, admin_headers)
+    assert stats["checkout_wait_ms"]["count"] > before
+    assert sum(stats["checkout_wait_ms"]["buckets"].values()) == stats["checkout_wait_ms"]["count"]
+    assert stats["size"] == settings.DB_POOL_SIZE
+
+
+@pytest.fixture
+def tiny_pool():
+    name = "test-tiny"
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=pool_metrics.instrumented_pool(name, QueuePool),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    pool_metrics.watch_engine(name, engine)
+    yield engine
+    engine.dispose()
+    pool_metrics._registry.pop(name)
+
+
+def test_pool_timeouts_and_usage_are_reported(tiny_pool):
+    held = tiny_pool.connect()
+    with pytest.raises(PoolTimeoutError):
+        tiny_pool.connect()
+
+    stats = next(pool for pool in pool_metrics.pool_stats() if pool["name"] == "test-tiny")
+    held.close()
+
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 1
+    assert stats["checkout_wait_ms"]["count"] == 1
+    assert stats["timeout_seconds"] == 0.01
@@ -0,0 +1,62 @@
+"""Paginación keyset (X-Next-Cursor) de GET /projects."""
+from datetime import date, datetime
+from uuid import UUID
+
+import pytest
+
+from app.models.project import Project
+
+
+@pytest.fixture
+def projects(create_project, db):
+    """12 proyectos con created_at repetidos y start_date con NULLs."""
+    created = [create_project(f"Proyecto {i:02d}") for i in range(12)]
+    for i, item in enumerate(created):
+        db.query(Project).filter(Project.id == UUID(item["id"])).update({
+            # Empates de a tres: el id desempata
+            Project.created_at: datetime(2024, 1, 1 + i // 3),
+            Project.start_date: None if i % 4 == 0 else date(2023, 1 + i % 5, 1),
+        })
+    db.commit()
+    return created
+
+
+def _walk(client, sort: str, limit: int):
+    """Recorrer todas las páginas siguiendo X-Next-Cursor."""
+    ids, params = [], {"sort": sort, "limit": limit}
+    while True:
+        response = client.get("/api/v1/projects", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= limit
+        ids.extend(item["id"] for item in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids
+        params = {"sort": sort, "limit": limit, "cursor": cursor}
+
+
+@pytest.mark.parametrize("sort", ["created_at", "start_date"])
+@pytest.mark.parametrize("limit", [1, 4, 5])
+def test_cursor_pages_match_the_full_listing(client, projects, sort, limit):
+    full = [item["id"] for item in client.get("/api/v1/projects", params={"sort": sort}).json()]
+
+    assert len(full) == len(projects)
+    assert _walk(client, sort, limit) == full
+
+
+def test_start_date_nulls_go_last(client, projects):
+    items = client.get("/api/v1/projects", params={"sort": "start_date"}).json()
+    dates = [item["start_date"] for item in items]
+
+    nulls = dates.index(None)
+    assert all(value is None for value in dates[nulls:])
+    assert dates[:nulls] == sorted(dates[:nulls], reverse=True)
+
+
+def test_cursor_from_another_sort_is_rejected(client, projects):
+    cursor = client.get("/api/v1/projects", params={"limit": 2}).headers["X-Next-Cursor"]
+
+    response = client.get("/api/v1/projects", params={"sort": "start_date", "cursor": cursor})
+
+    assert response.status_code == 400
@@ -0,0 +1,108 @@
+"""bcrypt en su executor acotado: uso desde /auth/login y rechazo con la cola llena."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.api.v1 import auth
+from app.core import password_executor as password_executor_module
+from app.core.password_executor import PasswordExecutor, PasswordExecutorBusy
+from app.core.security import get_password_hash
+from app.models.user import User
+
+EMAIL = "bcrypt@sitecel.test"
+PASSWORD = "clave-segura-123"
+
+
+@pytest.fixture
+def user(db):
+    db.add(User(email=EMAIL, hashed_password=get_password_hash(PASSWORD), full_name="Bcrypt", is_active=True))
+    db.commit()
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = PasswordExecutor(kind="thread", workers=1, queue_limit=0)
+    monkeypatch.setattr(auth, "password_executor", executor)
+    yield executor
+    executor.shutdown()
+
+
+class Occupied:
+    """Ocupa el único worker de `executor` hasta release()."""
+
+    def __init__(self, executor: PasswordExecutor):
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+        def job():
+            self.started.set()
+            self.released.wait(10)
+
+        self.thread = threading.Thread(target=lambda: asyncio.run(executor.run(job)))
+        self.thread.start()
+        assert self.started.wait(10)
+
+    def release(self) -> None:
+        self.released.set()
+        self.thread.join(10)
+
+
+def _login(client):
+    return client.post("/api/v1/auth/login", data={"username": EMAIL, "password": PASSWORD})
+
+
+def test_login_verifies_on_the_bcrypt_pool(client, user, executor, monkeypatch):
+    threads = []
+    verify_password = password_executor_module.verify_password
+
+    def recording_verify(plain, hashed):
+        threads.append(threading.current_thread().name)
+        return verify_password(plain, hashed)
+
+    monkeypatch.setattr(password_executor_module, "verify_password", recording_verify)
+
+    assert _login(client).status_code == 200
+    assert len(threads) == 1 and threads[0].startswith("bcrypt")
+    assert executor.stats()["completed"] == 1
+
+
+def test_saturated_pool_rejects_login_with_503(client, user, executor):
+    occupied = Occupied(executor)
+    try:
+        response = _login(client)
+    finally:
+        occupied.release()
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert executor.stats()["rejected"] == 1
+    # Liberado el worker, el login vuelve a funcionar
+    assert _login(client).status_code == 200
+
+
+def test_queue_limit_admits_waiting_jobs():
+    executor = PasswordExecutor(kind="thread", workers=1, queue_limit=1)
+    occupied = Occupied(executor)
+    try:
+        async def queued_and_rejected():
+            queued = asyncio.ensure_future(executor.run(time.sleep, 0))
+            await asyncio.sleep(0)
+            with pytest.raises(PasswordExecutorBusy):
+                await executor.run(time.sleep, 0)
+            occupied.release()
+            await queued
+
+        asyncio.run(queued_and_rejected())
+    finally:
+        occupied.release()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats["in_flight"], stats["completed"], stats["rejected"]) == (0, 2, 1)
+
+
+def test_unknown_executor_kind_is_rejected():
+    with pytest.raises(ValueError):
+        PasswordExecutor(kind="fiber", workers=1, queue_limit=0)
@@ -0,0 +1,74 @@
+"""Cache token → usuario de get_current_user e invalidación entre procesos."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.principal_cache import PrincipalCache, principal_cache
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+EMAIL = "cacheado@sitecel.test"
+
+
+@pytest.fixture
+def headers(db):
+    db.add(User(email=EMAIL, hashed_password="x", full_name="Cacheado", is_active=True))
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': EMAIL})}"}
+
+
+def _user_lookups(queries):
+    return [statement for statement in queries if "FROM users" in statement]
+
+
+def test_second_request_is_served_from_the_cache(client, headers, queries):
+    assert client.get("/api/v1/auth/me", headers=headers).json()["email"] == EMAIL
+    assert len(_user_lookups(queries)) == 1
+
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert len(_user_lookups(queries)) == 1
+
+
+def test_invalidation_from_another_process_via_the_stamp_file(client, headers, queries):
+    client.get("/api/v1/auth/me", headers=headers)
+
+    # Otra instancia con el mismo archivo (p. ej. otro worker) invalida
+    other = PrincipalCache(max_entries=10, ttl_seconds=60, stamp_file=settings.AUTH_CACHE_STAMP_FILE)
+    other.invalidate_user(EMAIL)
+
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert len(_user_lookups(queries)) == 2
+    assert principal_cache.stats()["invalidations"] >= 1
+
+
+def test_delete_user_script_revokes_cached_tokens(client, headers):
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    result = subprocess.run(
+        [sys.executable, "scripts/delete_user.py"],
+        input=f"{EMAIL}\ns\n",
+        capture_output=True,
+        text=True,
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+        timeout=60,
+    )
+
+    assert f"Usuario {EMAIL} eliminado" in result.stdout, result.stdout + result.stderr
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+
+def test_entries_never_outlive_the_token():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    principal = object()
+
+    cache.set("expirado", principal, token_expires_at=0)
+    cache.set("vigente", principal)
+
+    assert cache.get("expirado") is None
+    assert cache.get("vigente") is principal
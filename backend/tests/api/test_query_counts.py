@@ -0,0 +1,46 @@
+"""
+El número de queries de los GET de proyectos no depende del tamaño de la
+página ni de la media de cada proyecto (sin N+1).
+"""
+import pytest
+
+
+@pytest.fixture
+def projects(create_project):
+    return [
+        create_project(
+            f"Proyecto {i:02d}",
+            images=[{"url": f"https://cdn.test/{i}-{j}.jpg", "display_order": j} for j in range(2)],
+            videos=[{"video_url": f"https://video.test/{i}"}],
+        )
+        for i in range(25)
+    ]
+
+
+# página + imágenes + videos
+LIST_QUERIES = 3
+# versión (ETag) + proyecto + imágenes + videos
+DETAIL_QUERIES = 4
+
+
+@pytest.mark.parametrize("limit", [5, 20])
+def test_list_query_count_does_not_grow_with_page_size(client, projects, queries, limit):
+    response = client.get("/api/v1/projects", params={"limit": limit})
+
+    assert response.status_code == 200
+    items = response.json()
+    assert len(items) == limit
+    assert all(len(item["images"]) == 2 and len(item["videos"]) == 1 for item in items)
+    assert len(queries) == LIST_QUERIES
+
+
+@pytest.mark.parametrize("limit", [5, 20])
+def test_detail_query_count(client, projects, queries, limit):
+    page = client.get("/api/v1/projects", params={"limit": limit}).json()
+    queries.clear()
+
+    response = client.get(f"/api/v1/projects/{page[-1]['id']}")
+
+    assert response.status_code == 200
+    assert len(response.json()["images"]) == 2
+    assert len(queries) == DETAIL_QUERIES
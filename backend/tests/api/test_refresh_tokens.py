@@ -0,0 +1,66 @@
+"""Rotación de refresh tokens: /auth/login, /auth/refresh y /auth/logout."""
+import pytest
+
+from app.core.security import get_password_hash
+from app.models.user import RefreshToken, User
+
+EMAIL = "editor@sitecel.test"
+PASSWORD = "clave-segura-123"
+
+
+@pytest.fixture
+def user(db):
+    user = User(email=EMAIL, hashed_password=get_password_hash(PASSWORD), full_name="Editor", is_active=True)
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def tokens(client, user):
+    response = client.post("/api/v1/auth/login", data={"username": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _refresh(client, refresh_token: str):
+    return client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_refresh_rotates_the_token(client, tokens):
+    response = _refresh(client, tokens["refresh_token"])
+
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+    assert me.json()["email"] == EMAIL
+
+    # El siguiente de la familia sigue siendo canjeable
+    assert _refresh(client, rotated["refresh_token"]).status_code == 200
+
+
+def test_reusing_a_rotated_token_revokes_the_family(client, db, tokens):
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, rotated["refresh_token"]).status_code == 401
+    assert db.query(RefreshToken).filter(RefreshToken.revoked_at.is_(None)).count() == 0
+
+
+def test_logout_revokes_the_session(client, tokens):
+    response = client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 204
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_inactive_user_cannot_refresh(client, db, user, tokens):
+    db.query(User).filter(User.email == EMAIL).update({User.is_active: False})
+    db.commit()
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_unknown_token_is_rejected(client):
+    assert _refresh(client, "no-existe").status_code == 401
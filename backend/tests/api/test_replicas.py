@@ -0,0 +1,52 @@
+"""Lecturas desde réplicas: failover cuando una está caída o saturada."""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.api import deps
+from app.core.config import settings
+from app.db.replicas import Replica, ReplicaRouter
+
+
+@pytest.fixture
+def saturated_engine():
+    """Réplica con el pool agotado: el checkout vence pool_timeout."""
+    engine = create_engine(settings.DATABASE_URL, poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    held = engine.connect()
+    yield engine
+    held.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def healthy_engine():
+    engine = create_engine(settings.DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+def test_reads_fail_over_past_down_and_saturated_replicas(client, create_project, monkeypatch, saturated_engine, healthy_engine):
+    created = create_project("Failover de réplicas")
+    down = Replica("down", create_engine("sqlite:////nonexistent/sitecel/replica.db"))
+    saturated = Replica("saturated", saturated_engine)
+    healthy = Replica("healthy", healthy_engine)
+    monkeypatch.setattr(deps, "replica_router", ReplicaRouter([down, saturated, healthy], retry_seconds=60))
+    # Fuera de la ventana posterior a la escritura, que lee del primario
+    monkeypatch.setattr(settings, "REPLICA_MAX_LAG_SECONDS", 0)
+
+    response = client.get(f"/api/v1/projects/{created['id']}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == created["id"]
+    assert (down.failures, saturated.failures, healthy.failures) == (1, 1, 0)
+    assert not down.healthy and not saturated.healthy
+
+
+def test_reads_use_the_primary_when_every_replica_is_down(client, create_project, monkeypatch, saturated_engine):
+    created = create_project("Sin réplicas sanas")
+    router = ReplicaRouter([Replica("saturated", saturated_engine)], retry_seconds=60)
+    monkeypatch.setattr(deps, "replica_router", router)
+    monkeypatch.setattr(settings, "REPLICA_MAX_LAG_SECONDS", 0)
+
+    assert client.get("/api/v1/projects", params={"category": "telecom-it"}).json()[0]["id"] == created["id"]
+    assert router.replicas[0].failures == 1
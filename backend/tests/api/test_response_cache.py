@@ -0,0 +1,87 @@
+"""Cache en memoria de las lecturas públicas de proyectos."""
+from sqlalchemy import event
+
+from app.db.session import engine
+from app.services.response_cache import LIST_TAG, ResponseCache, project_cache, project_tag
+
+
+def test_published_list_is_served_from_cache(client, create_project, queries):
+    create_project("Proyecto uno")
+    first = client.get("/api/v1/projects", params={"published": True})
+    queries.clear()
+
+    second = client.get("/api/v1/projects", params={"published": True})
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert queries == []
+
+
+def test_writes_invalidate_list_and_detail(client, create_project):
+    project = create_project("Proyecto uno")
+    url = f"/api/v1/projects/{project['id']}"
+    client.get("/api/v1/projects", params={"published": True})
+    client.get(url)
+
+    client.put(url, json={"title": "Proyecto renombrado"})
+
+    assert client.get(url).json()["title"] == "Proyecto renombrado"
+    listing = client.get("/api/v1/projects", params={"published": True}).json()
+    assert [item["title"] for item in listing] == ["Proyecto renombrado"]
+
+    client.delete(url)
+
+    assert client.get(url).status_code == 404
+    assert client.get("/api/v1/projects", params={"published": True}).json() == []
+
+
+def test_read_that_races_an_invalidation_is_not_cached(client, create_project, queries):
+    create_project("Proyecto uno")
+
+    # Una escritura "llega" mientras el GET está leyendo de la DB
+    pending = [True]
+
+    def write_during_read(conn, cursor, statement, parameters, context, executemany):
+        if pending:
+            pending.clear()
+            project_cache.invalidate(LIST_TAG)
+
+    event.listen(engine, "before_cursor_execute", write_during_read)
+    try:
+        assert client.get("/api/v1/projects", params={"published": True}).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", write_during_read)
+    queries.clear()
+
+    client.get("/api/v1/projects", params={"published": True})
+
+    assert queries, "la respuesta leída antes de la invalidación quedó en la cache"
+    assert project_cache.stats()["stale_skips"] == 1
+
+
+def test_set_skips_entries_whose_tags_were_invalidated():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+
+    generation = cache.generation()
+    cache.invalidate(project_tag(1))
+
+    assert cache.set("detail-1", b"{}", {}, tags=[project_tag(1)], generation=generation) is None
+    assert cache.set("detail-2", b"{}", {}, tags=[project_tag(2)], generation=generation) is not None
+
+    generation = cache.generation()
+    cache.clear()
+
+    assert cache.set("detail-2", b"{}", {}, tags=[project_tag(2)], generation=generation) is None
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", b"a", {})
+    cache.set("b", b"b", {})
+    cache.get("a")
+
+    cache.set("c", b"c", {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
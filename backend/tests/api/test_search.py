@@ -0,0 +1,60 @@
+"""
+GET /projects/search con el fallback portable (SQLite): filtro por
+términos, ranking por peso de campo y cursor por relevancia.
+"""
+import pytest
+
+
+@pytest.fixture
+def projects(create_project):
+    return {
+        "title": create_project("Red de fibra troncal", description="Tendido urbano"),
+        "tags": create_project("Enlace metropolitano", tags=["fibra", "backbone"]),
+        "description": create_project("Obra civil norte", description="Canalizacion para fibra"),
+        "description_2": create_project("Obra civil sur", description="Ducto para fibra"),
+        "other": create_project("Torre de telefonia", description="Estructura autosoportada"),
+    }
+
+
+def _search(client, **params):
+    response = client.get("/api/v1/projects/search", params=params)
+    assert response.status_code == 200
+    return response
+
+
+def test_results_are_ranked_by_field_weight(client, projects):
+    ids = [item["id"] for item in _search(client, q="FIBRA").json()]
+
+    assert ids[:2] == [projects["title"]["id"], projects["tags"]["id"]]
+    assert set(ids[2:]) == {projects["description"]["id"], projects["description_2"]["id"]}
+
+
+def test_every_term_must_match(client, projects):
+    ids = [item["id"] for item in _search(client, q="fibra troncal").json()]
+
+    assert ids == [projects["title"]["id"]]
+
+
+def test_no_match_returns_empty_page(client, projects):
+    response = _search(client, q="inexistente")
+
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+def test_cursor_pages_match_the_full_ranking(client, projects, limit):
+    full = [item["id"] for item in _search(client, q="fibra").json()]
+
+    ids, params = [], {"q": "fibra", "limit": limit}
+    while True:
+        response = _search(client, **params)
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"q": "fibra", "limit": limit, "cursor": cursor}
+
+    # Incluye el empate de rank entre las dos descripciones (desempata el id)
+    assert ids == full
+    assert len(full) == 4
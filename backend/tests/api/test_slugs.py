@@ -0,0 +1,68 @@
+"""Slugs de POST /projects: sufijo -N libre y reintento ante el UNIQUE."""
+import pytest
+
+from app.services import slugs
+from app.services.slugs import first_free_slug
+
+
+@pytest.mark.parametrize(
+    ("taken", "expected"),
+    [
+        (set(), "red"),
+        ({"red"}, "red-1"),
+        ({"red", "red-1", "red-3"}, "red-2"),
+        ({"red", "red-troncal", "red-2x"}, "red-1"),
+    ],
+)
+def test_first_free_slug(taken, expected):
+    assert first_free_slug("red", taken) == expected
+
+
+def test_repeated_titles_get_numbered_suffixes(create_project):
+    created = [create_project("Red Troncal Ñuble")["slug"] for _ in range(3)]
+
+    assert created == ["red-troncal-nuble", "red-troncal-nuble-1", "red-troncal-nuble-2"]
+
+
+def test_slugs_sharing_a_prefix_do_not_collide(create_project):
+    create_project("Red troncal")
+
+    assert create_project("Red")["slug"] == "red"
+    assert create_project("Red")["slug"] == "red-1"
+
+
+def test_explicit_slug_that_exists_is_rejected(client, create_project):
+    create_project("Original", slug="mi-slug")
+
+    response = client.post("/api/v1/projects", json={"title": "Copia", "slug": "mi-slug", "category": "telecom-it"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Project with slug 'mi-slug' already exists"
+
+
+def test_retries_when_the_slug_is_taken_concurrently(create_project, monkeypatch):
+    create_project("Carrera")
+    next_free_slug = slugs.next_free_slug
+    calls = []
+
+    def stale_lookup(db, base):
+        # Primer intento: como si otro proceso hubiera insertado entre la
+        # consulta y el INSERT
+        calls.append(base)
+        return base if len(calls) == 1 else next_free_slug(db, base)
+
+    monkeypatch.setattr(slugs, "next_free_slug", stale_lookup)
+
+    assert create_project("Carrera")["slug"] == "carrera-1"
+    assert calls == ["carrera", "carrera"]
+
+
+def test_gives_up_after_max_attempts(client, create_project, monkeypatch):
+    create_project("Ocupado")
+    monkeypatch.setattr(slugs, "next_free_slug", lambda db, base: base)
+
+    response = client.post("/api/v1/projects", json={"title": "Ocupado", "category": "telecom-it"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Project with slug 'ocupado' already exists"
+    assert client.get("/api/v1/projects", params={"fields": "slug"}).json() == [{"slug": "ocupado"}]
@@ -0,0 +1,87 @@
+"""Snapshot del catálogo (/catalog/*): reconstrucción tras escrituras y fallos."""
+import time
+
+import pytest
+
+from app.api import snapshot
+from app.core.config import settings
+
+
+def _wait_idle(timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while snapshot._rebuild_running:
+        assert time.monotonic() < deadline, "el rebuild no terminó"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(snapshot, "RETRY_BASE_SECONDS", 0.2)
+    yield tmp_path
+    _wait_idle()
+    if snapshot._retry_timer is not None:
+        snapshot._retry_timer.cancel()
+    snapshot._failures, snapshot._retry_at, snapshot._loaded = 0, 0.0, None
+
+
+def _titles(client):
+    return [item["title"] for item in client.get("/api/v1/catalog/projects").json()]
+
+
+def test_writes_rebuild_the_snapshot(client, create_project, snapshot_dir):
+    create_project("Proyecto uno")
+    _wait_idle()
+
+    current = snapshot.current_snapshot()
+    assert current is not None
+    response = client.get("/api/v1/catalog/projects", headers={"Accept-Encoding": "identity"})
+    assert response.headers["ETag"] == current.etags[snapshot.CATALOGUE]
+    assert [item["title"] for item in response.json()] == ["Proyecto uno"]
+
+
+def test_failed_rebuild_does_not_leave_the_catalogue_stale(client, create_project, snapshot_dir, monkeypatch):
+    project = create_project("Proyecto uno")
+    _wait_idle()
+    assert _titles(client) == ["Proyecto uno"]
+
+    build = snapshot.build_snapshot
+
+    def broken_build(db):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(snapshot, "build_snapshot", broken_build)
+    client.delete(f"/api/v1/projects/{project['id']}")
+    _wait_idle()
+
+    # El snapshot viejo ya no se sirve: se lee de la DB
+    assert snapshot.current_snapshot() is None
+    assert not (snapshot_dir / snapshot.CURRENT).exists()
+    assert _titles(client) == []
+
+    # El reintento (tras el backoff) vuelve a publicar un snapshot al día
+    monkeypatch.setattr(snapshot, "build_snapshot", build)
+    deadline = time.monotonic() + 5
+    while snapshot.current_snapshot() is None:
+        assert time.monotonic() < deadline, "no se reintentó el build"
+        time.sleep(0.05)
+    _wait_idle()
+    assert snapshot._failures == 0
+    assert _titles(client) == []
+
+
+def test_failed_build_backs_off_requests(client, snapshot_dir, monkeypatch):
+    calls = []
+
+    def broken_build(db):
+        calls.append(1)
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(snapshot, "RETRY_BASE_SECONDS", 60)
+    monkeypatch.setattr(snapshot, "build_snapshot", broken_build)
+
+    for _ in range(5):
+        assert client.get("/api/v1/catalog/projects").status_code == 200
+        _wait_idle()
+
+    assert len(calls) == 1
@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+# La app lee la configuración al importarse: fijarla antes. Por defecto
+# SQLite; TEST_DATABASE_URL apunta a un Postgres descartable para correr
+# también los tests que usan arrays (tags)
+_tmp = tempfile.mkdtemp(prefix="sitecel-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'test.db')}")
+os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ["DATABASE_REPLICA_URLS"] = ""
+os.environ["DATABASE_ASYNC"] = "False"
+os.environ["SNAPSHOT_DIR"] = ""
+os.environ["AUTH_CACHE_STAMP_FILE"] = os.path.join(_tmp, "auth-cache.stamp")
+os.environ["LOG_LEVEL"] = "WARNING"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import JSON, event
+
+from app.db.session import Base, SessionLocal, engine
+from app.models import Category, Project, ProjectImage, ProjectVideo, RefreshToken, User
+from app.services.login_throttle import MemoryThrottleBackend, login_throttle
+from app.services.principal_cache import principal_cache
+from app.services.response_cache import project_cache
+
+# SQLite no tiene ARRAY: tags y highlights se guardan como JSON
+if engine.dialect.name == "sqlite":
+    for _column in ("tags", "highlights"):
+        Project.__table__.c[_column].type = JSON()
+
+Base.metadata.create_all(engine)
+
+from app.main import app  # noqa: E402
+
+CATEGORIES = ["telecom-it", "construccion"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def categories():
+    db = SessionLocal()
+    for order, category_id in enumerate(CATEGORIES):
+        db.add(Category(id=category_id, name=category_id, display_order=order))
+    db.commit()
+    db.close()
+    return CATEGORIES
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Tablas vacías (salvo categorías) y caches en blanco en cada test."""
+    yield
+    db = SessionLocal()
+    for model in (RefreshToken, User, ProjectImage, ProjectVideo, Project):
+        db.query(model).delete()
+    db.commit()
+    db.close()
+    project_cache.clear()
+    principal_cache.clear()
+    login_throttle.backend = MemoryThrottleBackend()
+
+
+@pytest.fixture(scope="session")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def queries():
+    """Sentencias SQL ejecutadas mientras el test corre (before_cursor_execute)."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def create_project(client):
+    """Crear un proyecto vía la API; retorna el JSON de la respuesta."""
+
+    def create(title: str, **fields):
+        payload = {"title": title, "category": CATEGORIES[0], "published": True, **fields}
+        response = client.post("/api/v1/projects", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
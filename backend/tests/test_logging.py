@@ -0,0 +1,95 @@
+"""Logging JSON: formato, redacción, muestreo de DEBUG y cola acotada."""
+import io
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener
+
+import pytest
+
+from app.core import logging as app_logging
+from app.core.logging import DebugSampler, JsonFormatter, _DroppingQueueHandler, parse_levels
+
+
+def _record(level=logging.INFO, msg="hola %s", args=("mundo",), exc_info=None, **extra):
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_line_has_standard_and_extra_fields():
+    entry = json.loads(JsonFormatter().format(_record(client_ip="10.0.0.1", retry_in=5.0)))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["message"] == "hola mundo"
+    assert entry["client_ip"] == "10.0.0.1"
+    assert entry["retry_in"] == 5.0
+    assert entry["ts"].endswith("+00:00")
+    assert "args" not in entry and "lineno" not in entry
+
+
+def test_sensitive_extra_fields_are_redacted():
+    entry = json.loads(JsonFormatter().format(_record(password="secreto", Authorization="Bearer x")))
+
+    assert entry["password"] == "[redacted]"
+    assert entry["Authorization"] == "[redacted]"
+
+
+def test_non_json_values_fall_back_to_str():
+    entry = json.loads(JsonFormatter().format(_record(path=io)))
+
+    assert entry["path"] == str(io)
+
+
+@pytest.mark.parametrize(("draw", "kept"), [(0.05, True), (0.5, False)])
+def test_debug_records_are_sampled(monkeypatch, draw, kept):
+    monkeypatch.setattr(app_logging.random, "random", lambda: draw)
+
+    assert DebugSampler(0.1).filter(_record(level=logging.DEBUG)) is kept
+
+
+def test_info_and_full_rate_are_never_sampled(monkeypatch):
+    monkeypatch.setattr(app_logging.random, "random", lambda: 0.99)
+
+    assert DebugSampler(0.1).filter(_record(level=logging.INFO))
+    assert DebugSampler(1.0).filter(_record(level=logging.DEBUG))
+
+
+def test_parse_levels():
+    assert parse_levels(" app.api.deps=debug, sqlalchemy.engine=INFO,mal ,") == {
+        "app.api.deps": "DEBUG",
+        "sqlalchemy.engine": "INFO",
+    }
+
+
+def test_queue_pipeline_writes_json_with_traceback():
+    handler = _DroppingQueueHandler(queue.Queue())
+    output = io.StringIO()
+    stream = logging.StreamHandler(output)
+    stream.setFormatter(JsonFormatter())
+    listener = QueueListener(handler.queue, stream)
+    listener.start()
+    try:
+        try:
+            raise ValueError("roto")
+        except ValueError:
+            handler.handle(_record(level=logging.ERROR, msg="falló %s", args=("build",), exc_info=sys.exc_info()))
+    finally:
+        listener.stop()
+
+    entry = json.loads(output.getvalue())
+    assert entry["message"] == "falló build"
+    assert "ValueError: roto" in entry["exc"]
+
+
+def test_full_queue_drops_instead_of_blocking(monkeypatch):
+    monkeypatch.setattr(_DroppingQueueHandler, "dropped", 0)
+    handler = _DroppingQueueHandler(queue.Queue(maxsize=1))
+
+    handler.handle(_record())
+    handler.handle(_record())
+
+    assert handler.queue.qsize() == 1
+    assert app_logging.dropped_records() == 1
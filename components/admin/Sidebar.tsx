@@ -1,5 +1,6 @@
 "use client"
 
+import { API_URL } from "@/lib/config"
 import Link from "next/link"
 import { usePathname, useRouter } from "next/navigation"
 
@@ -8,7 +9,17 @@ export default function Sidebar() {
   const router = useRouter()
 
   const handleLogout = () => {
+    // Revocar la sesión en el backend (sin esperar la respuesta)
+    const refreshToken = localStorage.getItem("refresh_token")
+    if (refreshToken) {
+      fetch(`${API_URL}/auth/logout`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ refresh_token: refreshToken })
+      }).catch(() => {})
+    }
     localStorage.removeItem("token")
+    localStorage.removeItem("refresh_token")
     router.push("/admin/login")
   }
 
@@ -31,6 +31,15 @@ export interface ProjectImage {
   display_order: number
 }
 
+export interface Category {
+  id: string
+  name: string
+  description: string | null
+  icon: string | null
+  display_order: number
+  project_count: number
+}
+
 export interface ProjectVideo {
   id: string
   video_url: string
@@ -46,7 +55,7 @@ export interface ProjectVideo {
  */
 export async function getPublishedProjects(): Promise<Project[]> {
   try {
-    const response = await fetch(`${API_BASE_URL}/projects?published=true`, {
+    const response = await fetch(`${API_BASE_URL}/catalog/projects`, {
       next: { revalidate: 3600 } // Revalidar cada hora (3600 segundos)
     })
 
@@ -91,11 +100,22 @@ export async function getProjectsByCategory(category: string): Promise<Project[]
  */
 export async function getProjectBySlug(slug: string): Promise<Project | null> {
   try {
-    // Primero obtener todos los proyectos (porque no tenemos endpoint por slug aún)
-    const projects = await getPublishedProjects()
-    const project = projects.find(p => p.slug === slug)
-    
-    return project || null
+    const response = await fetch(
+      `${API_BASE_URL}/catalog/projects/${encodeURIComponent(slug)}`,
+      {
+        next: { revalidate: 3600 } // Revalidar cada hora
+      }
+    )
+
+    if (response.status === 404) {
+      return null
+    }
+
+    if (!response.ok) {
+      throw new Error('Failed to fetch project')
+    }
+
+    return response.json()
   } catch (error) {
     console.error('Error fetching project:', error)
     return null
@@ -107,9 +127,18 @@ export async function getProjectBySlug(slug: string): Promise<Project | null> {
  */
 export async function getCategories(): Promise<string[]> {
   try {
-    const projects = await getPublishedProjects()
-    const categories = [...new Set(projects.map(p => p.category))]
+    const response = await fetch(`${API_BASE_URL}/catalog/categories`, {
+      next: { revalidate: 3600 } // Revalidar cada hora
+    })
+
+    if (!response.ok) {
+      throw new Error('Failed to fetch categories')
+    }
+
+    const categories: Category[] = await response.json()
     return categories
+      .filter(c => c.project_count > 0)
+      .map(c => c.id)
   } catch (error) {
     console.error('Error fetching categories:', error)
     return []